@@ -1,20 +1,84 @@
 __version__ = "1.1.3"
 
-from .bet_calc import bet_calc  # noqa: F401
-from .bet_prob import bet_prob  # noqa: F401
-from .break_even import break_even  # noqa: F401
-from .clv_calc import clv_calc  # noqa: F401
-from .convert_odds import convert_odds  # noqa: F401
-from .edge_calc import edge_calc  # noqa: F401
-from .expected_value_calc import expected_value_calc  # noqa: F401
-from .fair_odds import fair_odds  # noqa: F401
-from .hold_calc import hold_calc  # noqa: F401
-from .hfa_calc import hfa_calc  # noqa: F401
-from .implied_odds import implied_odds  # noqa: F401
-from .implied_prob import implied_prob  # noqa: F401
-from .kelly_bet import kelly_bet  # noqa: F401
-from .kelly import kelly  # noqa: F401
-from .over_round import over_round  # noqa: F401
-from .parlay_calc import parlay_calc  # noqa: F401
-from .true_implied_prob import true_implied_prob  # noqa: F401
-from .true_probability import true_probability  # noqa: F401
+import importlib
+import sys
+import types
+
+# public name -> submodule defining it, imported on first attribute access so that
+# `import pybettor` does not pay for numpy, scipy or matplotlib up front
+_exports = {
+    "alt_line_ladder": "alt_line_ladder",
+    "asian_handicap": "asian_handicap",
+    "bet_calc": "bet_calc",
+    "bet_prob": "bet_prob",
+    "bet_prob_batch": "bet_prob_batch",
+    "break_even": "break_even",
+    "cache_info": "cache",
+    "clear_cache": "cache",
+    "disable_cache": "cache",
+    "enable_cache": "cache",
+    "clv_calc": "clv_calc",
+    "convert_odds": "convert_odds",
+    "convert_odds_table": "convert_odds",
+    "disable_odds_table": "odds_table",
+    "enable_odds_table": "odds_table",
+    "edge_calc": "edge_calc",
+    "expected_value_calc": "expected_value_calc",
+    "fair_odds": "fair_odds",
+    "hold_calc": "hold_calc",
+    "hfa_calc": "hfa_calc",
+    "implied_odds": "implied_odds",
+    "implied_prob": "implied_prob",
+    "implied_prob_batch": "implied_prob_batch",
+    "kelly_bet": "kelly_bet",
+    "LiveMarket": "live_market",
+    "kelly": "kelly",
+    "kelly_batch": "kelly_batch",
+    "kelly_exclusive": "kelly_exclusive",
+    "kelly_portfolio": "kelly_portfolio",
+    "MarginDistribution": "margin_distribution",
+    "moneyline_to_spread": "spread_moneyline",
+    "Odds": "odds",
+    "over_round": "over_round",
+    "over_under_prob": "over_under",
+    "parlay_calc": "parlay_calc",
+    "parlay_ev": "parlay_ev",
+    "round_robin": "round_robin",
+    "round_robin_parlays": "round_robin",
+    "scoreline_matrix": "scoreline",
+    "sgp_prob": "sgp_prob",
+    "simulate_bankroll": "simulate_bankroll",
+    "soccer_markets": "scoreline",
+    "spread_to_moneyline": "spread_moneyline",
+    "true_implied_prob": "true_implied_prob",
+    "true_probability": "true_probability",
+}
+
+__all__ = list(_exports)
+
+
+def __getattr__(name):
+    if name not in _exports:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+    module = importlib.import_module("." + _exports[name], __name__)
+    value = getattr(module, name)
+    setattr(sys.modules[__name__], name, value)
+
+    return value
+
+
+def __dir__():
+    return sorted(set(globals()) | set(__all__))
+
+
+class _LazyModule(types.ModuleType):
+    def __setattr__(self, name, value):
+        # importing a submodule binds it on the package, which would shadow the function
+        # of the same name, so bind the function instead as the eager imports used to
+        if isinstance(value, types.ModuleType) and _exports.get(name) == name:
+            value = getattr(value, name)
+        super().__setattr__(name, value)
+
+
+sys.modules[__name__].__class__ = _LazyModule
@@ -0,0 +1,153 @@
+from fractions import Fraction
+import numpy as np
+
+# scalar types accepted wherever a number is expected
+_NUMERIC = (int, float, np.integer, np.floating)
+_INTEGER = (int, np.integer)
+
+
+def _is_series(x):
+    # duck typed so that pandas stays an optional dependency
+    return type(x).__name__ == "Series" and type(x).__module__.startswith("pandas")
+
+
+def _is_array(x):
+    """True for numpy arrays and pandas Series."""
+    return isinstance(x, np.ndarray) or _is_series(x)
+
+
+def _values(x):
+    """The numpy array behind a numpy array or pandas Series."""
+    return x.to_numpy() if _is_series(x) else np.asarray(x)
+
+
+def _wrap(values, like):
+    """Return values in the container type of like (numpy array or pandas Series)."""
+    if _is_series(like):
+        return type(like)(values, index=like.index, name=like.name)
+    return values
+
+
+def _output(values, like):
+    """Return the numpy arrays in values in the container type of like.
+
+    Arrays become lists for list or scalar input, stay arrays for numpy input and become Series
+    sharing the index of pandas input. Dictionaries are converted value by value.
+    """
+    if isinstance(values, dict):
+        return {k: _output(v, like) for k, v in values.items()}
+    if not isinstance(values, np.ndarray):
+        return values
+    if _is_array(like):
+        return _wrap(values, like)
+    return values.tolist()
+
+
+def _is_numeric(x):
+    """True for a number, or a numeric numpy array or pandas Series."""
+    if _is_array(x):
+        return _is_numeric_array(_values(x))
+    return isinstance(x, _NUMERIC)
+
+
+def _all_numeric(x):
+    """True for a numeric numpy array or pandas Series, or a sequence of numbers."""
+    if _is_array(x):
+        return _is_numeric_array(_values(x))
+    return all(isinstance(v, _NUMERIC) for v in x)
+
+
+def _first_array(*args):
+    """The first numpy array or pandas Series in args, None if all are scalars."""
+    return next((x for x in args if _is_array(x)), None)
+
+
+def _is_numeric_array(values):
+    return np.issubdtype(values.dtype, np.number) and not np.issubdtype(values.dtype, np.bool_)
+
+
+def _is_whole_array(values):
+    if np.issubdtype(values.dtype, np.integer):
+        return True
+    return _is_numeric_array(values) and bool(np.all(values == np.round(values)))
+
+
+def _round(values, ndigits=0):
+    """Vectorized round() that agrees with the builtin on every element.
+
+    np.round scales before rounding, which can flip values lying within an ulp of a tie. Those
+    rare elements are re-rounded with the builtin.
+    """
+    values = np.asarray(values, dtype=float)
+    rounded = np.round(values, ndigits)
+    scaled = values * 10.0**ndigits
+    with np.errstate(invalid="ignore"):
+        near_tie = np.abs(np.abs(scaled - np.floor(scaled)) - 0.5) < 1e-6
+    for ii in zip(*np.nonzero(near_tie)):
+        rounded[ii] = round(float(values[ii]), ndigits)
+
+    return rounded
+
+
+def _round_int(values):
+    """Vectorized int(round(x)), raising like the builtin on infinite or missing values."""
+    rounded = _round(values)
+    if np.any(np.isinf(rounded)):
+        raise OverflowError("cannot convert float infinity to integer")
+    if np.any(np.isnan(rounded)):
+        raise ValueError("cannot convert float NaN to integer")
+
+    return rounded.astype(np.int64)
+
+
+def _limit_denominator(values, max_denominator=100, chunk_size=4096):
+    """Vectorized Fraction(x).limit_denominator(max_denominator).
+
+    Compares every denominator at once for a chunk of values to find the closest fraction.
+    Elements whose two best distinct candidates are (nearly) equally close are settled with
+    Fraction itself, so ties resolve exactly as before.
+
+    Returns:
+        tuple: numerator and denominator arrays
+    """
+    values = np.asarray(values, dtype=float)
+    flat = values.ravel()
+    num = np.empty(flat.shape, dtype=np.int64)
+    den = np.empty(flat.shape, dtype=np.int64)
+    denominators = np.arange(1, max_denominator + 1, dtype=float)
+    tiny = np.finfo(float).tiny
+
+    near_tie = []
+    for start in range(0, len(flat), chunk_size):
+        chunk = slice(start, start + chunk_size)
+        xx = flat[chunk, None]
+        rows = np.arange(len(xx))
+        scaled = xx * denominators
+        numerators = np.rint(scaled)
+        candidates = numerators / denominators
+        err = np.abs(xx - candidates)
+
+        # the first closest candidate has the smallest denominator, so is already reduced
+        best = np.argmin(err, axis=1)
+        best_err = err[rows, best]
+        num[chunk] = numerators[rows, best]
+        den[chunk] = best + 1
+
+        # halfway between two numerators, the other one is an equally close candidate
+        halfway = np.abs(np.abs(scaled - numerators) - 0.5) < 1e-9
+        next_err = np.where(halfway, err, np.inf).min(axis=1)
+        err[candidates == candidates[rows, best][:, None]] = np.inf
+        next_err = np.minimum(next_err, err.min(axis=1))
+        tie = next_err - best_err <= 1e-9 * np.maximum(best_err, tiny)
+        near_tie.append(start + np.nonzero(tie)[0])
+
+    for ii in np.concatenate(near_tie + [np.zeros(0, dtype=int)]):
+        frac = Fraction(float(flat[ii])).limit_denominator(max_denominator)
+        num[ii], den[ii] = frac.numerator, frac.denominator
+
+    return num.reshape(values.shape), den.reshape(values.shape)
+
+
+def _format_frac(num, den):
+    """'numerator/denominator' strings."""
+    return np.char.add(np.char.add(num.astype(str), "/"), den.astype(str))
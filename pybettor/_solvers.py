@@ -0,0 +1,97 @@
+import numpy as np
+
+
+def _newton_bracketed(
+    func, lower, upper, x0=None, xtol=2e-12, rtol=4 * np.finfo(float).eps, maxiter=100
+):
+    """Safeguarded Halley/Newton root finder for many independent scalar problems.
+
+    Every problem keeps its own bracket [lower, upper]. Halley (or Newton, when no second
+    derivative is given) steps that leave the current bracket fall back to bisection, so each
+    problem converges like brentq while most take higher order steps. Problems drop out of the
+    iteration once they have converged.
+
+    Args:
+        func (callable): func(x, rows) returns the tuple (f, f', f'') evaluated at x for the
+            problems in rows. f'' may be None.
+        lower (array): lower end of each bracket
+        upper (array): upper end of each bracket
+        x0 (array, optional): starting point of each problem. Defaults to the bracket midpoint.
+        xtol (float, optional): absolute tolerance on the root. Defaults to 2e-12.
+        rtol (float, optional): relative tolerance on the root. Defaults to 4 * machine epsilon.
+        maxiter (int, optional): maximum number of iterations. Defaults to 100.
+
+    Returns:
+        tuple: roots, iteration counts and convergence flags.
+            Problems without a sign change over their bracket return a root of nan.
+    """
+    lower, upper = np.broadcast_arrays(
+        np.asarray(lower, dtype=float), np.asarray(upper, dtype=float)
+    )
+    lower, upper = lower.copy(), upper.copy()
+    all_rows = np.arange(len(lower))
+
+    f_lower = func(lower, all_rows)[0]
+    f_upper = func(upper, all_rows)[0]
+    sign_lower = np.sign(f_lower)
+
+    root = np.full(len(lower), np.nan)
+    iterations = np.zeros(len(lower), dtype=int)
+    converged = np.zeros(len(lower), dtype=bool)
+
+    # roots sitting on a bracket end need no iteration
+    for bound, f_bound in ((lower, f_lower), (upper, f_upper)):
+        on_bound = ~converged & (f_bound == 0)
+        root[on_bound] = bound[on_bound]
+        converged |= on_bound
+
+    bracketed = sign_lower * np.sign(f_upper) < 0
+    if x0 is None:
+        xx = (lower + upper) / 2
+    else:
+        xx = np.array(np.broadcast_to(x0, lower.shape), dtype=float)
+        outside = ~((xx >= lower) & (xx <= upper))
+        xx[outside] = ((lower + upper) / 2)[outside]
+
+    active = all_rows[bracketed & ~converged]
+    for _ in range(maxiter):
+        if len(active) == 0:
+            break
+
+        x_prev = xx[active]
+        ff, df, d2f = func(x_prev, active)
+        iterations[active] += 1
+
+        # shrink the bracket around the root
+        same_side = np.sign(ff) == sign_lower[active]
+        lo = np.where(same_side, x_prev, lower[active])
+        hi = np.where(same_side, upper[active], x_prev)
+        lower[active], upper[active] = lo, hi
+
+        with np.errstate(divide="ignore", invalid="ignore"):
+            step = ff / df
+            if d2f is not None:
+                factor = 1 - step * d2f / (2 * df)
+                step = np.where(factor > 0, step / factor, step)
+            x_new = x_prev - step
+
+        outside = ~np.isfinite(x_new) | (x_new <= lo) | (x_new >= hi)
+        x_new = np.where(outside, (lo + hi) / 2, x_new)
+        x_new = np.where(ff == 0, x_prev, x_new)
+
+        tol = xtol + rtol * np.abs(x_new)
+        done = (ff == 0) | (np.abs(x_new - x_prev) <= tol) | (hi - lo <= tol)
+
+        xx[active] = x_new
+        converged[active] = done
+        active = active[~done]
+
+    root[bracketed] = xx[bracketed]
+
+    return root, iterations, converged
+
+
+def _check_bracketed(root):
+    """Raise like brentq when _newton_bracketed found no sign change, for a root or an array of roots."""
+    if np.any(np.isnan(root)):
+        raise ValueError("f(a) and f(b) must have different signs")
@@ -0,0 +1,72 @@
+import numpy as np
+from ._arrays import _NUMERIC, _is_array, _is_numeric_array, _values
+from .bet_prob_batch import _spread_sd
+from .implied_odds import implied_odds
+
+
+def alt_line_ladder(pred_spread, lines=None, sport="NBA", sd=None) -> dict:
+    """Alternate Line Ladder
+    This function prices a ladder of alternate spreads for one or many games, as bet_prob() would
+    price each line. The normal CDF of the final margin is evaluated once per game on the sorted
+    grid of points the lines win and lose at, and every line gathers its probabilities from it.
+
+    Args:
+        pred_spread (float, array-like): predicted spread for the team you want to bet on, for one
+            game or for each game
+        lines (array-like, optional): alternate spreads to price. Defaults to -10.5 to +10.5 in
+            half point steps.
+        sport (str, array-like, optional): sport, for all games or for each game. Defaults to "NBA".
+            Possible values are: "NBA", "NCAAB", "NFL", "NCAAF"
+        sd (float, array-like, optional): standard deviation of the final margin, for all games or
+            for each game, used instead of the standard deviation of sport. Defaults to None.
+
+    Returns:
+        dictionary: the sorted lines, and win_prob, lose_prob, push_prob and fair_odds, the
+            American odds at which the line breaks even, of every line.
+            Values have a row for every game when pred_spread is an array.
+    """
+
+    single_game = isinstance(pred_spread, _NUMERIC)
+    pred_spread = np.atleast_1d(np.asarray(_values(pred_spread) if _is_array(pred_spread) else pred_spread))
+    assert pred_spread.ndim == 1 and _is_numeric_array(pred_spread), "pred_spread must be numeric"
+
+    if lines is None:
+        lines = np.arange(-10.5, 11, 0.5)
+    lines = np.unique(np.asarray(_values(lines) if _is_array(lines) else lines))
+    assert _is_numeric_array(lines), "lines must be numeric"
+    lines = lines.astype(float)
+
+    sd = _spread_sd(sport, sd)
+    pred_spread, sd = np.broadcast_arrays(pred_spread.astype(float), sd)
+
+    # a line wins above line - half_point and loses below line + half_point
+    whole = lines % 1 == 0
+    half_point = np.where(whole, 0.5, 0)
+    points, index = np.unique(np.concatenate([lines - half_point, lines + half_point]), return_inverse=True)
+    index = index.reshape(2, -1)
+
+    from scipy import special
+
+    cdf = special.ndtr((pred_spread[:, None] - points) / sd[:, None])
+    win_prob = 1 - cdf[:, index[0]]
+    lose_prob = cdf[:, index[1]]
+    push_prob = np.where(whole, 1 - win_prob - lose_prob, 0)
+
+    # a push returns the stake, so the line breaks even at the odds of winning a decided bet
+    with np.errstate(invalid="ignore"):
+        decided_prob = win_prob / (win_prob + lose_prob)
+    priced = (decided_prob > 0) & (decided_prob < 1)
+    fair_odds = np.full(decided_prob.shape, np.nan)
+    if np.any(priced):
+        fair_odds[priced] = implied_odds(decided_prob[priced], category="us")
+
+    mydict = {
+        "win_prob": win_prob,
+        "lose_prob": lose_prob,
+        "push_prob": push_prob,
+        "fair_odds": fair_odds,
+    }
+    if single_game:
+        mydict = {key: value[0] for key, value in mydict.items()}
+
+    return {"lines": lines, **mydict}
@@ -0,0 +1,94 @@
+import numpy as np
+from ._arrays import _first_array, _is_array, _is_numeric_array, _values, _wrap
+from .bet_prob_batch import bet_prob_batch
+from .odds import _profit, _valid_odds
+
+
+def _as_column(x):
+    return np.atleast_1d(np.asarray(_values(x) if _is_array(x) else x))
+
+
+def asian_handicap(
+    pred_spread,
+    line,
+    odds=None,
+    category: str = "us",
+    sport="NBA",
+    sd=None,
+    distribution=None,
+    risk: float = 100,
+) -> dict:
+    """Asian Handicap
+    This function calculates the settlement probabilities of Asian handicap bets, including quarter
+    lines, for whole ladders of lines in one call. A quarter line splits the stake over the two
+    lines a quarter away (-0.25 bets half on 0 and half on -0.5), and each half settles as
+    bet_prob() prices it, under the normal margin model of sport or sd, or a MarginDistribution.
+
+    The two halves settle on nested margins, so the lower line can only win when the higher line
+    does and the higher line can only lose when the lower line does.
+
+    Args:
+        pred_spread (float, array-like): predicted spread for the team you want to bet on
+        line (float, array-like): handicap of the team you want to bet on, in quarter points
+        odds (float, array-like, optional): odds of every bet, to calculate its expected value.
+            Defaults to None.
+        category (str, optional): type of odds. Defaults to "us". \n
+            'us', American Odds \n
+            'dec', Decimal Odds \n
+            'frac', Fractional Odds
+        sport (str, array-like, optional): sport, for all bets or for each bet. Defaults to "NBA".
+            Possible values are: "NBA", "NCAAB", "NFL", "NCAAF"
+        sd (float, array-like, optional): standard deviation of the final margin, used instead of
+            the standard deviation of sport. Defaults to None.
+        distribution (MarginDistribution, optional): discrete margin distribution used instead of
+            the normal distribution. Defaults to None.
+        risk (float, optional): Size of the bet. Defaults to 100.
+
+    Returns:
+        dictionary: full_win_prob, half_win_prob, push_prob, half_loss_prob and full_loss_prob,
+            and ev, the expected value of the bet as expected_value_calc() calculates it, when odds
+            are given.
+            pandas Series inputs give Series with the index of the first Series.
+    """
+
+    like = _first_array(pred_spread, line, odds)
+    line = _as_column(line)
+    assert _is_numeric_array(line), "line must be numeric"
+    assert np.all(line * 4 % 1 == 0), "line must be in quarter points"
+    assert risk > 0, "risk must be greater than 0"
+
+    # a quarter line bets half of the stake on each of its neighbouring lines
+    quarter = line * 4 % 2 == 1
+    lower = bet_prob_batch(pred_spread, np.where(quarter, line - 0.25, line), sport, sd, distribution)
+    higher = bet_prob_batch(pred_spread, np.where(quarter, line + 0.25, line), sport, sd, distribution)
+    lower, higher = ({key: _values(value) for key, value in half.items()} for half in (lower, higher))
+
+    full_win_prob = lower["win_prob"]
+    half_win_prob = np.maximum(higher["win_prob"] - lower["win_prob"], 0)
+    full_loss_prob = higher["lose_prob"]
+    half_loss_prob = np.maximum(lower["lose_prob"] - higher["lose_prob"], 0)
+    push_prob = np.maximum(1 - full_win_prob - half_win_prob - half_loss_prob - full_loss_prob, 0)
+
+    mydict = {
+        "full_win_prob": _wrap(full_win_prob, like),
+        "half_win_prob": _wrap(half_win_prob, like),
+        "push_prob": _wrap(push_prob, like),
+        "half_loss_prob": _wrap(half_loss_prob, like),
+        "full_loss_prob": _wrap(full_loss_prob, like),
+    }
+
+    if odds is not None:
+        odds = _as_column(odds)
+        assert _is_numeric_array(odds), "odds must be numeric"
+        assert category in [
+            "us",
+            "frac",
+            "dec",
+        ], "category must be either: ('us', 'dec', 'frac')"
+        assert np.all(_valid_odds(odds, category)), f"odds must be valid {category} odds"
+        profit = _profit(odds.astype(float), category)
+        win = full_win_prob + half_win_prob / 2
+        loss = full_loss_prob + half_loss_prob / 2
+        mydict["ev"] = _wrap(win * risk * profit - loss * risk, like)
+
+    return mydict
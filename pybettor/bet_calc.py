@@ -1,3 +1,4 @@
+from ._arrays import _first_array, _is_array, _is_numeric, _round, _values, _wrap
 from .convert_odds import convert_odds
 
 
@@ -6,8 +7,8 @@ def bet_calc(risk: int or float, odds: int or float, category: str = "us") -> fl
     This function calculates the payout for a given bet.
 
     Args:
-        risk (int, float): Unit size of your bankroll, typically 1% of bankroll (100)
-        odds (int, float): Odds or Implied Win Probability for the bet
+        risk (int, float, numpy array, pandas Series): Unit size of your bankroll, typically 1% of bankroll (100)
+        odds (int, float, numpy array, pandas Series): Odds or Implied Win Probability for the bet
         category (str, optional): type of odds. Defaults to "us". \n
             'us', American Odds \n
             'dec', Decimal Odds \n
@@ -15,11 +16,12 @@ def bet_calc(risk: int or float, odds: int or float, category: str = "us") -> fl
             'prob', Implied Probability
 
     Returns:
-        float: Payout of a bet
+        float: Payout of a bet.
+            Array inputs give an array of payouts, in the container type of the first array input.
     """
 
-    assert isinstance(risk, (int, float)), "risk must be numeric"
-    assert isinstance(odds, (int, float)), "odds must be numeric"
+    assert _is_numeric(risk), "risk must be numeric"
+    assert _is_numeric(odds), "odds must be numeric"
     assert category in [
         "us",
         "frac",
@@ -29,9 +31,15 @@ def bet_calc(risk: int or float, odds: int or float, category: str = "us") -> fl
 
     if category == "dec":
         pass
+    elif _is_array(odds):
+        odds = convert_odds(odds, cat_in=category, cat_out="dec")
     else:
         odds = convert_odds(odds, cat_in=category, cat_out="dec")[0]
 
+    like = _first_array(risk, odds)
+    if like is not None:
+        return _wrap(_round(_values(risk) * _values(odds), 2), like)
+
     bets = {"odds": odds, "risk": risk}
     payout = round(bets["risk"] * bets["odds"], 2)
 
@@ -1,10 +1,29 @@
-import scipy.stats as stats
-import matplotlib.pyplot as plt
 import numpy as np
+from ._arrays import _NUMERIC
+
+# standard deviation of the final margin around the spread of each sport
+_SPORT_SD = {"NBA": 12, "NCAAB": 10, "NFL": 13.86, "NCAAF": 16}
+
+
+def _spread_probs(pred_spread, spread, sd):
+    """Win, lose and push probabilities of arrays of spreads.
+
+    Whole number spreads can push, so their win and lose margins are half a point away from the
+    prediction. Half point spreads cannot push.
+    """
+    from scipy import special
+
+    whole = spread % 1 == 0
+    half_point = np.where(whole, 0.5, 0)
+    win_prob = 1 - special.ndtr((pred_spread + half_point - spread) / sd)
+    lose_prob = special.ndtr((pred_spread - half_point - spread) / sd)
+    push_prob = np.where(whole, 1 - win_prob - lose_prob, 0)
+
+    return win_prob, lose_prob, push_prob
 
 
 def bet_prob(
-    pred_spread: float, spread: float, sport: str = "NBA", plot=False
+    pred_spread: float, spread: float, sport: str = "NBA", plot=False, distribution=None
 ) -> dict or tuple:
     """Calculates the probability of winning, losing, and pushing a bet based on the predicted spread and actual spread.
     Plots normal distribution curve and area under curve for spread sides if plot=True
@@ -31,38 +50,28 @@ def bet_prob(
         pred_spread (float): predicted spread for the team you want to bet on
         spread (float): actual spread for the team you want to bet on
         sport (str, optional): sport. Defaults to "NBA". Possible values are: "NBA", "NCAAB", "NFL", "NCAAF"
+        distribution (MarginDistribution, optional): discrete margin distribution used instead of
+            the normal distribution of sport, such as an empirical one, in which case sport is not
+            used. pred_spread selects the table of its bucket, or interpolates between the tables
+            at the nearest pred_spreads, so the result is as exact as the tables. Defaults to None.
 
     Returns:
         dict: dictionary of probabilities
         fig: matplotlib figure if plot=True
     """
 
-    assert isinstance(pred_spread, (int, float)), "pred_spread must be numeric"
-    assert isinstance(spread, (int, float)), "spread must be numeric"
-    assert sport in [
-        "NBA",
-        "NCAAB",
-        "NFL",
-        "NCAAF",
-    ], "sport must be either: ('NBA', 'NCAAB', 'NFL', 'NCAAF')"
-
-    if sport == "NBA":
-        sd = 12
-    elif sport == "NCAAB":
-        sd = 10
-    elif sport == "NFL":
-        sd = 13.86
-    elif sport == "NCAAF":
-        sd = 16
-
-    if spread % 1 == 0:
-        win_prob = 1 - stats.norm.cdf(pred_spread + 0.5, loc=spread, scale=sd)
-        lose_prob = stats.norm.cdf(pred_spread - 0.5, loc=spread, scale=sd)
-        push_prob = 1 - win_prob - lose_prob
-    else:
-        win_prob = 1 - stats.norm.cdf(pred_spread, loc=spread, scale=sd)
-        lose_prob = stats.norm.cdf(pred_spread, loc=spread, scale=sd)
-        push_prob = 0
+    assert isinstance(pred_spread, _NUMERIC), "pred_spread must be numeric"
+    assert isinstance(spread, _NUMERIC), "spread must be numeric"
+    if distribution is not None:
+        assert not plot, "plot shows the normal distribution, it cannot be used with distribution"
+        return distribution.bet_prob(pred_spread, spread)
+
+    assert sport in _SPORT_SD, "sport must be either: ('NBA', 'NCAAB', 'NFL', 'NCAAF')"
+    sd = _SPORT_SD[sport]
+
+    win_prob, lose_prob, push_prob = (
+        x[()] for x in _spread_probs(np.float64(pred_spread), np.float64(spread), sd)
+    )
 
     mydict = {
         "win_prob": win_prob,
@@ -71,6 +80,9 @@ def bet_prob(
     }
 
     if plot:
+        import matplotlib.pyplot as plt
+        import scipy.stats as stats
+
         # edge = abs(spread - pred_spread)
 
         # Create the figure and axes
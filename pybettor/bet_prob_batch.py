@@ -0,0 +1,64 @@
+import numpy as np
+from ._arrays import _first_array, _is_array, _is_numeric_array, _values, _wrap
+from .bet_prob import _SPORT_SD, _spread_probs
+
+
+def _as_column(x):
+    return np.asarray(_values(x) if _is_array(x) else x)
+
+
+def _spread_sd(sport, sd):
+    """Standard deviation of the final margin of every bet, from sd or else from sport."""
+    if sd is None:
+        sport = np.atleast_1d(_as_column(sport))
+        sd = np.full(sport.shape, np.nan)
+        for name, sport_sd in _SPORT_SD.items():
+            sd[sport == name] = sport_sd
+        assert not np.any(np.isnan(sd)), "sport must be either: ('NBA', 'NCAAB', 'NFL', 'NCAAF')"
+        return sd
+
+    sd = np.atleast_1d(_as_column(sd))
+    assert _is_numeric_array(sd), "sd must be numeric"
+    assert np.all(sd > 0), "sd must be greater than 0"
+    return sd.astype(float)
+
+
+def bet_prob_batch(pred_spread, spread, sport="NBA", sd=None, distribution=None) -> dict:
+    """Batch Bet Probability
+    This function calculates the probability of winning, losing, and pushing many spread bets in a
+    single call, as bet_prob() would for each of them. Whole number and half point spreads are
+    handled in the same pass.
+
+    Args:
+        pred_spread (array-like): predicted spread for the team you want to bet on
+        spread (array-like): actual spread for the team you want to bet on
+        sport (str, array-like, optional): sport, for all bets or for each bet. Defaults to "NBA".
+            Possible values are: "NBA", "NCAAB", "NFL", "NCAAF"
+        sd (float, array-like, optional): standard deviation of the final margin, for all bets or
+            for each bet, used instead of the standard deviation of sport. Defaults to None.
+        distribution (MarginDistribution, optional): discrete margin distribution used instead of
+            the normal distribution, such as an empirical one. Defaults to None.
+
+    Returns:
+        dictionary: win_prob, lose_prob and push_prob arrays.
+            pandas Series inputs give Series with the index of the first Series.
+    """
+
+    like = _first_array(pred_spread, spread, sport, sd)
+    pred_spread, spread = (np.atleast_1d(_as_column(x)) for x in (pred_spread, spread))
+    assert _is_numeric_array(pred_spread), "pred_spread must be numeric"
+    assert _is_numeric_array(spread), "spread must be numeric"
+
+    if distribution is not None:
+        probs = distribution.bet_prob(pred_spread, spread)
+        return {key: _wrap(value, like) for key, value in probs.items()}
+
+    sd = _spread_sd(sport, sd)
+    pred_spread, spread, sd = np.broadcast_arrays(pred_spread.astype(float), spread.astype(float), sd)
+    win_prob, lose_prob, push_prob = _spread_probs(pred_spread, spread, sd)
+
+    return {
+        "win_prob": _wrap(win_prob, like),
+        "lose_prob": _wrap(lose_prob, like),
+        "push_prob": _wrap(push_prob, like),
+    }
@@ -1,17 +1,25 @@
+from ._arrays import _INTEGER, _first_array, _is_numeric, _values, _wrap
+
+
 def break_even(risk: float or int, rtrn: float or int, legs: int = 1) -> float:
     """Calculate the break even win percentage needed based on the amount risked and the amount returned.
 
     Args:
-        risk (float or int): amount risked on the bet
-        rtrn (float or int): amount returned on the bet
+        risk (float or int, numpy array, pandas Series): amount risked on the bet
+        rtrn (float or int, numpy array, pandas Series): amount returned on the bet
         legs (int, optional): number of legs in the bet. Defaults to 1.
 
     Returns:
-        float: break even win percentage needed
+        float: break even win percentage needed.
+            Array inputs give an array, in the container type of the first array input.
     """
-    assert isinstance(risk, (int, float)), "risk must be numeric"
-    assert isinstance(rtrn, (int, float)), "rtrn must be numeric"
-    assert isinstance(legs, int), "legs must be an integer"
+    assert _is_numeric(risk), "risk must be numeric"
+    assert _is_numeric(rtrn), "rtrn must be numeric"
+    assert isinstance(legs, _INTEGER), "legs must be an integer"
+
+    like = _first_array(risk, rtrn)
+    if like is not None:
+        return _wrap((_values(risk) / _values(rtrn)) ** (1 / legs), like)
 
     prob = (risk / rtrn) ** (1 / legs)
 
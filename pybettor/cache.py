@@ -0,0 +1,144 @@
+from collections import OrderedDict
+import functools
+import inspect
+import threading
+import numpy as np
+
+
+class _LRUCache:
+    def __init__(self):
+        self.enabled = False
+        self.maxsize = 0
+        self.hits = 0
+        self.misses = 0
+        self._data = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, key):
+        with self._lock:
+            try:
+                value = self._data[key]
+            except KeyError:
+                self.misses += 1
+                raise
+            self._data.move_to_end(key)
+            self.hits += 1
+        return value
+
+    def put(self, key, value):
+        with self._lock:
+            self._data[key] = value
+            self._data.move_to_end(key)
+            while len(self._data) > self.maxsize:
+                self._data.popitem(last=False)
+
+    def clear(self):
+        with self._lock:
+            self._data.clear()
+            self.hits = 0
+            self.misses = 0
+
+
+_cache = _LRUCache()
+
+
+def enable_cache(maxsize: int = 1024) -> None:
+    """Enable Result Cache
+    Memoizes implied_prob(), implied_odds() and convert_odds() in a bounded cache with least
+    recently used eviction. Results are keyed on the odds, category, method and method parameters
+    of each call. Every call receives its own copy of the cached result, so callers cannot modify
+    the cache.
+
+    Args:
+        maxsize (int, optional): maximum number of cached results. Defaults to 1024.
+    """
+
+    assert isinstance(maxsize, int), "maxsize must be an integer"
+    assert maxsize > 0, "maxsize must be greater than 0"
+
+    with _cache._lock:
+        _cache.enabled = True
+        _cache.maxsize = maxsize
+        while len(_cache._data) > maxsize:
+            _cache._data.popitem(last=False)
+
+
+def disable_cache() -> None:
+    """Disable Result Cache
+    Stops memoizing results and empties the cache.
+    """
+
+    _cache.enabled = False
+    _cache.clear()
+
+
+def clear_cache() -> None:
+    """Clear Result Cache
+    Empties the cache and resets its hit and miss counters.
+    """
+
+    _cache.clear()
+
+
+def cache_info() -> dict:
+    """Result Cache Statistics
+
+    Returns:
+        dict: enabled, hits, misses, maxsize and currsize of the cache
+    """
+
+    return {
+        "enabled": _cache.enabled,
+        "hits": _cache.hits,
+        "misses": _cache.misses,
+        "maxsize": _cache.maxsize,
+        "currsize": len(_cache._data),
+    }
+
+
+def _freeze(value):
+    # types are part of the key, as -110 and -110.0 are not interchangeable odds
+    if isinstance(value, (list, tuple)):
+        return (type(value), tuple(_freeze(x) for x in value))
+    hash(value)
+    return (type(value), value)
+
+
+def _copy(value):
+    if isinstance(value, dict):
+        return {k: _copy(v) for k, v in value.items()}
+    elif isinstance(value, list):
+        return [_copy(x) for x in value]
+    elif isinstance(value, np.ndarray):
+        return value.copy()
+    return value
+
+
+def _memoize(func):
+    """Cache the results of func while the cache is enabled."""
+    signature = inspect.signature(func)
+
+    @functools.wraps(func)
+    def wrapper(*args, **kwargs):
+        if not _cache.enabled:
+            return func(*args, **kwargs)
+
+        bound = signature.bind(*args, **kwargs)
+        bound.apply_defaults()
+        try:
+            key = (func.__name__,) + tuple(_freeze(x) for x in bound.arguments.values())
+        except TypeError:
+            # unhashable arguments are never cached
+            return func(*args, **kwargs)
+
+        try:
+            return _copy(_cache.get(key))
+        except KeyError:
+            pass
+
+        result = func(*args, **kwargs)
+        _cache.put(key, _copy(result))
+
+        return result
+
+    return wrapper
@@ -1,3 +1,4 @@
+from ._arrays import _first_array, _is_array, _is_numeric, _values, _wrap
 from .implied_prob import implied_prob
 
 
@@ -8,25 +9,36 @@ def clv_calc(
     This function calculates the closing line value (CLV) for a given bet.
 
     Args:
-        bet_odds (int, float): Odds or Implied Win Probability for the bet
-        close_odds (int, float): Closing Odds or Implied Win Probability for the bet
+        bet_odds (int, float, numpy array, pandas Series): Odds or Implied Win Probability for the bet
+        close_odds (int, float, numpy array, pandas Series): Closing Odds or Implied Win Probability for the bet
         category (str, optional): type of odds. Defaults to "us". \n
             'us', American Odds \n
             'dec', Decimal Odds \n
             'frac', Fractional Odds
 
     Returns:
-        float: Closing Line Value (CLV) of a bet
+        float: Closing Line Value (CLV) of a bet.
+            Array inputs give an array of CLVs, in the container type of the first array input.
     """
 
-    assert isinstance(bet_odds, (int, float)), "bet_odds must be numeric"
-    assert isinstance(close_odds, (int, float)), "close_odds must be numeric"
+    assert _is_numeric(bet_odds), "bet_odds must be numeric"
+    assert _is_numeric(close_odds), "close_odds must be numeric"
     assert category in [
         "us",
         "frac",
         "dec",
     ], "input category must be either: ('us', 'dec', 'frac')"
 
+    like = _first_array(bet_odds, close_odds)
+    if like is not None:
+        bet_prob, close_prob = (
+            _values(implied_prob(x, category=category))
+            if _is_array(x)
+            else implied_prob(x, category=category)[0]
+            for x in (bet_odds, close_odds)
+        )
+        return _wrap((close_prob - bet_prob) / bet_prob, like)
+
     bet_prob = implied_prob(bet_odds, category=category)[0]
     close_prob = implied_prob(close_odds, category=category)[0]
 
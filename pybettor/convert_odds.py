@@ -1,50 +1,167 @@
 from typing import Union
-from fractions import Fraction
+import numpy as np
+from ._arrays import (
+    _NUMERIC,
+    _format_frac,
+    _is_array,
+    _is_numeric_array,
+    _is_series,
+    _limit_denominator,
+    _output,
+    _round,
+    _round_int,
+    _values,
+)
 from .implied_odds import implied_odds
 from .implied_prob import implied_prob
+from .implied_prob_batch import _validate_batch
+from .cache import _memoize
+from .odds_table import _lookup_us_odds
+
+_TABLE_DTYPE = np.dtype(
+    [
+        ("american", np.int64),
+        ("decimal", np.float64),
+        ("frac_num", np.int64),
+        ("frac_den", np.int64),
+        ("prob", np.float64),
+    ]
+)
+
+# rows converted at a time, bounds the temporaries of the fraction search
+_CHUNK_SIZE = 2**18
 
 
 def _convert_dec_to_us_odds(odds):
-    new_odds = [(x - 1) * 100 if x >= 2 else -100 / (x - 1) for x in odds]
-    new_odds = [round(x) for x in new_odds]
-    return new_odds
+    new_odds = np.where(odds >= 2, (odds - 1) * 100, -100 / (odds - 1))
+    return _round_int(new_odds)
 
 
 def _convert_frac_to_us_odds(odds):
-    new_odds = [x * 100 if x >= 1 else -100 / x for x in odds]
-    new_odds = [round(x) for x in new_odds]
-    return new_odds
+    new_odds = np.where(odds >= 1, odds * 100, -100 / odds)
+    return _round_int(new_odds)
 
 
 def _convert_us_to_dec(odds):
-    new_odds = [-100 / x + 1 if x <= -100 else x / 100 + 1 for x in odds]
-    new_odds = [round(x, 4) for x in new_odds]
-    return new_odds
+    def compute(odds):
+        new_odds = np.where(odds <= -100, -100 / odds + 1, odds / 100 + 1)
+        return _round(new_odds, 4)
+
+    return _lookup_us_odds(odds, "decimal", compute)
 
 
 def _convert_us_to_frac(odds):
-    new_odds = [-100 / x if x <= -100 else x / 100 for x in odds]
-    new_odds = [Fraction(x).limit_denominator(100) for x in new_odds]
-    new_odds = [str(x.numerator) + "/" + str(x.denominator) for x in new_odds]
-    return new_odds
+    def compute(odds):
+        new_odds = np.where(odds <= -100, -100 / odds, odds / 100)
+        return _limit_denominator(new_odds)
+
+    return _format_frac(*_lookup_us_odds(odds, ("frac_num", "frac_den"), compute))
 
 
 def _convert_dec_to_frac(odds):
-    new_odds = [Fraction(x - 1).limit_denominator(100) for x in odds]
-    new_odds = [str(x.numerator) + "/" + str(x.denominator) for x in new_odds]
-    return new_odds
+    return _format_frac(*_limit_denominator(odds - 1))
 
 
 def _convert_frac_to_dec(odds):
-    return [round(x + 1, 4) for x in odds]
+    return _round(odds + 1, 4)
 
 
 def _convert_frac_to_frac(odds):
-    frac = [Fraction(x).limit_denominator(100) for x in odds]
-    frac = [str(x.numerator) + "/" + str(x.denominator) for x in frac]
-    return frac
+    return _format_frac(*_limit_denominator(odds))
+
+
+def _convert_all_chunk(odds, cat_in, table):
+    if cat_in == "us":
+        profit = np.where(odds <= -100, -100 / odds, odds / 100)
+        table["american"] = odds
+        table["decimal"] = _round(profit + 1, 4)
+        table["prob"] = 1 / (1 + profit)
+    elif cat_in == "dec":
+        profit = odds - 1
+        table["american"] = _round_int(np.where(odds >= 2, profit * 100, -100 / profit))
+        table["decimal"] = odds
+        table["prob"] = 1 / odds
+    elif cat_in == "frac":
+        profit = odds
+        table["american"] = _round_int(np.where(odds >= 1, odds * 100, -100 / odds))
+        table["decimal"] = _round(odds + 1, 4)
+        table["prob"] = 1 / (1 + odds)
+    elif cat_in == "prob":
+        profit = (1.0 / odds) - 1.0
+        table["american"] = _round_int(
+            np.where(odds > 0.5, odds / (1 - odds) * -100, (1 - odds) / odds * 100)
+        )
+        table["decimal"] = _round(1 / odds, 2)
+        table["prob"] = odds
+
+    table["frac_num"], table["frac_den"] = _limit_denominator(profit)
+
+
+def _convert_all(odds, cat_in):
+    """Every odds type of odds in one pass, as convert_odds(cat_out="all") gives them.
+
+    Each distinct price is converted once, as odds histories repeat a small set of prices.
+
+    Returns:
+        tuple: table of the distinct prices, and the row of the table for every element of odds
+    """
+    if cat_in == "prob":
+        assert np.all((odds > 0) & (odds < 1)), "probability must be between 0 and 1"
+    else:
+        with np.errstate(invalid="ignore"):
+            _validate_batch(odds, np.ones(odds.shape, dtype=bool), cat_in)
+
+    unique, inverse = np.unique(odds, return_inverse=True)
+    table = np.empty(len(unique), dtype=_TABLE_DTYPE)
+    with np.errstate(divide="ignore"):
+        for start in range(0, len(unique), _CHUNK_SIZE):
+            chunk = slice(start, start + _CHUNK_SIZE)
+            _convert_all_chunk(unique[chunk], cat_in, table[chunk])
 
+    return table, inverse.reshape(odds.shape)
 
+
+def convert_odds_table(odds, cat_in: str = "us"):
+    """Odds Conversion Table
+    Converts odds to every odds type in a single pass, for converting long odds histories.
+    Conversions match convert_odds(cat_out="all"), with fractions kept as integer numerator and
+    denominator columns instead of strings.
+
+    Args:
+        odds (int, float, list, numpy array, pandas Series): Odds, or lines, for a given bet(s) (-115, -105)
+        cat_in (str, optional): type of odds. Defaults to "us". \n
+            'us', American Odds \n
+            'dec', Decimal Odds \n
+            'frac', Fractional Odds \n
+            'prob', Implied Probability
+
+    Returns:
+        numpy structured array: fields american, decimal, frac_num, frac_den and prob.
+            pandas Series odds return a pandas DataFrame with the index of the odds.
+    """
+
+    assert isinstance(odds, _NUMERIC + (list,)) or _is_array(odds), "odds must be numeric"
+    assert cat_in in [
+        "us",
+        "dec",
+        "frac",
+        "prob",
+    ], "input category must be one of ('us', 'dec', 'frac', 'prob')"
+
+    values = _values(odds) if _is_array(odds) else np.array(odds, ndmin=1)
+    assert _is_numeric_array(values), "odds must be numeric"
+
+    table, inverse = _convert_all(values.astype(float), cat_in)
+    table = table[inverse]
+    if _is_series(odds):
+        import pandas as pd
+
+        return pd.DataFrame(table, index=odds.index)
+
+    return table
+
+
+@_memoize
 def convert_odds(
     odds: Union[int, float, list], cat_in="us", cat_out="all"
 ) -> list or dict:
@@ -52,7 +169,7 @@ def convert_odds(
     This function converts any odds or probability.
 
     Args:
-        odds (int, float, list): Odds, or lines, for a given bet(s) (-115, -105)
+        odds (int, float, list, numpy array, pandas Series): Odds, or lines, for a given bet(s) (-115, -105)
         cat_in (str, optional):  \n
             'us', American Odds \n
             'dec', Decimal Odds \n
@@ -65,11 +182,12 @@ def convert_odds(
             'prob', Implied Probability
 
     Returns:
-        list or dictionary: Converted Odds
+        list or dictionary: Converted Odds.
+            numpy array and pandas Series odds are converted to the same container type.
     """
     categories = ["us", "dec", "frac", "prob"]
 
-    assert isinstance(odds, (int, float, list)), "odds must be numeric"
+    assert isinstance(odds, _NUMERIC + (list,)) or _is_array(odds), "odds must be numeric"
     assert (
         cat_in in categories
     ), "input category must be one of ('us', 'dec', 'frac', 'prob')"
@@ -78,21 +196,29 @@ def convert_odds(
     ], "output category must be one of ('all', 'us', 'dec', 'frac', 'prob')"
     assert cat_in != cat_out, "input and output categories must be different"
 
-    if not isinstance(odds, list):
-        odds = [odds]
+    if _is_array(odds):
+        values = _values(odds)
+        assert _is_numeric_array(values), "odds must be numeric"
+    else:
+        if not isinstance(odds, list):
+            odds = [odds]
+        values = np.array(odds)
+
+    def convert(func):
+        return lambda x: _output(func(values), odds)
 
     conversions = {
         ("us", "us"): lambda x: odds,
-        ("us", "dec"): _convert_us_to_dec,
-        ("us", "frac"): _convert_us_to_frac,
+        ("us", "dec"): convert(_convert_us_to_dec),
+        ("us", "frac"): convert(_convert_us_to_frac),
         ("us", "prob"): lambda odds: implied_prob(odds, category="us"),
         ("dec", "dec"): lambda x: odds,
-        ("dec", "us"): _convert_dec_to_us_odds,
-        ("dec", "frac"): _convert_dec_to_frac,
+        ("dec", "us"): convert(_convert_dec_to_us_odds),
+        ("dec", "frac"): convert(_convert_dec_to_frac),
         ("dec", "prob"): lambda odds: implied_prob(odds, category="dec"),
-        ("frac", "frac"): _convert_frac_to_frac,
-        ("frac", "us"): _convert_frac_to_us_odds,
-        ("frac", "dec"): _convert_frac_to_dec,
+        ("frac", "frac"): convert(_convert_frac_to_frac),
+        ("frac", "us"): convert(_convert_frac_to_us_odds),
+        ("frac", "dec"): convert(_convert_frac_to_dec),
         ("frac", "prob"): lambda odds: implied_prob(odds, category="frac"),
         ("prob", "prob"): lambda x: odds,
         ("prob", "us"): lambda odds: implied_odds(odds, category="us"),
@@ -110,10 +236,19 @@ def convert_odds(
     new_odds = {}
 
     if cat_out == "all":
-        cat_out = categories
-        for category_out in cat_out:
-            key = (cat_in, category_out)
-            new_odds[display_odds_key[category_out]] = conversions[key](odds)
+        table, inverse = _convert_all(values.astype(float), cat_in)
+        columns = {
+            "us": table["american"][inverse],
+            "dec": table["decimal"][inverse],
+            "frac": _format_frac(table["frac_num"], table["frac_den"])[inverse],
+            "prob": table["prob"][inverse],
+        }
+        for category_out in categories:
+            # odds are returned as given in their own category, except fractions which are reduced
+            if category_out == cat_in and cat_in != "frac":
+                new_odds[display_odds_key[category_out]] = odds
+            else:
+                new_odds[display_odds_key[category_out]] = _output(columns[category_out], odds)
     else:
         key = (cat_in, cat_out)
         new_odds = conversions[key](odds)
@@ -1,3 +1,5 @@
+import numpy as np
+from ._arrays import _first_array, _is_array, _is_numeric, _values, _wrap
 from .implied_prob import implied_prob
 
 
@@ -12,12 +14,15 @@ def edge_calc(
         category (str, optional): _description_. Defaults to "us".
 
     Returns:
-        float: edge of the bet
+        float: edge of the bet.
+            Array inputs give an array of edges, in the container type of the first array input.
     """
 
-    assert isinstance(win_prob, (int, float)), "win_prob must be numeric"
-    assert 0 <= win_prob <= 1, "win_prob must be in the range of 0 to 1 inclusive"
-    assert isinstance(odds, (int, float)), "odds must be numeric"
+    assert _is_numeric(win_prob), "win_prob must be numeric"
+    assert np.all(
+        (_values(win_prob) >= 0) & (_values(win_prob) <= 1)
+    ), "win_prob must be in the range of 0 to 1 inclusive"
+    assert _is_numeric(odds), "odds must be numeric"
     assert category in [
         "us",
         "frac",
@@ -25,6 +30,12 @@ def edge_calc(
         "prob",
     ], "input category must be either: ('us', 'dec', 'frac', 'prob')"
 
+    like = _first_array(win_prob, odds)
+    if like is not None:
+        imp_prob = implied_prob(odds, category=category)
+        imp_prob = _values(imp_prob) if _is_array(odds) else imp_prob[0]
+        return _wrap(_values(win_prob) - imp_prob, like)
+
     edge = win_prob - implied_prob(odds, category=category)[0]
 
     return edge
@@ -1,3 +1,5 @@
+import numpy as np
+from ._arrays import _first_array, _is_array, _is_numeric, _values, _wrap
 from .convert_odds import convert_odds
 
 
@@ -8,28 +10,43 @@ def expected_value_calc(
     Given probability and odds, return the expected value.
 
     Args:
-        prob (float): Win Probability of bet
-        odds (float): Odds or Implied Win Probability for the bet
+        prob (float, numpy array, pandas Series): Win Probability of bet
+        odds (float, numpy array, pandas Series): Odds or Implied Win Probability for the bet
         category (str, optional): type of odds. Defaults to "us". \n
             'us', American Odds \n
             'dec', Decimal Odds \n
             'frac', Fractional Odds
-        risk (float, optional): Size of the bet. Defaults to 100.
+        risk (float, numpy array, pandas Series, optional): Size of the bet. Defaults to 100.
 
     Returns:
         The expected value of the odds vs the prodability.
+            Array inputs give an array of expected values, in the container type of the first
+            array input.
     """
 
-    assert isinstance(prob, (int, float)), "probability must be numeric"
-    assert 0 <= prob <= 1, "probability must be in the range of 0 to 1 inclusive"
-    assert isinstance(odds, (int, float)), "odds must be numeric"
+    assert _is_numeric(prob), "probability must be numeric"
+    assert np.all(
+        (_values(prob) >= 0) & (_values(prob) <= 1)
+    ), "probability must be in the range of 0 to 1 inclusive"
+    assert _is_numeric(odds), "odds must be numeric"
     assert category in [
         "us",
         "frac",
         "dec",
     ], "type must be either: ('us', 'dec', 'frac')"
-    assert isinstance(risk, (int, float)), "bet_size must be numeric"
-    assert risk > 0, "bet_size must be greater than 0"
+    assert _is_numeric(risk), "bet_size must be numeric"
+    assert np.all(_values(risk) > 0), "bet_size must be greater than 0"
+
+    like = _first_array(prob, odds, risk)
+    if like is not None:
+        if category == "dec":
+            dec_odds = _values(odds)
+        elif _is_array(odds):
+            dec_odds = _values(convert_odds(odds, category, "dec"))
+        else:
+            dec_odds = convert_odds(odds, category, "dec")[0]
+        prob, risk = _values(prob), _values(risk)
+        return _wrap(prob * (risk * dec_odds - risk) - (1 - prob) * risk, like)
 
     loss_prob = 1 - prob
     amount_returned = (
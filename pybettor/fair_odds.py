@@ -1,3 +1,4 @@
+from ._arrays import _NUMERIC, _all_numeric
 from .implied_prob import implied_prob
 from .implied_odds import implied_odds
 
@@ -9,7 +10,7 @@ def fair_odds(
 
     Args:
         line (int or float, optional): line of bet. Defaults to -110.
-        odds (list, optional): odds of all sides. Defaults to [-110, -110].
+        odds (list, numpy array, pandas Series, optional): odds of all sides. Defaults to [-110, -110].
         category (str): type of odds. Defaults to "us". \n
             'us', American Odds \n
             'dec', Decimal Odds \n
@@ -19,8 +20,8 @@ def fair_odds(
         float: fair odds
     """
 
-    assert isinstance(line, (int, float)), "line must be numeric"
-    assert all(isinstance(x, (int, float)) for x in odds), "odds must be numeric"
+    assert isinstance(line, _NUMERIC), "line must be numeric"
+    assert _all_numeric(odds), "odds must be numeric"
     assert category in [
         "us",
         "frac",
@@ -1,4 +1,5 @@
 import numpy as np
+from ._arrays import _first_array, _is_numeric, _values, _wrap
 
 
 def hfa_calc(win_p_neutral: int or float, win_p_leag_hm: int or float) -> float:
@@ -6,25 +7,32 @@ def hfa_calc(win_p_neutral: int or float, win_p_leag_hm: int or float) -> float:
     This function calculates the home field advantage (HFA) for a given bet.
 
     Args:
-        win_p_neutral (int, float): Win Probability Neutral Site
-        win_p_leag_hm (int, float): Win Probability League Home
+        win_p_neutral (int, float, numpy array, pandas Series): Win Probability Neutral Site
+        win_p_leag_hm (int, float, numpy array, pandas Series): Win Probability League Home
 
     Returns:
-        float: Home Field Advantage (HFA) of a bet
+        float: Home Field Advantage (HFA) of a bet.
+            Array inputs give an array, in the container type of the first array input.
     """
 
-    assert isinstance(win_p_neutral, (int, float)), "win_p_neutral must be numeric"
-    assert (
-        0 <= win_p_neutral <= 1
+    assert _is_numeric(win_p_neutral), "win_p_neutral must be numeric"
+    assert np.all(
+        (_values(win_p_neutral) >= 0) & (_values(win_p_neutral) <= 1)
     ), "win_p_neutral must be in the range of 0 to 1 inclusive"
-    assert isinstance(win_p_leag_hm, (int, float)), "win_p_leag_hm must be numeric"
-    assert (
-        0 <= win_p_leag_hm <= 1
+    assert _is_numeric(win_p_leag_hm), "win_p_leag_hm must be numeric"
+    assert np.all(
+        (_values(win_p_leag_hm) >= 0) & (_values(win_p_leag_hm) <= 1)
     ), "win_p_leag_hm must be in the range of 0 to 1 inclusive"
 
+    like = _first_array(win_p_neutral, win_p_leag_hm)
+    win_p_neutral, win_p_leag_hm = _values(win_p_neutral), _values(win_p_leag_hm)
+
     log_odds_tm = np.log(win_p_neutral) - np.log(1 - win_p_neutral)
     log_odds_lg = np.log(win_p_leag_hm) - np.log(1 - win_p_leag_hm)
 
     hfa = np.exp(log_odds_tm + log_odds_lg) / (1 + np.exp(log_odds_tm + log_odds_lg))
 
+    if like is not None:
+        return _wrap(hfa, like)
+
     return hfa
@@ -1,4 +1,5 @@
 from typing import Union  # noqa: F401
+from ._arrays import _all_numeric
 from .implied_prob import implied_prob
 
 
@@ -7,7 +8,7 @@ def hold_calc(odds, category: str = "us", **kwargs) -> float:
     This function calculates the hold perrcentage that the sportsbook has for the given bet.
 
     Args:
-        odds int, float, list): odds of an event
+        odds (list, numpy array, pandas Series): odds of an event
         category (str, optional): type of odds. Defaults to "us". \n
             'us', American Odds \n
             'dec', Decimal Odds \n
@@ -19,7 +20,7 @@ def hold_calc(odds, category: str = "us", **kwargs) -> float:
     """
 
     # Error handling
-    if not all(isinstance(line, (int, float)) for line in odds):
+    if not _all_numeric(odds):
         raise ValueError("Lines must be numeric")
 
     imp_probs = implied_prob(odds, category=category, **kwargs)
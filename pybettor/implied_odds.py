@@ -1,7 +1,17 @@
 from typing import Union
-from fractions import Fraction
-from scipy import optimize
 import numpy as np
+from ._arrays import (
+    _format_frac,
+    _is_array,
+    _is_numeric_array,
+    _limit_denominator,
+    _output,
+    _round,
+    _round_int,
+    _values,
+)
+from ._solvers import _check_bracketed, _newton_bracketed
+from .cache import _memoize
 
 
 def _convert_dec_odds(odds, cat_out, prob):
@@ -23,24 +33,20 @@ def _convert_dec_odds(odds, cat_out, prob):
 
 
 def _convert_dec_to_us_odds(odds):
-    new_odds = [(x - 1) * 100 if x >= 2 else -100 / (x - 1) for x in odds]
-    new_odds = [round(x) for x in new_odds]
+    new_odds = np.where(odds >= 2, (odds - 1) * 100, -100 / (odds - 1))
+    new_odds = _round_int(new_odds)
     return new_odds
 
 
 def _convert_dec_to_frac(odds):
-    new_odds = [Fraction(x - 1).limit_denominator(100) for x in odds]
-    new_odds = [str(x.numerator) + "/" + str(x.denominator) for x in new_odds]
-    return new_odds
+    return _format_frac(*_limit_denominator(odds - 1))
 
 
 def _implied_naive_odds(prob, category):
     if category == "all":
-        us = [x / (1 - x) * -100 if x > 0.5 else (1 - x) / x * 100 for x in prob]
-        dec = [round(1 / x, 2) for x in prob]
-        frac = [Fraction(x - 1).limit_denominator(100) for x in dec]
-        frac = [str(x.numerator) + "/" + str(x.denominator) for x in frac]
-        prob = prob
+        us = np.where(prob > 0.5, prob / (1 - prob) * -100, (1 - prob) / prob * 100)
+        dec = _round(1 / prob, 2)
+        frac = _format_frac(*_limit_denominator(dec - 1))
         imp_odds = {
             "American": us,
             "Decimal": dec,
@@ -49,48 +55,61 @@ def _implied_naive_odds(prob, category):
         }
 
     elif category == "us":
-        imp_odds = [x / (1 - x) * -100 if x > 0.5 else (1 - x) / x * 100 for x in prob]
-        imp_odds = [round(x) for x in imp_odds]
+        imp_odds = np.where(prob > 0.5, prob / (1 - prob) * -100, (1 - prob) / prob * 100)
+        imp_odds = _round_int(imp_odds)
 
     elif category == "dec":
-        imp_odds = [round(1 / x, 2) for x in prob]
+        imp_odds = _round(1 / prob, 2)
 
     elif category == "frac":
-        imp_odds = [Fraction((1.0 / x) - 1.0).limit_denominator(100) for x in prob]
-        imp_odds = [str(x.numerator) + "/" + str(x.denominator) for x in imp_odds]
+        imp_odds = _format_frac(*_limit_denominator((1.0 / prob) - 1.0))
 
     return imp_odds
 
 
 def _implied_basic_odds(prob, margin):
-    return [1 / (x * (1 + margin)) for x in prob]
+    return 1 / (prob * (1 + margin))
 
 
 def _implied_wpo_odds(prob, margin):
     num_outcomes = len(prob)
-    naive_odds = [1 / x for x in prob]
-    specific_margins = [(margin * x) / num_outcomes for x in naive_odds]
-    imp_odds = [x / (1 + y) for x, y in zip(naive_odds, specific_margins)]
+    naive_odds = 1 / prob
+    specific_margins = (margin * naive_odds) / num_outcomes
+    imp_odds = naive_odds / (1 + specific_margins)
     return imp_odds, specific_margins
 
 
 def _implied_odds_ratio_odds(prob, margin):
     if margin != 0:
-        res = optimize.root_scalar(
-            f=or_solvefor,
-            bracket=[0.05, 5],
-            method="brentq",
-            args=(np.array(prob), margin),
+        odds_ratio = float(
+            _solve_odds_ratio_odds(
+                prob[None, :], np.ones((1, len(prob)), dtype=bool), np.array([margin])
+            )[0][0]
         )
-        odds_ratio = res.root
+        _check_bracketed(odds_ratio)
     else:
         odds_ratio = 1
 
-    imp_odds = [1 / or_func(cc=odds_ratio, probs=x) for x in prob]
+    imp_odds = 1 / or_func(cc=odds_ratio, probs=prob)
 
     return imp_odds, odds_ratio
 
 
+def _solve_odds_ratio_odds(prob, mask, margin, x0=1, bracket=(0.05, 5)):
+    def objective(cc, rows):
+        probs = prob[rows]
+        cc = cc[:, None]
+        den = 1 - probs + cc * probs
+        ff = np.sum(or_func(cc, probs), axis=1, where=mask[rows]) - (1 + margin[rows])
+        df = np.sum(probs * (1 - probs) / den**2, axis=1, where=mask[rows])
+        d2f = -2 * np.sum(probs**2 * (1 - probs) / den**3, axis=1, where=mask[rows])
+        return ff, df, d2f
+
+    return _newton_bracketed(
+        objective, np.full(len(prob), bracket[0]), bracket[1], x0=x0
+    )
+
+
 def or_func(cc, probs):
     or_probs = cc * probs
     return or_probs / (1 - probs + or_probs)
@@ -103,21 +122,36 @@ def or_solvefor(cc, probs, margin):
 
 def _implied_power_odds(prob, margin):
     if margin != 0:
-        res = optimize.root_scalar(
-            f=pwr_solvefor,
-            bracket=[0.0001, 1.1],
-            method="brentq",
-            args=(np.array(prob), margin),
+        exponent = float(
+            _solve_power_odds(
+                prob[None, :], np.ones((1, len(prob)), dtype=bool), np.array([margin])
+            )[0][0]
         )
-        exponent = res.root
+        _check_bracketed(exponent)
     else:
         exponent = 1
 
-    imp_odds = [1 / pwr_func(nn=exponent, probs=x) for x in prob]
+    imp_odds = 1 / pwr_func(nn=exponent, probs=prob)
 
     return imp_odds, exponent
 
 
+def _solve_power_odds(prob, mask, margin, x0=1, bracket=(0.0001, 1.1)):
+    def objective(nn, rows):
+        probs = np.where(mask[rows], prob[rows], 1)
+        nn = nn[:, None]
+        log_probs = np.log(probs)
+        pwr = pwr_func(nn, probs)
+        ff = np.sum(pwr, axis=1, where=mask[rows]) - (1 + margin[rows])
+        df = np.sum(pwr * log_probs, axis=1, where=mask[rows])
+        d2f = np.sum(pwr * log_probs**2, axis=1, where=mask[rows])
+        return ff, df, d2f
+
+    return _newton_bracketed(
+        objective, np.full(len(prob), bracket[0]), bracket[1], x0=x0
+    )
+
+
 def pwr_func(nn, probs):
     return np.power(probs, nn)
 
@@ -128,23 +162,25 @@ def pwr_solvefor(nn, probs, margin):
 
 
 def _implied_additive_odds(probs, margin):
-    imp_odds = [1 / (x + (margin / len(probs))) for x in probs]
+    imp_odds = 1 / (probs + (margin / len(probs)))
     return imp_odds
 
 
 def _implied_shin_odds(prob, margin, gross_margin):
+    from scipy import optimize
+
     if margin != 0:
         res = optimize.root_scalar(
             f=shin_solvefor,
             bracket=[0, 0.4],
             method="brentq",
-            args=(np.array(prob), margin, gross_margin),
+            args=(prob, margin, gross_margin),
         )
         zz = res.root
     else:
         zz = 0
 
-    imp_odds = 1 / shin_func(zz, np.array(prob), gross_margin)
+    imp_odds = 1 / shin_func(zz, prob, gross_margin)
 
     return imp_odds, zz
 
@@ -171,16 +207,16 @@ def _implied_balanced_book_odds(prob, margin, gross_margin):
         gross_margin = 0
 
     zz = (((1 - gross_margin) * (1 + margin)) - 1) / (num_outcomes - 1)
-    imp_odds = [
-        1 / ((1 + margin) * (((x * (1 - zz)) + zz) / ((num_outcomes - 1) * zz + 1)))
-        for x in prob
-    ]
+    imp_odds = 1 / (
+        (1 + margin) * (((prob * (1 - zz)) + zz) / ((num_outcomes - 1) * zz + 1))
+    )
 
     return imp_odds, zz
 
 
+@_memoize
 def implied_odds(
-    prob: Union[int, float, list],
+    prob: Union[float, list],
     category: str = "us",
     method: str = "naive",
     margin: float = 0,
@@ -195,7 +231,7 @@ def implied_odds(
     (https://cran.r-project.org/web/packages/implied/implied.pdf)
 
     Args:
-        prob (int, float, list): probability of an event
+        prob (float, list, numpy array, pandas Series): probability of an event
         category (str, optional): type of odds. Defaults to "us". \n
             'all', returns all odds \n
             'us', American Odds \n
@@ -216,14 +252,23 @@ def implied_odds(
 
     Returns:
         list or dictionary: fair odds of a given event.
-            Only returns list when category != 'all' or method in ('naive', 'basic', 'additive')
+            Only returns list when category != 'all' or method in ('naive', 'basic', 'additive').
+            numpy array and pandas Series probabilities give odds in the same container type.
     """
 
-    if type(prob) is not list:
-        prob = [prob]
-
-    assert all(isinstance(x, float) for x in prob), "probability must be numeric"
-    assert all(x > 0 and x < 1 for x in prob), "probability must be between 0 and 1"
+    if _is_array(prob):
+        values = _values(prob)
+        assert _is_numeric_array(values), "probability must be numeric"
+        values = values.astype(float)
+    else:
+        if type(prob) is not list:
+            prob = [prob]
+        assert all(
+            isinstance(x, (float, np.floating)) for x in prob
+        ), "probability must be numeric"
+        values = np.array(prob, dtype=float)
+
+    assert np.all((values > 0) & (values < 1)), "probability must be between 0 and 1"
     assert category in [
         "us",
         "frac",
@@ -248,25 +293,27 @@ def implied_odds(
     assert gross_margin is None or (
         gross_margin >= 0 and gross_margin < 1
     ), "gross_margin must be None or between 0 and 1"
-    if len(prob) > 1 and method != "naive":
+    if len(values) > 1 and method != "naive":
         assert (
-            np.sum(prob) >= 1 - margin
+            np.sum(values) >= 1 - margin
         ), "sum of probabilities must be greater than or equal to 1 - margin"
 
     if normalize:
-        balanced_prob = [x / np.sum(prob) for x in prob]
+        balanced_prob = values / np.sum(values)
     else:
-        balanced_prob = prob
+        balanced_prob = values
 
     mydict = {}
 
     if method == "naive":
-        imp_odds = _implied_naive_odds(prob, category)
-        return imp_odds
+        imp_odds = _implied_naive_odds(values, category)
+        if category == "all":
+            imp_odds["Implied Probability"] = prob
+        return _output(imp_odds, prob)
     elif method == "basic":
         imp_odds = _implied_basic_odds(balanced_prob, margin)
         imp_odds = _convert_dec_odds(imp_odds, category, prob)
-        return imp_odds
+        return _output(imp_odds, prob)
     elif method == "wpo":
         imp_odds, specific_margins = _implied_wpo_odds(balanced_prob, margin)
         mydict["specific_margins"] = specific_margins
@@ -279,7 +326,7 @@ def implied_odds(
     elif method == "additive":
         imp_odds = _implied_additive_odds(balanced_prob, margin)
         imp_odds = _convert_dec_odds(imp_odds, category, prob)
-        return imp_odds
+        return _output(imp_odds, prob)
     elif method == "shin":
         imp_odds, z_value = _implied_shin_odds(balanced_prob, margin, gross_margin)
         mydict["z_value"] = z_value
@@ -302,4 +349,4 @@ def implied_odds(
     ]
     mydict = {key: mydict[key] for key in sort_order if key in mydict}
 
-    return mydict
+    return _output(mydict, prob)
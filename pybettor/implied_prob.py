@@ -1,7 +1,10 @@
 from typing import Union  # noqa: F401
-from scipy import optimize
 import numpy as np
 import warnings
+from ._solvers import _check_bracketed, _newton_bracketed
+from ._arrays import _INTEGER, _NUMERIC, _is_array, _is_numeric_array, _values, _wrap
+from .cache import _memoize
+from .odds_table import _lookup_us_odds
 
 
 def _implied_basic_prob(naive_prob):
@@ -17,13 +20,30 @@ def _implied_wpo_prob(odds, margin):
 
 
 def _implied_odds_ratio_prob(naive_prob):
-    res = optimize.root_scalar(
-        f=or_solvefor, bracket=[0.05, 5], method="brentq", args=(np.array(naive_prob),)
+    imp_prob, odds_ratio, _, _ = _implied_odds_ratio_prob_batch(
+        np.array([naive_prob]), np.ones((1, len(naive_prob)), dtype=bool)
     )
-    odds_ratio = res.root
-    imp_prob = [or_func(odds_ratio, x) for x in naive_prob]
+    _check_bracketed(odds_ratio)
 
-    return imp_prob, odds_ratio
+    return imp_prob[0].tolist(), float(odds_ratio[0])
+
+
+def _implied_odds_ratio_prob_batch(naive_prob, mask, x0=1, bracket=(0.05, 5)):
+    def objective(cc, rows):
+        io = naive_prob[rows]
+        cc = cc[:, None]
+        den = cc + io - cc * io
+        ff = np.sum(io / den, axis=1, where=mask[rows]) - 1
+        df = -np.sum(io * (1 - io) / den**2, axis=1, where=mask[rows])
+        d2f = 2 * np.sum(io * (1 - io) ** 2 / den**3, axis=1, where=mask[rows])
+        return ff, df, d2f
+
+    odds_ratio, iterations, converged = _newton_bracketed(
+        objective, np.full(len(naive_prob), bracket[0]), bracket[1], x0=x0
+    )
+    imp_prob = np.where(mask, or_func(odds_ratio[:, None], naive_prob), 0)
+
+    return imp_prob, odds_ratio, iterations, converged
 
 
 def or_func(cc, io):
@@ -36,13 +56,33 @@ def or_solvefor(cc, io):
 
 
 def _implied_power_prob(naive_prob):
-    res = optimize.root_scalar(
-        pwr_solvefor, bracket=[0.0001, 1], method="brentq", args=(naive_prob,)
+    imp_prob, exponent, _, _ = _implied_power_prob_batch(
+        np.array([naive_prob]), np.ones((1, len(naive_prob)), dtype=bool)
+    )
+    _check_bracketed(exponent)
+
+    return imp_prob[0].tolist(), float(exponent[0])
+
+
+def _implied_power_prob_batch(naive_prob, mask, x0=1, bracket=(0.0001, 1)):
+    def objective(nn, rows):
+        io = np.where(mask[rows], naive_prob[rows], 1)
+        nn = nn[:, None]
+        log_io = np.log(io)
+        pwr = pwr_func(nn, io)
+        ff = np.sum(pwr, axis=1, where=mask[rows]) - 1
+        df = -np.sum(pwr * log_io / nn**2, axis=1, where=mask[rows])
+        d2f = np.sum(
+            pwr * log_io**2 / nn**4 + 2 * pwr * log_io / nn**3, axis=1, where=mask[rows]
+        )
+        return ff, df, d2f
+
+    exponent, iterations, converged = _newton_bracketed(
+        objective, np.full(len(naive_prob), bracket[0]), bracket[1], x0=x0
     )
-    exponent = res.root
-    imp_prob = [pwr_func(exponent, x) for x in naive_prob]
+    imp_prob = np.where(mask, pwr_func(exponent[:, None], naive_prob), 0)
 
-    return imp_prob, exponent
+    return imp_prob, exponent, iterations, converged
 
 
 def pwr_func(nn, io):
@@ -86,40 +126,136 @@ def _implied_shin_prob(naive_prob, shin_method, gross_margin):
 
 
 def _calculate_shin_z_value_js(naive_prob, gross_margin, num_outcomes, naive_prob_sum):
-    zz_tmp = 0
-
-    for jj in range(1000):
-        zz_prev = zz_tmp
-        zz_tmp = (
-            np.sum(
-                np.sqrt(
-                    zz_prev**2
-                    + 4
-                    * (1 - zz_prev)
-                    * (((naive_prob**2 * (1 - gross_margin))) / naive_prob_sum)
-                )
-            )
-            - 2
-        ) / (num_outcomes - 2)
+    imp_prob, zz, _, converged = _shin_js_batch(
+        naive_prob[None, :], np.ones((1, num_outcomes), dtype=bool), gross_margin
+    )
+    if not converged[0]:
+        warnings.warn("shin did not converge")
+
+    return imp_prob[0], zz[0]
+
+
+def _shin_js_batch(naive_prob, mask, gross_margin, z_start=None, maxiter=1000):
+    """Jullien-Salanie fixed point iteration for every row (market) of naive_prob at once.
+
+    Padded outcomes (mask False) must hold a naive probability of 0. Markets drop out of the
+    iteration as soon as they converge. Implied probabilities are evaluated at the last iterate
+    before convergence, as in the original per market loop.
 
-        if np.abs(zz_tmp - zz_prev) <= np.finfo(float).eps ** 0.25:
+    Returns:
+        tuple: implied probabilities, z values, iteration counts and convergence flags
+    """
+    num_markets = len(naive_prob)
+    num_outcomes = mask.sum(axis=1)
+    naive_prob_sum = naive_prob.sum(axis=1)
+    scaled_prob = 4 * naive_prob**2 * (1 - gross_margin) / naive_prob_sum[:, None]
+    tol = np.finfo(float).eps ** 0.25
+
+    zz = np.zeros(num_markets) if z_start is None else np.array(z_start, dtype=float)
+    iterations = np.zeros(num_markets, dtype=int)
+    converged = np.zeros(num_markets, dtype=bool)
+
+    # the fixed point divides by num_outcomes - 2, so two outcome markets solve
+    # sqrt(z^2 + (1 - z) s_1) + sqrt(z^2 + (1 - z) s_2) = 2 in closed form instead
+    two_way = num_outcomes == 2
+    if np.any(two_way):
+        aa = scaled_prob[two_way] / 4
+        total = aa.sum(axis=1)
+        difference_sq = 2 * np.sum(aa**2, axis=1) - total**2
+        zz[two_way] = 1 - 2 * (total - 1) / (difference_sq - 1)
+        converged[two_way] = True
+
+    zz_eval = zz.copy()
+    active = np.flatnonzero(~two_way)
+    for _ in range(maxiter):
+        if len(active) == 0:
             break
-        elif jj == 999:
-            warnings.warn("shin did not converge")
 
-        imp_prob = shin_func(zz_tmp, naive_prob)
+        zz_prev = zz[active]
+        with np.errstate(invalid="ignore"):
+            roots = np.sqrt(
+                zz_prev[:, None] ** 2 + (1 - zz_prev[:, None]) * scaled_prob[active]
+            )
+        zz_new = (np.sum(roots, axis=1, where=mask[active]) - 2) / (
+            num_outcomes[active] - 2
+        )
+        done = np.abs(zz_new - zz_prev) <= tol
+
+        zz[active] = zz_new
+        zz_eval[active] = np.where(done, zz_prev, zz_new)
+        iterations[active] += 1
+        converged[active] = done
+        # markets whose iterate is no longer finite cannot converge
+        active = active[~done & np.isfinite(zz_new)]
 
-    return imp_prob, zz_tmp
+    imp_prob = np.where(mask, shin_func_batch(zz_eval, naive_prob), 0)
+
+    return imp_prob, zz, iterations, converged
+
+
+def _shin_js_polish_batch(naive_prob, mask, gross_margin, zz, width):
+    """Newton polish of Jullien-Salanie z values onto the root of their fixed point equation.
+
+    The fixed point iteration stops once a step is below eps**0.25, so its z value depends on the
+    starting point. Each market is solved again within [z / (1 + width), z * (1 + width)], which keeps
+    clear of the trivial root z = 1. Markets without a root in that bracket return nan.
+
+    Returns:
+        tuple: implied probabilities, z values, iteration counts and convergence flags
+    """
+    num_outcomes = mask.sum(axis=1)
+    naive_prob_sum = naive_prob.sum(axis=1)
+    scaled_prob = 4 * naive_prob**2 * (1 - gross_margin) / naive_prob_sum[:, None]
+
+    def objective(zz, rows):
+        aa = scaled_prob[rows]
+        zz = zz[:, None]
+        root = np.sqrt(zz**2 + (1 - zz) * aa)
+        with np.errstate(divide="ignore", invalid="ignore"):
+            d_root = (2 * zz - aa) / (2 * root)
+        ff = np.sum(root, axis=1, where=mask[rows]) - 2 - (num_outcomes[rows] - 2) * zz[:, 0]
+        df = np.sum(d_root, axis=1, where=mask[rows]) - (num_outcomes[rows] - 2)
+        return ff, df, None
+
+    zz = np.asarray(zz, dtype=float)
+    zz, iterations, converged = _newton_bracketed(
+        objective, zz / (1 + width), zz * (1 + width), x0=zz
+    )
+    imp_prob = np.where(mask, shin_func_batch(zz, naive_prob), 0)
+
+    return imp_prob, zz, iterations, converged
 
 
 def _calculate_shin_z_value_uniroot(naive_prob):
-    res = optimize.root_scalar(
-        f=shin_solvefor, bracket=[0, 0.4], method="brentq", args=(naive_prob,)
+    imp_prob, zz, _, _ = _shin_uniroot_batch(
+        naive_prob[None, :], np.ones((1, len(naive_prob)), dtype=bool)
+    )
+    _check_bracketed(zz)
+
+    return imp_prob[0], float(zz[0])
+
+
+def _shin_uniroot_batch(naive_prob, mask, x0=None, bracket=(0, 0.4)):
+    scaled_prob = naive_prob**2 / np.sum(naive_prob, axis=1)[:, None]
+
+    def objective(zz, rows):
+        aa = scaled_prob[rows]
+        zz = zz[:, None]
+        root = np.sqrt(zz**2 + 4 * (1 - zz) * aa)
+        with np.errstate(divide="ignore", invalid="ignore"):
+            d_root = (zz - 2 * aa) / root
+        ff = 1 - np.sum(shin_func_batch(zz[:, 0], naive_prob[rows]), axis=1, where=mask[rows])
+        df = -np.sum(
+            ((d_root - 1) * (1 - zz) + (root - zz)) / (2 * (1 - zz) ** 2), axis=1, where=mask[rows]
+        )
+        return ff, df, None
+
+    zz, iterations, converged = _newton_bracketed(
+        objective, np.full(len(naive_prob), bracket[0]), bracket[1], x0=x0
     )
-    zz_tmp = res.root
-    imp_prob = shin_func(zz_tmp, naive_prob)
+    imp_prob = np.where(mask, shin_func_batch(zz, naive_prob), 0)
 
-    return imp_prob, zz_tmp
+    return imp_prob, zz, iterations, converged
 
 
 def shin_func(zz, io):
@@ -127,6 +263,12 @@ def shin_func(zz, io):
     return (np.sqrt(zz**2 + 4 * (1 - zz) * ((io**2) / bb)) - zz) / (2 * (1 - zz))
 
 
+def shin_func_batch(zz, io):
+    bb = np.sum(io, axis=1)[:, None]
+    zz = np.asarray(zz)[:, None]
+    return (np.sqrt(zz**2 + 4 * (1 - zz) * ((io**2) / bb)) - zz) / (2 * (1 - zz))
+
+
 def shin_solvefor(zz, io):
     tmp = shin_func(zz, io)
     return 1 - np.sum(tmp)
@@ -142,17 +284,90 @@ def _implied_balanced_book_prob(naive_prob, gross_margin):
 
 
 def _implied_jsd_prob(naive_prob):
-    res = optimize.root_scalar(
-        f=jsd_solvefor,
-        bracket=[0.0000001, 0.1],
-        method="brentq",
-        args=(naive_prob,),
-        xtol=0.0000001,
+    imp_prob, distance, _, _ = _implied_jsd_prob_batch(
+        np.array([naive_prob]), np.ones((1, len(naive_prob)), dtype=bool)
     )
-    distance = res.root
-    imp_prob = jsd_func(distance, naive_prob)
+    _check_bracketed(distance)
+
+    return imp_prob[0], float(distance[0])
 
-    return imp_prob, distance
+
+def _implied_jsd_prob_batch(naive_prob, mask, x0=None, bracket=(0.0000001, 0.1)):
+    """Jensen-Shannon distance de-vig for every row (market) of naive_prob at once.
+
+    The outer problem finds the distance at which the implied probabilities sum to 1. Each of
+    its evaluations solves the inner problems of all outcomes of all markets together, and the
+    implicit derivative of the inner solutions gives Newton steps for the outer problem.
+    """
+
+    def inner(distance, rows):
+        io = naive_prob[rows]
+        valid = mask[rows]
+        pp = np.zeros(io.shape)
+        pp[valid] = _jsd_inner_batch(
+            np.broadcast_to(distance[:, None], io.shape)[valid], io[valid]
+        )
+        return pp, io, valid
+
+    def objective(distance, rows):
+        pp, io, valid = inner(distance, rows)
+        ff = np.sum(pp, axis=1) - 1
+        with np.errstate(divide="ignore", invalid="ignore"):
+            dp = np.where(
+                valid & (pp > 0.00001), 2 * distance[:, None] / _binom_js_derivative(pp, io), 0
+            )
+        return ff, np.sum(dp, axis=1), None
+
+    if x0 is None:
+        # first order guess from the expansion used by the inner problems
+        spread = np.sum(np.sqrt(8 * naive_prob * (1 - naive_prob)), axis=1, where=mask)
+        x0 = (np.sum(naive_prob, axis=1) - 1) / spread
+
+    distance, iterations, converged = _newton_bracketed(
+        objective, np.full(len(naive_prob), bracket[0]), bracket[1], x0=x0
+    )
+    imp_prob = np.zeros(naive_prob.shape)
+    solved = ~np.isnan(distance)
+    imp_prob[solved] = inner(distance[solved], np.flatnonzero(solved))[0]
+
+    return imp_prob, distance, iterations, converged
+
+
+def _jsd_inner_batch(distance, io):
+    """Solve binom_jsd(p, io) = distance for p in [0.00001, io], elementwise.
+
+    Outcomes too unlikely to reach the distance inside the bracket are held at its lower end.
+    """
+    target = distance**2
+
+    def objective(pp, rows):
+        qq = io[rows]
+        mm = (pp + qq) / 2
+        ff = _binom_js(pp, qq, mm) - target[rows]
+        df = _binom_js_derivative(pp, qq)
+        d2f = 0.5 * (1 / pp + 1 / (1 - pp) - 0.5 / mm - 0.5 / (1 - mm))
+        return ff, df, d2f
+
+    # second order expansion of the distance around p = io
+    x0 = io - distance * np.sqrt(8 * io * (1 - io))
+    pp, _, _ = _newton_bracketed(objective, np.full(len(io), 0.00001), io, x0=x0)
+
+    return np.where(np.isnan(pp), 0.00001, pp)
+
+
+def _binom_js(pp, io, mm):
+    """Squared binom_jsd(), elementwise."""
+    return (
+        pp * np.log(pp / mm)
+        + (1 - pp) * np.log((1 - pp) / (1 - mm))
+        + io * np.log(io / mm)
+        + (1 - io) * np.log((1 - io) / (1 - mm))
+    ) / 2
+
+
+def _binom_js_derivative(pp, io):
+    mm = (pp + io) / 2
+    return 0.5 * np.log(pp * (1 - mm) / ((1 - pp) * mm))
 
 
 def kld(x, y):
@@ -168,6 +383,8 @@ def binom_jsd(p, io):
 
 
 def jsd_func(jsd, io):
+    from scipy import optimize
+
     def tosolve(p, io, jsd):
         return binom_jsd(p, io) - jsd
 
@@ -188,6 +405,52 @@ def jsd_solvefor(jsd, io):
     return np.sum(jsd_func(jsd, io)) - 1
 
 
+def _implied_prob_array(odds, category, method, shin_method, gross_margin, normalize):
+    from .implied_prob_batch import implied_prob_batch
+
+    values = _values(odds)
+    assert _is_numeric_array(values), "odds must be numeric"
+    assert values.ndim == 1, "odds must be one dimensional, use implied_prob_batch() for many markets"
+
+    result = implied_prob_batch(
+        values[None, :],
+        category=category,
+        method=method,
+        shin_method=shin_method,
+        gross_margin=gross_margin,
+        normalize=normalize,
+    )
+    if method == "naive":
+        return _wrap(result[0], odds)
+
+    outcome_keys = ["naive_prob", "implied_prob", "specific_margins"]
+    return {
+        k: _wrap(v[0], odds) if k in outcome_keys else float(v[0])
+        for k, v in result.items()
+        if k not in ["iterations", "converged"]
+    }
+
+
+def _us_naive_prob(odds):
+    # both branches are evaluated, and +100 odds divide by zero in the unused one
+    with np.errstate(divide="ignore"):
+        return np.where(odds <= -100, 1 / (1 - 100 / odds), 1 / (1 + odds / 100))
+
+
+def _check_category_odds(odds, category):
+    values = np.asarray(odds)
+    if category == "us":
+        assert all(isinstance(x, _INTEGER) for x in odds), "us odds must be a whole number"
+        assert not np.any(
+            (values > -100) & (values < 100)
+        ), "us odds cannot be between -99 and 99"
+    elif category == "dec":
+        assert np.all(values >= 1), "dec odds must be greater than 1"
+    elif category == "frac":
+        assert np.all(values > 0), "frac odds must be greater than 0"
+
+
+@_memoize
 def implied_prob(
     odds: Union[int, float, list],
     category: str = "us",
@@ -205,7 +468,7 @@ def implied_prob(
 
 
     Args:
-        odds (int, float, list): odds of an event
+        odds (int, float, list, numpy array, pandas Series): odds of an event
         category (str, optional): type of odds. Defaults to "us". \n
             'us', American Odds \n
             'dec', Decimal Odds \n
@@ -229,12 +492,18 @@ def implied_prob(
 
     Returns:
         list or dictionary: implied probability
-            Only returns a list if method='naive'
+            Only returns a list if method='naive'.
+            numpy array and pandas Series odds give probabilities in the same container type.
     """
 
+    if _is_array(odds):
+        return _implied_prob_array(
+            odds, category, method, shin_method, gross_margin, normalize
+        )
+
     odds = [odds] if not isinstance(odds, list) else odds
 
-    assert all(isinstance(x, (int, float)) for x in odds), "odds must be numeric"
+    assert all(isinstance(x, _NUMERIC) for x in odds), "odds must be numeric"
     assert category in [
         "us",
         "frac",
@@ -252,24 +521,17 @@ def implied_prob(
         "jsd",
     ], "method must be either: ('naive', 'basic', 'wpo', 'odds_ratio', 'power', 'additive', 'shin', 'balanced_book', 'jsd')"  # noqa: E501
 
-    # category assertions
-    if category == "us":
-        assert all(isinstance(x, int) for x in odds), "us odds must be a whole number"
-        assert not any(
-            x in range(-99, 100) for x in odds
-        ), "us odds cannot be between -99 and 99"
-    elif category == "dec":
-        assert all(x >= 1 for x in odds), "dec odds must be greater than 1"
-    elif category == "frac":
-        assert all(x > 0 for x in odds), "frac odds must be greater than 0"
+    _check_category_odds(odds, category)
 
     # calculate naive probability
     category_formulas = {
-        "us": lambda x: 1 / (1 - 100 / x) if x <= -100 else 1 / (1 + x / 100),
         "dec": lambda x: 1 / x,
         "frac": lambda x: 1 / (1 + x),
     }
-    naive_prob = [category_formulas[category](x) for x in odds]
+    if category == "us":
+        naive_prob = _lookup_us_odds(np.array(odds, dtype=float), "prob", _us_naive_prob).tolist()
+    else:
+        naive_prob = [category_formulas[category](x) for x in odds]
 
     # build dictionary
     margin = np.sum(naive_prob) - 1
@@ -0,0 +1,240 @@
+from typing import Union  # noqa: F401
+import numpy as np
+import warnings
+from .implied_prob import (
+    _implied_jsd_prob_batch,
+    _implied_odds_ratio_prob_batch,
+    _implied_power_prob_batch,
+    _shin_js_batch,
+    _shin_uniroot_batch,
+    _us_naive_prob,
+)
+from .odds_table import _lookup_us_odds
+
+
+def _pad_markets(odds, offsets):
+    """Lay the odds out as a (markets x outcomes) matrix with a validity mask."""
+    if offsets is None:
+        values = np.asarray(odds, dtype=float)
+        assert values.ndim == 2, "odds must be a 2-D array when offsets is not given"
+        mask = np.ones(values.shape, dtype=bool)
+        return values, mask
+
+    flat = np.asarray(odds, dtype=float)
+    offsets = np.asarray(offsets)
+    assert flat.ndim == 1, "odds must be a 1-D array when offsets is given"
+    assert offsets.ndim == 1 and len(offsets) >= 2, "offsets must hold at least two boundaries"
+    assert np.issubdtype(offsets.dtype, np.integer), "offsets must be integers"
+    assert offsets[0] == 0 and offsets[-1] == len(flat), "offsets must start at 0 and end at len(odds)"
+    counts = np.diff(offsets)
+    assert np.all(counts > 0), "offsets must be strictly increasing"
+
+    rows = np.repeat(np.arange(len(counts)), counts)
+    cols = np.arange(len(flat)) - np.repeat(offsets[:-1], counts)
+    values = np.ones((len(counts), counts.max()))
+    mask = np.zeros(values.shape, dtype=bool)
+    values[rows, cols] = flat
+    mask[rows, cols] = True
+
+    return values, mask
+
+
+def _naive_prob_batch(odds, category):
+    if category == "us":
+        return _lookup_us_odds(odds, "prob", _us_naive_prob)
+    elif category == "dec":
+        return 1 / odds
+    elif category == "frac":
+        return 1 / (1 + odds)
+
+
+def _validate_batch(odds, mask, category):
+    valid = odds[mask]
+
+    assert np.all(np.isfinite(valid)), "odds must be numeric"
+    if category == "us":
+        assert np.all(valid == np.round(valid)), "us odds must be a whole number"
+        assert not np.any(
+            (valid > -100) & (valid < 100)
+        ), "us odds cannot be between -99 and 99"
+    elif category == "dec":
+        assert np.all(valid >= 1), "dec odds must be greater than 1"
+    elif category == "frac":
+        assert np.all(valid > 0), "frac odds must be greater than 0"
+
+
+def _warn_not_converged(method, converged):
+    if not converged.all():
+        warnings.warn(
+            f"{method} did not converge for {np.sum(~converged)} of {len(converged)} markets"
+        )
+
+
+def _implied_shin_prob_batch(naive_prob, mask, shin_method, gross_margin):
+    if shin_method == "uniroot" and gross_margin != 0:
+        shin_method = "js"
+        warnings.warn(
+            "gross_margin is not used when shin_method is 'uniroot'. shin_method is set to 'js'."
+        )
+
+    if shin_method == "js":
+        imp_prob, z_value, iterations, converged = _shin_js_batch(
+            naive_prob, mask, gross_margin
+        )
+    elif shin_method == "uniroot":
+        imp_prob, z_value, iterations, converged = _shin_uniroot_batch(naive_prob, mask)
+
+    _warn_not_converged("shin", converged)
+
+    return imp_prob, {"z_value": z_value, "iterations": iterations, "converged": converged}
+
+
+def implied_prob_batch(
+    odds,
+    category: str = "us",
+    method: str = "naive",
+    offsets=None,
+    shin_method: str = "js",
+    gross_margin: float = 0,
+    normalize: bool = True,
+) -> np.ndarray or dict:
+    """Batch Bet Implied Probability
+    This function calculates the implied probabilities for many markets in a single call.
+    Each market is treated exactly as implied_prob() would treat it.
+
+    Args:
+        odds (array-like): odds of every market. Either a 2-D array with one market per row,
+            or a flat 1-D array of all outcomes when offsets is given
+        category (str, optional): type of odds. Defaults to "us". \n
+            'us', American Odds \n
+            'dec', Decimal Odds \n
+            'frac', Fractional Odds
+        method (str, optional): method to calculate implied probability. Defaults to "naive". \n
+            'naive', naive implied probability \n
+            'basic', basic implied probability \n
+            'wpo', weighted probability odds \n
+            'odds_ratio', odds ratio \n
+            'power', power \n
+            'additive', additive \n
+            'shin', shin \n
+            'balanced_book', balanced book \n
+            'jsd', jensen-shannon divergence
+        offsets (array-like, optional): market boundaries into a flat odds array, market i spans
+            odds[offsets[i]:offsets[i + 1]]. Defaults to None.
+        shin_method (str, optional): method to calculate shin implied probability. Defaults to "js". \n
+            'js', jensen-shannon divergence \n
+            'uniroot', uniroot
+        gross_margin (float, optional): gross margin of sportsbook. Defaults to 0.
+        normalize (bool, optional): normalize implied probability to sum to 1 if method is not naive. Defaults to True.
+
+    Returns:
+        numpy array or dictionary: implied probability
+            Only returns an array if method='naive'.
+            Outcome level values keep the layout of odds, market level values have one entry per market.
+            The 'odds_ratio', 'power', 'shin' and 'jsd' methods also report the iterations and converged
+            status of every market.
+    """
+
+    assert category in [
+        "us",
+        "frac",
+        "dec",
+    ], "category must be either: ('us', 'dec', 'frac')"
+    assert method in [
+        "naive",
+        "basic",
+        "wpo",
+        "odds_ratio",
+        "power",
+        "additive",
+        "shin",
+        "balanced_book",
+        "jsd",
+    ], "method must be either: ('naive', 'basic', 'wpo', 'odds_ratio', 'power', 'additive', 'shin', 'balanced_book', 'jsd')"  # noqa: E501
+
+    odds, mask = _pad_markets(odds, offsets)
+    _validate_batch(odds, mask, category)
+
+    def unpad(values):
+        return values[mask] if offsets is not None else values
+
+    # calculate naive probability
+    naive_prob = np.where(mask, _naive_prob_batch(odds, category), 0)
+    num_outcomes = mask.sum(axis=1)
+
+    if method == "naive":
+        return unpad(naive_prob)
+
+    # build dictionary
+    naive_prob_sum = naive_prob.sum(axis=1)
+    margin = naive_prob_sum - 1
+    mydict = {"naive_prob": unpad(naive_prob), "margin": margin}
+
+    if method == "basic":
+        imp_prob = naive_prob / naive_prob_sum[:, None]
+    elif method == "wpo":
+        assert (
+            category == "dec"
+        ), "wpo method only works with decimal odds, use convert_odds() to convert odds to decimal"
+        nn = num_outcomes[:, None]
+        imp_prob = np.where(mask, (nn - margin[:, None] * odds) / (nn * odds), 0)
+        specific_margins = np.where(mask, margin[:, None] * (1 / imp_prob) / nn, 0)
+        mydict["specific_margins"] = unpad(specific_margins)
+    elif method == "odds_ratio":
+        imp_prob, odds_ratio, iterations, converged = _implied_odds_ratio_prob_batch(
+            naive_prob, mask
+        )
+        mydict.update(odds_ratio=odds_ratio, iterations=iterations, converged=converged)
+        _warn_not_converged("odds_ratio", converged)
+    elif method == "power":
+        imp_prob, exponent, iterations, converged = _implied_power_prob_batch(
+            naive_prob, mask
+        )
+        mydict.update(exponent=exponent, iterations=iterations, converged=converged)
+        _warn_not_converged("power", converged)
+    elif method == "additive":
+        imp_prob = naive_prob - (margin / num_outcomes)[:, None]
+    elif method == "shin":
+        imp_prob, shin_params = _implied_shin_prob_batch(
+            naive_prob, mask, shin_method, gross_margin
+        )
+        mydict.update(shin_params)
+    elif method == "balanced_book":
+        zz = ((1 - gross_margin) * naive_prob_sum - 1) / (num_outcomes - 1)
+        imp_prob = (((1 - gross_margin) * naive_prob) - zz[:, None]) / (1 - zz[:, None])
+        mydict["z_value"] = zz
+    elif method == "jsd":
+        imp_prob, distance, iterations, converged = _implied_jsd_prob_batch(
+            naive_prob, mask
+        )
+        mydict.update(distance=distance, iterations=iterations, converged=converged)
+        _warn_not_converged("jsd", converged)
+
+    imp_prob = np.where(mask, imp_prob, 0)
+
+    # Normalize
+    if normalize:
+        imp_prob = imp_prob / imp_prob.sum(axis=1)[:, None]
+
+    # warn if probabilities outside of [0,1]
+    if np.any(imp_prob[mask] < 0) or np.any(imp_prob[mask] > 1):
+        warnings.warn("implied probabilities outside of [0,1]")
+
+    mydict["implied_prob"] = unpad(imp_prob)
+
+    # sort dictionary
+    sort_order = [
+        "naive_prob",
+        "implied_prob",
+        "margin",
+        "specific_margins",
+        "odds_ratio",
+        "exponent",
+        "z_value",
+        "distance",
+        "iterations",
+        "converged",
+    ]
+    mydict = {k: mydict[k] for k in sort_order if k in mydict}
+
+    return mydict
@@ -1,5 +1,6 @@
-from fractions import Fraction
-from .convert_odds import convert_odds
+import numpy as np
+from ._arrays import _first_array, _is_array, _is_numeric, _round, _values, _wrap
+from .odds import Odds, _profit
 
 
 def kelly(win_prob, odds, category: str = "us", kelly_factor: int = 1) -> float:
@@ -10,8 +11,8 @@ def kelly(win_prob, odds, category: str = "us", kelly_factor: int = 1) -> float:
     Reference: Kelly Criterion wikipedia(https://en.wikipedia.org/wiki/Kelly_criterion) page
 
     Args:
-        win_prob (float): Win Probability of bet
-        odds (float): Odds or Implied Win Probability for the bet
+        win_prob (float, numpy array, pandas Series): Win Probability of bet
+        odds (float, numpy array, pandas Series): Odds or Implied Win Probability for the bet
         category (str, optional): type of odds. Defaults to "us". \n
             'us', American Odds \n
             'dec', Decimal Odds \n
@@ -22,11 +23,14 @@ def kelly(win_prob, odds, category: str = "us", kelly_factor: int = 1) -> float:
             Defaults to 1.
 
     Returns:
-        float: Optimal percentage of bankroll to risk on bet based on the kelly criterion
+        float: Optimal percentage of bankroll to risk on bet based on the kelly criterion.
+            Array inputs give an array, in the container type of the first array input.
     """
 
-    assert isinstance(odds, (int, float)), "odds must be numeric"
-    assert win_prob < 1 and win_prob > 0, "Win Prob must be between 0 and 1"
+    assert _is_numeric(odds), "odds must be numeric"
+    assert np.all(
+        (_values(win_prob) < 1) & (_values(win_prob) > 0)
+    ), "Win Prob must be between 0 and 1"
     assert category in [
         "us",
         "frac",
@@ -34,8 +38,16 @@ def kelly(win_prob, odds, category: str = "us", kelly_factor: int = 1) -> float:
         "prob",
     ], "input category must be either: ('us', 'dec', 'frac', 'prob')"
 
-    odds = convert_odds(odds, cat_in=category, cat_out="frac")[0]
-    odds = float(Fraction(odds))
+    like = _first_array(win_prob, odds)
+    if _is_array(odds):
+        odds = _profit(_values(odds), category)
+    else:
+        odds = Odds.from_value(odds, category).profit
+
+    if like is not None:
+        win_prob = _values(win_prob)
+        kelly_perc = _round(((odds * win_prob) - (1 - win_prob)) / odds / kelly_factor, 2)
+        return _wrap(kelly_perc, like)
 
     bets = {"odds": odds, "win_prob": win_prob}
     kelly_perc = round(
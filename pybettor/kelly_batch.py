@@ -0,0 +1,81 @@
+import numpy as np
+from ._arrays import _first_array, _is_array, _is_numeric_array, _round, _values, _wrap
+from .odds import _profit, _valid_odds
+
+
+def _as_column(x):
+    return np.asarray(_values(x) if _is_array(x) else x)
+
+
+def kelly_batch(
+    win_prob, odds, category="us", kelly_factor=1, unit_size: float = 100
+) -> dict:
+    """Batch Kelly Criterion
+    This function sizes many bets with the Kelly Criterion in a single call, returning both the
+    percentage of bankroll and the bet size of every bet, as kelly() and kelly_bet() would.
+
+    Rows that cannot be sized (a win probability outside of (0, 1), odds that are not a valid
+    price of their category, an unknown category or a kelly_factor that is not positive) are
+    flagged in 'valid' and sized as nan instead of failing the whole batch.
+
+    Reference: Kelly Criterion wikipedia(https://en.wikipedia.org/wiki/Kelly_criterion) page
+
+    Args:
+        win_prob (array-like): Win Probability of every bet
+        odds (array-like): Odds or Implied Win Probability of every bet
+        category (str, array-like, optional): type of odds, for all bets or for each bet.
+            Defaults to "us". \n
+            'us', American Odds \n
+            'dec', Decimal Odds \n
+            'frac', Fractional Odds \n
+            'prob', Implied Probability
+        kelly_factor (int, array-like, optional): Kelly Factor is used to shrink the kelly bet size,
+            for all bets or for each bet. Defaults to 1.
+        unit_size (float, array-like, optional): Unit size of your bankroll, typically 1% of bankroll.
+            Defaults to 100.
+
+    Returns:
+        dictionary: kelly, bet_size and valid arrays.
+            pandas Series inputs give Series with the index of the first Series.
+    """
+
+    like = _first_array(win_prob, odds, category, kelly_factor, unit_size)
+    columns = {
+        "win_prob": win_prob,
+        "odds": odds,
+        "kelly_factor": kelly_factor,
+        "unit_size": unit_size,
+    }
+    for name, value in columns.items():
+        columns[name] = np.atleast_1d(_as_column(value))
+        assert _is_numeric_array(columns[name]), f"{name} must be numeric"
+
+    win_prob, odds, kelly_factor, unit_size, category = np.broadcast_arrays(
+        *(x.astype(float) for x in columns.values()), np.atleast_1d(_as_column(category))
+    )
+
+    with np.errstate(invalid="ignore"):
+        valid = (
+            (win_prob > 0)
+            & (win_prob < 1)
+            & (kelly_factor > 0)
+            & np.isfinite(kelly_factor)
+            & np.isfinite(unit_size)
+            & np.isfinite(odds)
+        )
+
+    profit = np.full(odds.shape, np.nan)
+    for category_in in ("us", "dec", "frac", "prob"):
+        rows = valid & (category == category_in) & _valid_odds(odds, category_in)
+        profit[rows] = _profit(odds[rows], category_in)
+
+    with np.errstate(invalid="ignore", divide="ignore"):
+        valid &= profit > 0
+        kelly_perc = ((profit * win_prob) - (1 - win_prob)) / profit / kelly_factor
+    kelly_perc[~valid] = np.nan
+
+    return {
+        "kelly": _wrap(_round(kelly_perc, 2), like),
+        "bet_size": _wrap(_round(kelly_perc * unit_size * 100), like),
+        "valid": _wrap(valid, like),
+    }
@@ -1,5 +1,6 @@
-from fractions import Fraction
-from .convert_odds import convert_odds
+import numpy as np
+from ._arrays import _first_array, _is_array, _is_numeric, _round_int, _values, _wrap
+from .odds import Odds, _profit
 
 
 def kelly_bet(
@@ -12,9 +13,9 @@ def kelly_bet(
     Reference: Kelly Criterion wikipedia(https://en.wikipedia.org/wiki/Kelly_criterion) page
 
     Args:
-        unit_size (float): Unit size of your bankroll, typically 1% of bankroll (100)
-        win_prob (float): Win Probability of bet
-        odds (float): Odds or Implied Win Probability for the bet
+        unit_size (float, numpy array, pandas Series): Unit size of your bankroll, typically 1% of bankroll (100)
+        win_prob (float, numpy array, pandas Series): Win Probability of bet
+        odds (float, numpy array, pandas Series): Odds or Implied Win Probability for the bet
         category (str, optional): : type of odds. Defaults to "us". \n
             'us', American Odds \n
             'dec', Decimal Odds \n
@@ -25,12 +26,15 @@ def kelly_bet(
             Defaults to 1.
 
     Returns:
-        int: Optimal bet size to risk on bet based on the kelly criterion and bankroll
+        int: Optimal bet size to risk on bet based on the kelly criterion and bankroll.
+            Array inputs give an array, in the container type of the first array input.
     """
 
-    assert isinstance(unit_size, (int, float)), "unit size must be numeric"
-    assert isinstance(odds, (int, float)), "odds must be numeric"
-    assert win_prob < 1 and win_prob > 0, "Win Prob must be between 0 and 1"
+    assert _is_numeric(unit_size), "unit size must be numeric"
+    assert _is_numeric(odds), "odds must be numeric"
+    assert np.all(
+        (_values(win_prob) < 1) & (_values(win_prob) > 0)
+    ), "Win Prob must be between 0 and 1"
     assert category in [
         "us",
         "frac",
@@ -38,9 +42,19 @@ def kelly_bet(
         "prob",
     ], "input category must be either: ('us', 'dec', 'frac', 'prob')"
 
-    odds = convert_odds(odds, cat_in=category, cat_out="frac")[0]
+    like = _first_array(unit_size, win_prob, odds)
+    if _is_array(odds):
+        odds = _profit(_values(odds), category)
+    else:
+        odds = Odds.from_value(odds, category).profit
+
+    if like is not None:
+        win_prob = _values(win_prob)
+        bet_size = _round_int(
+            ((odds * win_prob) - (1 - win_prob)) / odds / kelly_factor * _values(unit_size) * 100
+        )
+        return _wrap(bet_size, like)
 
-    odds = float(Fraction(odds))
     bets = {"odds": odds, "win_prob": win_prob}
     bet_size = round(
         (
@@ -0,0 +1,84 @@
+import numpy as np
+from ._arrays import _first_array, _is_array, _is_numeric_array, _values, _wrap
+from .odds import _profit, _valid_odds
+
+
+def kelly_exclusive(win_prob, odds, category: str = "us", kelly_factor: int = 1) -> dict:
+    """Mutually Exclusive Kelly Criterion
+    This function calculates the Kelly Criterion percentages of your bankroll to bet on several
+    outcomes of the same event, of which at most one can win (a 3-way market or a futures market).
+
+    Outcomes are taken in order of expected return p * d. An outcome is bet while its expected
+    return beats the reserve rate R = (1 - sum p) / (1 - sum 1 / d) of the outcomes already bet, and
+    every bet outcome gets p - R / d of the bankroll. For a single outcome this is kelly().
+
+    Reference: Smoczynski, P. and Tomkins, D. (2010) An explicit solution to the problem of
+    optimizing the allocations of a bettor's wealth when wagering on horse races.
+
+    Args:
+        win_prob (array-like): Win Probability of every outcome
+        odds (array-like): Odds or Implied Win Probability of every outcome
+        category (str, optional): type of odds. Defaults to "us". \n
+            'us', American Odds \n
+            'dec', Decimal Odds \n
+            'frac', Fractional Odds \n
+            'prob', Implied Probability
+        kelly_factor (int, optional): Kelly Factor is used to shrink the kelly bet sizes.
+            Half kelly (2), Quarter Kelly (4) are common in the sports betting world.
+            Defaults to 1.
+
+    Returns:
+        dictionary: kelly, the percentage of bankroll to risk on every outcome, growth, the
+            expected log growth of the bankroll, and reserve_rate.
+    """
+
+    like = _first_array(win_prob, odds)
+    win_prob, odds = (
+        np.atleast_1d(np.asarray(_values(x) if _is_array(x) else x)) for x in (win_prob, odds)
+    )
+    assert _is_numeric_array(win_prob), "win_prob must be numeric"
+    assert _is_numeric_array(odds), "odds must be numeric"
+    assert win_prob.shape == odds.shape, "win_prob and odds must have the same length"
+    assert category in [
+        "us",
+        "frac",
+        "dec",
+        "prob",
+    ], "input category must be either: ('us', 'dec', 'frac', 'prob')"
+    assert np.all((win_prob >= 0) & (win_prob <= 1)), "Win Prob must be between 0 and 1"
+    assert np.sum(win_prob) <= 1 + 1e-9, "win probabilities must not sum to more than 1"
+    assert np.all(_valid_odds(odds, category)), f"odds must be valid {category} odds"
+    assert kelly_factor > 0, "kelly_factor must be greater than 0"
+
+    dec_odds = _profit(odds.astype(float), category) + 1
+
+    order = np.argsort(-(win_prob * dec_odds), kind="stable")
+    sorted_return = (win_prob * dec_odds)[order]
+    cum_prob = np.cumsum(win_prob[order])
+    cum_inverse = np.cumsum(1 / dec_odds[order])
+
+    # reserve rate after betting the first k + 1 outcomes, and before betting outcome k
+    with np.errstate(divide="ignore", invalid="ignore"):
+        reserve = np.where(cum_inverse < 1, (1 - cum_prob) / (1 - cum_inverse), np.nan)
+    reserve_before = np.concatenate([[1.0], reserve[:-1]])
+    bet = (sorted_return > reserve_before) & (cum_inverse < 1)
+    n_bets = len(bet) if bet.all() else int(np.argmin(bet))
+    reserve_rate = 1.0 if n_bets == 0 else float(reserve[n_bets - 1])
+
+    fractions = np.zeros(len(odds))
+    chosen = order[:n_bets]
+    fractions[chosen] = win_prob[chosen] - reserve_rate / dec_odds[chosen]
+    fractions /= kelly_factor
+
+    # the stake-free remainder wins when none of the listed outcomes does
+    kept = 1 - np.sum(fractions)
+    with np.errstate(divide="ignore"):
+        growth = np.dot(win_prob, np.log(kept + fractions * dec_odds))
+        if 1 - np.sum(win_prob) > 0:
+            growth += (1 - np.sum(win_prob)) * np.log(kept)
+
+    return {
+        "kelly": _wrap(fractions, like),
+        "growth": float(growth),
+        "reserve_rate": reserve_rate,
+    }
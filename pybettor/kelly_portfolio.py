@@ -0,0 +1,280 @@
+import numpy as np
+import warnings
+from ._arrays import _first_array, _is_array, _is_numeric_array, _values, _wrap
+from .odds import _profit, _valid_odds
+
+# step of the trapezoid rule over log t of the expected log growth integral
+_QUADRATURE_STEP = 0.25
+# smallest bankroll left in any outcome, so that the log growth stays finite
+_MIN_WEALTH = 1e-9
+# weight of the log barrier of the caps in the first Newton solve, and its shrink after each one
+_BARRIER_START = 1e-5
+_BARRIER_SHRINK = 10
+# the stakes are optimal to within this much expected log growth, and the last Newton solve
+# polished to within the rounding of the growth integral
+_GROWTH_TOL = 1e-11
+_POLISH_TOL = 1e-16
+_MAX_NEWTON_STEPS = 100
+
+
+def _independent_growth(fractions, win_prob, payout, counts, hessian=True):
+    """Expected log growth of the bankroll, its gradient and its Hessian, for groups of identical
+    independent bets.
+
+    Betting fraction f_g on each of the counts_g bets of group g leaves wealth W = a + sum_i c_i x_i,
+    with a = 1 - sum_i f_i and c_i = f_i d_i. Then E[log W] is the integral over t > 0 of
+    (exp(-t) - E[exp(-t W)]) / t, where E[exp(-t W)] = exp(-t a) prod_i (1 - p_i + p_i exp(-t c_i))
+    is exact for independent bets. The integral is a trapezoid rule over log t, which converges
+    exponentially in the step, so no outcome is enumerated or sampled. The derivatives integrate
+    1 / W and 1 / W ** 2 the same way, under which the bets stay independent and win with
+    probability q_i(t) = p_i exp(-t c_i) / (1 - p_i + p_i exp(-t c_i)).
+    """
+    base = 1 - np.dot(counts, fractions)
+    if base <= 0:
+        return -np.inf, None, None
+
+    stakes = fractions * payout
+    top = base + np.dot(counts, stakes)
+    nodes = np.arange(
+        np.floor(np.log(1e-17 / top) / _QUADRATURE_STEP), np.ceil(np.log(60 / min(base, 1)) / _QUADRATURE_STEP) + 1
+    )
+    t = np.exp(nodes * _QUADRATURE_STEP)
+
+    lost = np.expm1(-t[:, None] * stakes)
+    log_transform = np.log1p(win_prob * lost) @ counts - t * base
+    growth = _QUADRATURE_STEP * np.sum(np.expm1(-t) - np.expm1(log_transform))
+
+    weight = _QUADRATURE_STEP * t * np.exp(log_transform)
+    won = win_prob * (lost + 1) / (1 + win_prob * lost)
+    # the return d_i x_i - 1 of every bet, in expectation at every node
+    returns = counts * (payout * won - 1)
+    gradient = weight @ returns
+    if not hessian:
+        return growth, gradient, None
+
+    # the nodes of small t add nothing to the integral of 1 / W ** 2
+    weight = weight * t
+    kept = weight > 1e-20 * np.max(weight)
+    weight, returns, won = weight[kept], returns[kept], won[kept]
+    hessian = -(returns.T * weight) @ returns
+    hessian[np.diag_indices_from(hessian)] -= counts * payout**2 * (weight @ (won * (1 - won)))
+
+    return growth, gradient, hessian
+
+
+def _growth(fractions, outcomes, weights, payout, hessian=True):
+    """Expected log growth of the bankroll, its gradient and its Hessian.
+
+    Betting fractions f at decimal odds d, scenario s ends with wealth 1 + sum_i f_i (d_i x_si - 1).
+    """
+    returns = outcomes * payout - 1
+    wealth = 1 + returns @ fractions
+    if np.any(wealth <= 0):
+        return -np.inf, None, None
+
+    scaled = weights / wealth
+    growth = np.dot(weights, np.log(wealth))
+    gradient = returns.T @ scaled
+    if not hessian:
+        return growth, gradient, None
+
+    return growth, gradient, -(returns.T * (scaled / wealth)) @ returns
+
+
+def _maximize_growth(growth_of, start, max_bet, counts, max_total):
+    """Stakes of largest growth within the caps, by Newton steps on the growth plus a log barrier
+    of the caps, whose weight shrinks until the stakes are optimal to within _GROWTH_TOL.
+
+    Returns the stakes and whether every Newton solve converged.
+    """
+    free = max_bet > 0
+    fractions = np.zeros(len(max_bet))
+    if not np.any(free):
+        return fractions, True
+    upper, sizes = max_bet[free], counts[free]
+
+    # start strictly inside the caps
+    stakes = np.clip(start[free], upper / 1000, upper * 0.9)
+    stakes *= min(1, max_total * 0.9 / np.dot(sizes, stakes))
+
+    def barrier(stakes, mu, derivatives=True):
+        fractions[free] = stakes
+        growth, gradient, hessian = growth_of(fractions, derivatives)
+        room = max_total - np.dot(sizes, stakes)
+        value = growth + mu * (np.sum(np.log(stakes) + np.log(upper - stakes)) + np.log(room))
+        if not derivatives:
+            return value, None, None
+        gradient = gradient[free] + mu * (1 / stakes - 1 / (upper - stakes) - sizes / room)
+        hessian = hessian[np.ix_(free, free)] - mu * np.outer(sizes, sizes) / room**2
+        hessian[np.diag_indices_from(hessian)] -= mu * (1 / stakes**2 + 1 / (upper - stakes) ** 2)
+        return value, gradient, hessian
+
+    def longest_step(stakes, step):
+        """Largest multiple of step, up to 1, that stays inside the caps."""
+        with np.errstate(divide="ignore"):
+            limits = np.where(step < 0, stakes, upper - stakes) / np.abs(step)
+        limits[step == 0] = np.inf
+        total_step = np.dot(sizes, step)
+        if total_step > 0:
+            limits = np.append(limits, (max_total - np.dot(sizes, stakes)) / total_step)
+        return min(1, 0.99 * np.min(limits))
+
+    mu = _BARRIER_START
+    converged = True
+    while True:
+        last = (2 * len(stakes) + 1) * mu <= _GROWTH_TOL
+        for _ in range(_MAX_NEWTON_STEPS):
+            value, gradient, hessian = barrier(stakes, mu)
+            step = np.linalg.solve(-hessian, gradient)
+            # half the Newton decrement bounds the growth left to gain, polish the last solve further
+            decrement = np.dot(gradient, step)
+            if decrement <= (_POLISH_TOL if last else _GROWTH_TOL):
+                break
+
+            # close to the optimum the full step is taken, further away backtrack until the value rises
+            size = longest_step(stakes, step)
+            while (
+                decrement > _GROWTH_TOL
+                and size > 1e-12
+                and barrier(stakes + size * step, mu, False)[0] < value + size * decrement / 4
+            ):
+                size /= 2
+            stakes = stakes + size * step
+        else:
+            converged = False
+
+        if last:
+            break
+
+        # follow the tangent of the path of optima to the next barrier weight, stakes held off a cap
+        # by the barrier move with it
+        room = max_total - np.dot(sizes, stakes)
+        tangent = np.linalg.solve(-hessian, 1 / stakes - 1 / (upper - stakes) - sizes / room)
+        step = tangent * (mu / _BARRIER_SHRINK - mu)
+        stakes = stakes + longest_step(stakes, step) * step
+        mu /= _BARRIER_SHRINK
+
+    # stakes held off 0 by the barrier are not bets
+    fractions[free] = np.where(stakes <= _GROWTH_TOL, 0, stakes)
+
+    return fractions, converged
+
+
+def kelly_portfolio(
+    win_prob,
+    odds,
+    category: str = "us",
+    kelly_factor: int = 1,
+    max_bet=1.0,
+    max_total: float = 1.0,
+    outcomes=None,
+    weights=None,
+) -> dict:
+    """Simultaneous Kelly Criterion
+    This function sizes bets that are open at the same time by maximizing the expected log growth
+    of the bankroll over all of them together, instead of sizing each bet as if it were the only
+    one open.
+
+    Bets are independent unless a joint distribution of their outcomes is given. The growth of
+    independent bets is computed exactly from the Laplace transform of the bankroll, without
+    enumerating or sampling their outcomes, and identical bets get identical stakes. The stakes
+    always leave some bankroll when every bet loses. The growth is maximized with Newton steps on
+    its exact Hessian inside a log barrier of the caps, so hundreds of bets take a fraction of a
+    second.
+
+    Reference: Kelly Criterion wikipedia(https://en.wikipedia.org/wiki/Kelly_criterion) page
+
+    Args:
+        win_prob (array-like): Win Probability of every bet. Ignored when outcomes is given.
+        odds (array-like): Odds or Implied Win Probability of every bet
+        category (str, optional): type of odds. Defaults to "us". \n
+            'us', American Odds \n
+            'dec', Decimal Odds \n
+            'frac', Fractional Odds \n
+            'prob', Implied Probability
+        kelly_factor (int, optional): Kelly Factor is used to shrink the kelly bet sizes.
+            Half kelly (2), Quarter Kelly (4) are common in the sports betting world.
+            Defaults to 1.
+        max_bet (float, array-like, optional): largest percentage of bankroll on any bet, for all
+            bets or for each bet. Defaults to 1.
+        max_total (float, optional): largest percentage of bankroll on all bets together.
+            Defaults to 1.
+        outcomes (array-like, optional): joint outcomes of the bets, one scenario per row with
+            1 for a win and 0 for a loss. Defaults to None.
+        weights (array-like, optional): probability of every scenario of outcomes.
+            Defaults to equally likely scenarios.
+
+    Returns:
+        dictionary: kelly, the percentage of bankroll to risk on every bet, growth, the expected
+            log growth of the bankroll at those bets, and converged.
+    """
+
+    like = _first_array(win_prob, odds)
+    odds = np.atleast_1d(np.asarray(_values(odds) if _is_array(odds) else odds))
+    assert _is_numeric_array(odds), "odds must be numeric"
+    odds = odds.astype(float)
+    assert category in [
+        "us",
+        "frac",
+        "dec",
+        "prob",
+    ], "input category must be either: ('us', 'dec', 'frac', 'prob')"
+    assert np.all(_valid_odds(odds, category)), f"odds must be valid {category} odds"
+    assert kelly_factor > 0, "kelly_factor must be greater than 0"
+    assert 0 < max_total <= 1, "max_total must be between 0 and 1"
+    max_bet = np.broadcast_to(np.asarray(max_bet, dtype=float), odds.shape)
+    assert np.all((max_bet >= 0) & (max_bet <= 1)), "max_bet must be between 0 and 1"
+
+    payout = _profit(odds, category) + 1
+
+    if outcomes is None:
+        win_prob = np.atleast_1d(np.asarray(_values(win_prob) if _is_array(win_prob) else win_prob))
+        assert _is_numeric_array(win_prob), "win_prob must be numeric"
+        assert win_prob.shape == odds.shape, "win_prob and odds must have the same length"
+        assert np.all((win_prob > 0) & (win_prob < 1)), "Win Prob must be between 0 and 1"
+
+        # identical bets get the same stake, so every group of them is sized once
+        groups, inverse, counts = np.unique(
+            np.column_stack([win_prob, payout, max_bet]), axis=0, return_inverse=True, return_counts=True
+        )
+        win_prob, payout, max_bet = groups.T
+
+        def growth_of(fractions, hessian=True):
+            return _independent_growth(fractions, win_prob, payout, counts, hessian)
+
+    else:
+        outcomes = np.asarray(outcomes)
+        assert outcomes.ndim == 2 and outcomes.shape[1] == len(odds), "outcomes must have a column for every bet"
+        assert np.all((outcomes == 0) | (outcomes == 1)), "outcomes must be 0 or 1"
+        outcomes = outcomes.astype(bool)
+        if weights is None:
+            weights = np.full(len(outcomes), 1 / len(outcomes))
+        weights = np.asarray(weights, dtype=float)
+        assert weights.shape == (len(outcomes),), "weights must have a value for every scenario"
+        assert np.all(weights >= 0), "weights must not be negative"
+        assert np.isclose(np.sum(weights), 1), "weights must sum to 1"
+        win_prob = weights @ outcomes
+        outcomes = outcomes.astype(float)
+        inverse = np.arange(len(odds))
+        counts = np.ones(len(odds))
+
+        def growth_of(fractions, hessian=True):
+            return _growth(fractions, outcomes, weights, payout, hessian)
+
+    # the bets sized one at a time start the search
+    with np.errstate(divide="ignore", invalid="ignore"):
+        start = np.nan_to_num((win_prob * payout - 1) / (payout - 1))
+
+    max_total = min(max_total, 1 - _MIN_WEALTH)
+    fractions, converged = _maximize_growth(growth_of, start, max_bet, counts, max_total)
+    if not converged:
+        warnings.warn("kelly_portfolio did not converge")
+
+    fractions = fractions / kelly_factor
+    growth = growth_of(fractions)[0]
+
+    return {
+        "kelly": _wrap(fractions[inverse.reshape(-1)], like),
+        "growth": float(growth),
+        "converged": converged,
+    }
@@ -0,0 +1,213 @@
+import numpy as np
+import warnings
+from .implied_prob import (
+    _implied_jsd_prob_batch,
+    _implied_odds_ratio_prob_batch,
+    _implied_power_prob_batch,
+    _shin_js_batch,
+    _shin_js_polish_batch,
+    _shin_uniroot_batch,
+    implied_prob,
+)
+from .implied_prob_batch import _naive_prob_batch, _validate_batch
+
+
+class LiveMarket:
+    """Live Market Implied Probability
+    Keeps the implied probabilities of one market up to date as its prices tick.
+
+    The solved parameter (z_value, odds_ratio, exponent or distance) of the last update is kept.
+    The next solve starts from it inside a narrow bracket, and falls back to the full bracket of
+    implied_prob() when the narrow one does not hold the root. Updates that leave the prices
+    unchanged skip the solve entirely. The Jullien-Salanie (shin_method "js") z_value is
+    polished onto the root of its fixed point equation, so it does not depend on earlier updates
+    and can differ from implied_prob() in the fifth decimal.
+
+    Args:
+        odds (list): odds of every outcome of the market
+        category (str, optional): type of odds. Defaults to "us". \n
+            'us', American Odds \n
+            'dec', Decimal Odds \n
+            'frac', Fractional Odds
+        method (str, optional): method to calculate implied probability, see implied_prob().
+            Defaults to "shin".
+        shin_method (str, optional): method to calculate shin implied probability. Defaults to "js".
+        gross_margin (float, optional): gross margin of sportsbook. Defaults to 0.
+        normalize (bool, optional): normalize implied probability to sum to 1. Defaults to True.
+        warm_width (float, optional): relative half width of the warm start bracket. Defaults to 0.25.
+    """
+
+    _solvers = {
+        "odds_ratio": (_implied_odds_ratio_prob_batch, "odds_ratio", (0.05, 5)),
+        "power": (_implied_power_prob_batch, "exponent", (0.0001, 1)),
+        "jsd": (_implied_jsd_prob_batch, "distance", (0.0000001, 0.1)),
+        "uniroot": (_shin_uniroot_batch, "z_value", (0, 0.4)),
+    }
+
+    def __init__(
+        self,
+        odds: list,
+        category: str = "us",
+        method: str = "shin",
+        shin_method: str = "js",
+        gross_margin: float = 0,
+        normalize: bool = True,
+        warm_width: float = 0.25,
+    ):
+        assert category in [
+            "us",
+            "frac",
+            "dec",
+        ], "category must be either: ('us', 'dec', 'frac')"
+        assert method in [
+            "basic",
+            "wpo",
+            "odds_ratio",
+            "power",
+            "additive",
+            "shin",
+            "balanced_book",
+            "jsd",
+        ], "method must be either: ('basic', 'wpo', 'odds_ratio', 'power', 'additive', 'shin', 'balanced_book', 'jsd')"
+        assert warm_width > 0, "warm_width must be greater than 0"
+        if method == "shin" and shin_method == "uniroot" and gross_margin != 0:
+            shin_method = "js"
+            warnings.warn(
+                "gross_margin is not used when shin_method is 'uniroot'. shin_method is set to 'js'."
+            )
+
+        self.category = category
+        self.method = method
+        self.shin_method = shin_method
+        self.gross_margin = gross_margin
+        self.normalize = normalize
+        self.warm_width = warm_width
+
+        self.odds = None
+        self.param = None
+        self.iterations = 0
+        self.solves = 0
+        self.skips = 0
+        self._result = None
+
+        self.update(odds)
+
+    @property
+    def result(self) -> dict:
+        """dict: implied probability of the latest prices, as returned by implied_prob()"""
+        return _copy_result(self._result)
+
+    def update(self, odds: list) -> dict:
+        """Update every price of the market.
+
+        Args:
+            odds (list): odds of every outcome of the market
+
+        Returns:
+            dictionary: implied probability, as returned by implied_prob()
+        """
+        odds = list(odds)
+        if self.odds is not None:
+            assert len(odds) == len(self.odds), "number of outcomes cannot change"
+            if odds == self.odds:
+                self.skips += 1
+                return self.result
+
+        if self.method in ("odds_ratio", "power", "shin", "jsd"):
+            self._result = self._solve(odds)
+        else:
+            self._result = implied_prob(
+                odds,
+                category=self.category,
+                method=self.method,
+                gross_margin=self.gross_margin,
+                normalize=self.normalize,
+            )
+        self.odds = odds
+        self.solves += 1
+
+        return self.result
+
+    def update_price(self, index: int, price) -> dict:
+        """Update the price of a single outcome.
+
+        Args:
+            index (int): position of the outcome in the market
+            price (int, float): new odds of the outcome
+
+        Returns:
+            dictionary: implied probability, as returned by implied_prob()
+        """
+        odds = list(self.odds)
+        odds[index] = price
+
+        return self.update(odds)
+
+    def _solve(self, odds):
+        odds_array = np.array([odds], dtype=float)
+        mask = np.ones(odds_array.shape, dtype=bool)
+        _validate_batch(odds_array, mask, self.category)
+        naive_prob = _naive_prob_batch(odds_array, self.category)
+
+        if self.method == "shin" and self.shin_method == "js":
+            imp_prob, param, iterations, converged = self._polished_js_solve(naive_prob, mask)
+            key = "z_value"
+        else:
+            solver_key = "uniroot" if self.method == "shin" else self.method
+            imp_prob, param, iterations, converged, key = self._warm_solve(
+                *self._solvers[solver_key], naive_prob, mask
+            )
+        if not converged[0]:
+            warnings.warn(f"{self.method} did not converge")
+
+        self.param = param
+        self.iterations = int(iterations[0])
+        imp_prob = imp_prob[0]
+        if self.normalize:
+            imp_prob = imp_prob / np.sum(imp_prob)
+        if np.any(imp_prob < 0) or np.any(imp_prob > 1):
+            warnings.warn("implied probabilities outside of [0,1]")
+
+        return {
+            "naive_prob": naive_prob[0].tolist(),
+            "implied_prob": imp_prob.tolist(),
+            "margin": float(np.sum(naive_prob) - 1),
+            key: float(param[0]),
+        }
+
+    def _warm_solve(self, solver, key, bracket, naive_prob, mask):
+        lower, upper = bracket
+        if self.param is not None and self.param[0] > 0:
+            last = self.param[0]
+            narrow = (
+                max(lower, last / (1 + self.warm_width)),
+                min(upper, last * (1 + self.warm_width)),
+            )
+            result = solver(naive_prob, mask, x0=self.param, bracket=narrow)
+            if not np.isnan(result[1][0]):
+                return (*result, key)
+
+        warm_start = {} if self.param is None else {"x0": self.param}
+        result = solver(naive_prob, mask, bracket=bracket, **warm_start)
+        if np.isnan(result[1][0]):
+            raise ValueError("f(a) and f(b) must have different signs")
+
+        return (*result, key)
+
+    def _polished_js_solve(self, naive_prob, mask):
+        result = _shin_js_batch(naive_prob, mask, self.gross_margin, z_start=self.param)
+        zz = result[1]
+        if not (result[3][0] and zz[0] > 0):
+            return result
+
+        # the fixed point stops within eps**0.25 of the root wherever it started from,
+        # so finish on the root itself to make the result independent of the last update
+        polished = _shin_js_polish_batch(naive_prob, mask, self.gross_margin, zz, self.warm_width)
+        if np.isnan(polished[1][0]):
+            return result
+
+        return polished[0], polished[1], result[2] + polished[2], polished[3]
+
+
+def _copy_result(result):
+    return {k: list(v) if isinstance(v, list) else v for k, v in result.items()}
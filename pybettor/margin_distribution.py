@@ -0,0 +1,179 @@
+import numpy as np
+from ._arrays import _NUMERIC, _first_array, _is_array, _is_numeric_array, _is_whole_array, _values, _wrap
+from .bet_prob import _SPORT_SD
+
+
+def _as_column(x):
+    return np.atleast_1d(np.asarray(_values(x) if _is_array(x) else x))
+
+
+class MarginDistribution:
+    """Margin Distribution
+    Discrete distribution of the final margin of a game, the points of the team bet on minus the
+    points of its opponent, stored as cumulative tables over whole margins. A table is kept for
+    every bucket of pred_spread, or at given pred_spread values that are interpolated between, so
+    the distribution can depend on the predicted spread. Win, lose and push probabilities of any
+    spread are then gathered from the tables.
+
+    Use from_normal() for the normal model of bet_prob() and from_margins() for empirical
+    distributions, which keep the key numbers of a sport.
+
+    Args:
+        cdf (array-like): P(margin <= min_margin + j) of every bucket (buckets x margins)
+        min_margin (int): smallest margin of the tables
+        edges (array-like, optional): sorted pred_spread boundaries between the buckets, bucket i
+            holds pred_spread in [edges[i - 1], edges[i]). Defaults to None for a single bucket.
+        pred_spreads (array-like, optional): sorted pred_spread of every table, used instead of
+            edges. A pred_spread between two of them takes the linear interpolation of their
+            tables, and one outside of them the nearest table. Defaults to None.
+    """
+
+    def __init__(self, cdf, min_margin: int, edges=None, pred_spreads=None):
+        cdf = np.atleast_2d(np.asarray(cdf, dtype=float))
+        assert edges is None or pred_spreads is None, "tables are either bucketed by edges or at pred_spreads"
+        if pred_spreads is not None:
+            pred_spreads = np.asarray(pred_spreads, dtype=float)
+            assert pred_spreads.shape == (len(cdf),), "pred_spreads must have a value for every row of cdf"
+            assert np.all(np.diff(pred_spreads) > 0), "pred_spreads must be increasing"
+        edges = np.zeros(0) if edges is None else np.asarray(edges, dtype=float)
+        assert isinstance(min_margin, (int, np.integer)), "min_margin must be an integer"
+        assert pred_spreads is not None or (
+            edges.ndim == 1 and len(edges) == len(cdf) - 1
+        ), "edges must separate the rows of cdf"
+        assert np.all(np.diff(edges) > 0), "edges must be increasing"
+        assert np.all(np.diff(cdf, axis=1) >= -1e-12), "cdf must be non-decreasing"
+        assert np.all((cdf >= 0) & (cdf <= 1 + 1e-12)), "cdf must be between 0 and 1"
+
+        self.cdf = cdf
+        self.min_margin = int(min_margin)
+        self.edges = edges
+        self.pred_spreads = pred_spreads
+
+    @classmethod
+    def from_normal(cls, sd=None, sport: str = "NBA", pred_spreads=None, max_margin: int = 100) -> "MarginDistribution":
+        """Normal margins discretized to whole points, the model of bet_prob().
+
+        The margin is normal around -pred_spread, and a whole margin m takes the probability
+        between m - 0.5 and m + 0.5, so spreads priced at a pred_spread of pred_spreads agree
+        with bet_prob(). Other pred_spread values interpolate between the two nearest tables.
+
+        Args:
+            sd (float, optional): standard deviation of the final margin. Defaults to None, the
+                standard deviation of sport.
+            sport (str, optional): sport. Defaults to "NBA".
+                Possible values are: "NBA", "NCAAB", "NFL", "NCAAF"
+            pred_spreads (array-like, optional): predicted spreads with a table.
+                Defaults to -30 to +30 in half point steps.
+            max_margin (int, optional): largest absolute margin of the tables. Defaults to 100.
+
+        Returns:
+            MarginDistribution: normal margin distribution
+        """
+
+        if sd is None:
+            assert sport in _SPORT_SD, "sport must be either: ('NBA', 'NCAAB', 'NFL', 'NCAAF')"
+            sd = _SPORT_SD[sport]
+        assert isinstance(sd, _NUMERIC) and sd > 0, "sd must be greater than 0"
+        assert isinstance(max_margin, (int, np.integer)) and max_margin > 0, "max_margin must be a positive integer"
+        if pred_spreads is None:
+            pred_spreads = np.arange(-30, 30.5, 0.5)
+        pred_spreads = np.unique(_as_column(pred_spreads).astype(float))
+
+        from scipy import special
+
+        margins = np.arange(-max_margin, max_margin + 1)
+        cdf = special.ndtr((margins + 0.5 + pred_spreads[:, None]) / sd)
+
+        return cls(cdf, -max_margin, pred_spreads=pred_spreads)
+
+    @classmethod
+    def from_margins(cls, margins, spreads=None, edges=None) -> "MarginDistribution":
+        """Empirical distribution of observed final margins.
+
+        Args:
+            margins (array-like): final margin of every game, the points of the team minus the
+                points of its opponent
+            spreads (array-like, optional): spread of the team in every game, to bucket the games
+                by edges. Defaults to None.
+            edges (array-like, optional): sorted spread boundaries between the buckets.
+                Defaults to None for a single bucket of every game.
+
+        Returns:
+            MarginDistribution: empirical margin distribution
+        """
+
+        margins = _as_column(margins)
+        assert _is_numeric_array(margins) and _is_whole_array(margins), "margins must be whole numbers"
+        margins = margins.astype(np.int64)
+
+        if edges is None:
+            bucket = np.zeros(len(margins), dtype=np.int64)
+            n_buckets = 1
+        else:
+            edges = np.asarray(edges, dtype=float)
+            assert spreads is not None, "spreads must be given to bucket the games by edges"
+            spreads = _as_column(spreads)
+            assert _is_numeric_array(spreads) and spreads.shape == margins.shape, "spreads must be numeric for every game"
+            bucket = np.searchsorted(edges, spreads, side="right")
+            n_buckets = len(edges) + 1
+
+        min_margin = int(margins.min())
+        counts = np.zeros((n_buckets, margins.max() - min_margin + 1))
+        np.add.at(counts, (bucket, margins - min_margin), 1)
+        totals = counts.sum(axis=1)
+        assert np.all(totals > 0), "every bucket must hold at least one game"
+
+        return cls(np.cumsum(counts, axis=1) / totals[:, None], min_margin, edges)
+
+    def _rows(self, pred_spread):
+        """Tables of every pred_spread, as two rows and the weight of the second one."""
+        if self.pred_spreads is None:
+            rows = np.searchsorted(self.edges, pred_spread, side="right")
+            return rows, rows, np.zeros(pred_spread.shape)
+
+        position = np.interp(pred_spread, self.pred_spreads, np.arange(len(self.pred_spreads)))
+        rows = np.floor(position).astype(np.int64)
+        return rows, np.minimum(rows + 1, len(self.pred_spreads) - 1), position - rows
+
+    def _cdf_at(self, rows, margins):
+        """P(margin <= margins) gathered from the tables of rows."""
+        lower, upper, weight = rows
+        columns = margins - self.min_margin
+        inside = np.clip(columns, 0, self.cdf.shape[1] - 1).astype(np.int64)
+        cdf = self.cdf[lower, inside] + weight * (self.cdf[upper, inside] - self.cdf[lower, inside])
+        return np.where(columns < 0, 0.0, cdf)
+
+    def bet_prob(self, pred_spread, spread) -> dict:
+        """Win, lose and push probabilities of spreads.
+
+        Args:
+            pred_spread (float, array-like): predicted spread, which selects the table
+            spread (float, array-like): spread of the team bet on
+
+        Returns:
+            dictionary: win_prob, lose_prob and push_prob, floats for numbers and arrays for
+                array-like input
+        """
+
+        like = _first_array(pred_spread, spread)
+        scalar = isinstance(pred_spread, _NUMERIC) and isinstance(spread, _NUMERIC)
+        pred_spread, spread = _as_column(pred_spread), _as_column(spread)
+        assert _is_numeric_array(pred_spread), "pred_spread must be numeric"
+        assert _is_numeric_array(spread), "spread must be numeric"
+        pred_spread, spread = np.broadcast_arrays(pred_spread.astype(float), spread.astype(float))
+        assert np.all(np.isfinite(pred_spread)), "pred_spread must be finite"
+        assert np.all(np.isfinite(spread)), "spread must be finite"
+
+        # the bet wins when margin + spread > 0 and pushes when it is 0
+        rows = self._rows(pred_spread)
+        lose_prob = self._cdf_at(rows, np.ceil(-spread) - 1)
+        win_prob = 1 - self._cdf_at(rows, np.floor(-spread))
+        push_prob = np.where(spread % 1 == 0, 1 - win_prob - lose_prob, 0)
+
+        if scalar:
+            return {"win_prob": float(win_prob[0]), "lose_prob": float(lose_prob[0]), "push_prob": float(push_prob[0])}
+        return {
+            "win_prob": _wrap(win_prob, like),
+            "lose_prob": _wrap(lose_prob, like),
+            "push_prob": _wrap(push_prob, like),
+        }
@@ -0,0 +1,136 @@
+from fractions import Fraction
+import numpy as np
+from ._arrays import _INTEGER, _NUMERIC
+
+
+class Odds:
+    """Odds Value
+    Numeric odds of a single bet, kept as decimal odds and, when they are known exactly, as a
+    rational number. American odds and fractions are exact, so no precision is lost to a
+    limited denominator before the odds are used. Strings are only produced by fraction().
+
+    Args:
+        decimal (float): decimal odds
+        exact (Fraction, optional): exact decimal odds. Defaults to None.
+    """
+
+    __slots__ = ("decimal", "exact")
+
+    def __init__(self, decimal: float, exact: Fraction = None):
+        self.decimal = float(decimal) if exact is None else float(exact)
+        self.exact = exact
+
+    @classmethod
+    def from_value(cls, odds, category: str = "us") -> "Odds":
+        """Odds of a price in any category.
+
+        Args:
+            odds (int, float, Fraction): odds or implied probability of the bet
+            category (str, optional): type of odds. Defaults to "us". \n
+                'us', American Odds \n
+                'dec', Decimal Odds \n
+                'frac', Fractional Odds \n
+                'prob', Implied Probability
+
+        Returns:
+            Odds: odds of the bet
+        """
+
+        assert isinstance(odds, _NUMERIC + (Fraction,)), "odds must be numeric"
+        assert category in [
+            "us",
+            "frac",
+            "dec",
+            "prob",
+        ], "input category must be either: ('us', 'dec', 'frac', 'prob')"
+        exact = Fraction(odds) if isinstance(odds, _INTEGER + (Fraction,)) else None
+
+        if category == "us":
+            assert odds <= -100 or odds >= 100, "us odds cannot be between -99 and 99"
+            if exact is not None:
+                exact = 1 - 100 / exact if odds <= -100 else 1 + exact / 100
+            return cls(-100 / odds + 1 if odds <= -100 else odds / 100 + 1, exact)
+        elif category == "dec":
+            assert odds >= 1, "dec odds must be greater than 1"
+            return cls(odds, exact)
+        elif category == "frac":
+            assert odds > 0, "frac odds must be greater than 0"
+            return cls(odds + 1, None if exact is None else exact + 1)
+        else:
+            assert 0 < odds < 1, "probability must be between 0 and 1"
+            return cls(1 / odds, None if exact is None else 1 / exact)
+
+    @property
+    def profit(self) -> float:
+        """float: profit per unit staked, the fractional odds as a number"""
+        if self.exact is not None:
+            return float(self.exact - 1)
+        return self.decimal - 1
+
+    @property
+    def prob(self) -> float:
+        """float: implied probability"""
+        return 1 / self.decimal
+
+    @property
+    def american(self) -> int:
+        """int: American odds"""
+        profit = self.profit
+        return round(profit * 100 if profit >= 1 else -100 / profit)
+
+    def fraction(self, max_denominator: int = 100) -> str:
+        """Fractional odds as a 'numerator/denominator' string.
+
+        Args:
+            max_denominator (int, optional): largest denominator of the fraction. Defaults to 100.
+
+        Returns:
+            str: fractional odds
+        """
+        if self.exact is not None:
+            frac = (self.exact - 1).limit_denominator(max_denominator)
+        else:
+            frac = Fraction(self.profit).limit_denominator(max_denominator)
+        return f"{frac.numerator}/{frac.denominator}"
+
+    def __repr__(self):
+        if self.exact is not None:
+            return f"Odds({self.decimal!r}, exact={self.exact!r})"
+        return f"Odds({self.decimal!r})"
+
+    def __eq__(self, other):
+        if not isinstance(other, Odds):
+            return NotImplemented
+        return self.decimal == other.decimal
+
+    def __hash__(self):
+        return hash(self.decimal)
+
+
+def _profit(odds, category):
+    """Profit per unit staked of an array of odds, computed directly from the odds."""
+    if category == "us":
+        assert not np.any((odds > -100) & (odds < 100)), "us odds cannot be between -99 and 99"
+        return np.where(odds <= -100, -100 / odds, odds / 100)
+    elif category == "dec":
+        assert np.all(odds >= 1), "dec odds must be greater than 1"
+        return odds - 1
+    elif category == "frac":
+        assert np.all(odds > 0), "frac odds must be greater than 0"
+        return np.asarray(odds, dtype=float)
+    else:
+        assert np.all((odds > 0) & (odds < 1)), "probability must be between 0 and 1"
+        return 1 / odds - 1
+
+
+def _valid_odds(odds, category):
+    """Mask of the odds that are valid prices of category."""
+    with np.errstate(invalid="ignore"):
+        if category == "us":
+            return (odds <= -100) | (odds >= 100)
+        elif category == "dec":
+            return odds >= 1
+        elif category == "frac":
+            return odds > 0
+        else:
+            return (odds > 0) & (odds < 1)
@@ -0,0 +1,79 @@
+import threading
+import numpy as np
+
+
+class _OddsTable:
+    def __init__(self):
+        # row i holds the price i - max_odds, so the table has 2 * max_odds + 1 rows
+        self.rows = None
+        self._lock = threading.Lock()
+
+
+_table = _OddsTable()
+
+
+def enable_odds_table(max_odds: int = 100000) -> None:
+    """Enable American Odds Table
+    Precomputes the decimal odds, implied probability and fraction of every whole American price
+    from +/-100 to +/-max_odds. convert_odds() and implied_prob() then look American odds up in
+    the table instead of computing them, and compute any odds outside of it as before.
+
+    Args:
+        max_odds (int, optional): largest American price in the table. Defaults to 100000.
+    """
+
+    assert isinstance(max_odds, int), "max_odds must be an integer"
+    assert max_odds >= 100, "max_odds must be at least 100"
+
+    with _table._lock:
+        if _table.rows is None or len(_table.rows) != 2 * max_odds + 1:
+            _table.rows = _build_table(max_odds)
+
+
+def disable_odds_table() -> None:
+    """Disable American Odds Table
+    Stops looking up American odds and frees the table.
+    """
+
+    with _table._lock:
+        _table.rows = None
+
+
+def _build_table(max_odds):
+    from .convert_odds import _TABLE_DTYPE, _convert_all_chunk
+
+    # prices between -100 and 100 are never looked up
+    odds = np.arange(-max_odds, max_odds + 1, dtype=float)
+    odds[np.abs(odds) < 100] = 100
+    rows = np.empty(len(odds), dtype=_TABLE_DTYPE)
+    _convert_all_chunk(odds, "us", rows)
+
+    return rows
+
+
+def _lookup_us_odds(odds, field, compute):
+    """Table field of American odds, computing odds outside of the table with compute.
+
+    field may be a tuple of fields, compute then returns an array for each of them. Every element
+    is computed while the table is disabled.
+    """
+    rows = _table.rows
+    if rows is None:
+        return compute(odds)
+
+    max_odds = (len(rows) - 1) // 2
+    odds = np.asarray(odds, dtype=float)
+    with np.errstate(invalid="ignore"):
+        in_table = (np.abs(odds) >= 100) & (np.abs(odds) <= max_odds) & (odds == np.round(odds))
+    index = np.where(in_table, odds + max_odds, 0).astype(np.int64)
+
+    fields = field if isinstance(field, tuple) else (field,)
+    values = tuple(rows[name][index] for name in fields)
+    missing = ~in_table
+    if np.any(missing):
+        computed = compute(odds[missing])
+        computed = computed if isinstance(field, tuple) else (computed,)
+        for column, column_computed in zip(values, computed):
+            column[missing] = column_computed
+
+    return values if isinstance(field, tuple) else values[0]
@@ -1,3 +1,4 @@
+from ._arrays import _all_numeric, _is_array
 from .implied_prob import implied_prob
 
 
@@ -7,7 +8,7 @@ def over_round(lines, category: str = "us") -> float:
     from each line of the bet, known as the House Edge or Over Round.
 
     Args:
-        lines List[float]: Win Probability of bet [-115, -105]
+        lines List[float], numpy array, pandas Series: Win Probability of bet [-115, -105]
         category (str, optional): type of odds. Defaults to "us". \n
             'us', American Odds \n
             'dec', Decimal Odds \n
@@ -19,11 +20,10 @@ def over_round(lines, category: str = "us") -> float:
         float: Bet's Over Round percent
     """
 
-    if type(lines) is not list:
+    if type(lines) is not list and not _is_array(lines):
         lines = [lines]
 
-    assert all(isinstance(x, (int, float))
-               for x in lines), "odds must be numeric"
+    assert _all_numeric(lines), "odds must be numeric"
     assert category in [
         "us",
         "frac",
@@ -0,0 +1,87 @@
+import numpy as np
+from ._arrays import _first_array, _is_array, _is_numeric_array, _values, _wrap
+from .implied_odds import implied_odds
+
+
+def _as_column(x):
+    return np.atleast_1d(np.asarray(_values(x) if _is_array(x) else x))
+
+
+def _count_cdf(counts, mean, dispersion):
+    """P(X <= counts) of Poisson counts, or negative binomial counts of finite dispersion."""
+    from scipy import special
+
+    below = counts < 0
+    counts = np.maximum(counts, 0)
+    poisson = np.isinf(dispersion)
+    cdf = np.empty(counts.shape)
+    cdf[poisson] = special.pdtr(counts[poisson], mean[poisson])
+    size = dispersion[~poisson]
+    cdf[~poisson] = special.betainc(size, counts[~poisson] + 1, size / (size + mean[~poisson]))
+
+    return np.where(below, 0.0, cdf)
+
+
+def _fair_odds(prob, category):
+    fair_odds = np.full(prob.shape, np.nan)
+    priced = (prob > 0) & (prob < 1)
+    if np.any(priced):
+        fair_odds[priced] = implied_odds(prob[priced], category=category)
+    return fair_odds
+
+
+def over_under_prob(mean, line, dispersion=None, category: str = "us") -> dict:
+    """Over Under Probability
+    This function prices the over and under of totals and player props (goals, shots, strikeouts)
+    from a projected mean, for many props in a single call. Counts are Poisson, or negative
+    binomial with variance mean + mean ** 2 / dispersion for overdispersed counts. A whole number
+    line pushes when the count lands on it.
+
+    The CDFs are the regularized incomplete gamma and beta functions of scipy.special, evaluated
+    for every prop at once.
+
+    Args:
+        mean (float, array-like): projected mean of every prop
+        line (float, array-like): total or prop line of every prop
+        dispersion (float, array-like, optional): negative binomial dispersion of every prop, inf
+            for a Poisson prop. Defaults to None, Poisson for every prop.
+        category (str, optional): type of fair odds. Defaults to "us". \n
+            'us', American Odds \n
+            'dec', Decimal Odds
+
+    Returns:
+        dictionary: over_prob, under_prob, push_prob, and over_fair_odds and under_fair_odds, the
+            odds at which each side breaks even.
+            pandas Series inputs give Series with the index of the first Series.
+    """
+
+    like = _first_array(mean, line, dispersion)
+    mean, line = _as_column(mean), _as_column(line)
+    assert _is_numeric_array(mean), "mean must be numeric"
+    assert _is_numeric_array(line), "line must be numeric"
+    assert np.all(mean > 0), "mean must be greater than 0"
+    if dispersion is None:
+        dispersion = np.inf
+    dispersion = _as_column(dispersion)
+    assert _is_numeric_array(dispersion), "dispersion must be numeric"
+    assert np.all(dispersion > 0), "dispersion must be greater than 0"
+    assert category in ["us", "dec"], "category must be either: ('us', 'dec')"
+
+    mean, line, dispersion = np.broadcast_arrays(mean.astype(float), line.astype(float), dispersion.astype(float))
+
+    # the over wins above floor(line) and the under wins below ceil(line)
+    under_prob = _count_cdf(np.ceil(line) - 1, mean, dispersion)
+    over_prob = 1 - _count_cdf(np.floor(line), mean, dispersion)
+    push_prob = np.where(line % 1 == 0, 1 - over_prob - under_prob, 0)
+
+    # a push returns the stake, so each side breaks even at its odds of winning a decided bet
+    with np.errstate(invalid="ignore"):
+        over_decided = over_prob / (over_prob + under_prob)
+
+    return {
+        "over_prob": _wrap(over_prob, like),
+        "under_prob": _wrap(under_prob, like),
+        "push_prob": _wrap(push_prob, like),
+        "over_fair_odds": _wrap(_fair_odds(over_decided, category), like),
+        "under_fair_odds": _wrap(_fair_odds(1 - over_decided, category), like),
+    }
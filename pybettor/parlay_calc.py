@@ -1,4 +1,5 @@
 import numpy as np
+from ._arrays import _all_numeric, _is_array
 from .convert_odds import convert_odds
 
 
@@ -8,7 +9,7 @@ def parlay_calc(risk: float = 100.0, odds=[-110, -110], category: str = "us") ->
 
     Args:
         risk (float): Risk of parlay bet
-        odds (list): odds of each leg of the parlay bet
+        odds (list, numpy array, pandas Series): odds of each leg of the parlay bet
         category (str, optional): type of odds. Defaults to "us". \n
             'us', American Odds \n
             'dec', Decimal Odds \n
@@ -18,10 +19,10 @@ def parlay_calc(risk: float = 100.0, odds=[-110, -110], category: str = "us") ->
         float: Parlay payout
     """
 
-    if type(odds) is not list:
+    if type(odds) is not list and not _is_array(odds):
         odds = [odds]
 
-    assert all(isinstance(x, (int, float)) for x in odds), "odds must be numeric"
+    assert _all_numeric(odds), "odds must be numeric"
     assert category in [
         "us",
         "frac",
@@ -0,0 +1,125 @@
+import itertools
+import numpy as np
+from .convert_odds import convert_odds
+from .implied_prob_batch import _pad_markets, implied_prob_batch
+
+
+def _pad_parlays(parlays):
+    """Market and outcome of every leg as (parlays x legs) matrices with a validity mask."""
+    if isinstance(parlays, np.ndarray):
+        assert parlays.ndim == 3 and parlays.shape[2] == 2, "parlays must be (parlays x legs x 2)"
+        assert np.issubdtype(parlays.dtype, np.integer), "parlays must hold integer indices"
+        return parlays[:, :, 0], parlays[:, :, 1], np.ones(parlays.shape[:2], dtype=bool)
+
+    lengths = np.array([len(parlay) for parlay in parlays])
+    assert len(lengths) > 0 and np.all(lengths > 0), "every parlay must have at least one leg"
+    flat = np.fromiter(itertools.chain.from_iterable(itertools.chain.from_iterable(parlays)), dtype=np.int64)
+    assert len(flat) == 2 * lengths.sum(), "every leg must be a (market, outcome) pair"
+
+    mask = np.arange(lengths.max()) < lengths[:, None]
+    market = np.zeros(mask.shape, dtype=np.int64)
+    outcome = np.zeros(mask.shape, dtype=np.int64)
+    market[mask] = flat[0::2]
+    outcome[mask] = flat[1::2]
+
+    return market, outcome, mask
+
+
+def parlay_ev(
+    markets,
+    parlays,
+    category: str = "us",
+    method: str = "basic",
+    offsets=None,
+    risk: float = 100,
+    shin_method: str = "js",
+    gross_margin: float = 0,
+) -> dict:
+    """Parlay Expected Value
+    This function evaluates many candidate parlays against the true probabilities of their legs.
+    Every leg is an outcome of a market, priced at its odds in that market. Each unique market is
+    de-vigged once with implied_prob_batch(), and the true probability of a parlay is the product of
+    the true probabilities of its legs.
+
+    Args:
+        markets (array-like): odds of every market. Either a 2-D array with one market per row,
+            or a flat 1-D array of all outcomes when offsets is given
+        parlays (list, numpy array): legs of every parlay as (market, outcome) index pairs, a list
+            of lists of pairs or a (parlays x legs x 2) integer array
+        category (str, optional): type of odds. Defaults to "us". \n
+            'us', American Odds \n
+            'dec', Decimal Odds \n
+            'frac', Fractional Odds
+        method (str, optional): method to de-vig the markets, see implied_prob_batch().
+            Defaults to "basic".
+        offsets (array-like, optional): market boundaries into a flat markets array, market i spans
+            markets[offsets[i]:offsets[i + 1]]. Defaults to None.
+        risk (float, optional): Risk of each parlay bet. Defaults to 100.
+        shin_method (str, optional): method to calculate shin implied probability. Defaults to "js".
+        gross_margin (float, optional): gross margin of sportsbook. Defaults to 0.
+
+    Returns:
+        dictionary: for every parlay, true_prob, fair_odds in category (strings for 'frac'), dec_odds and payout
+            (as parlay_calc()) of the parlay price, ev (as expected_value_calc()) and break_even
+            (as break_even()).
+    """
+
+    assert method != "naive", "method must de-vig the markets, naive probabilities keep the margin"
+    assert risk > 0, "risk must be greater than 0"
+    odds, mask = _pad_markets(markets, offsets)
+
+    # de-vig each unique market once
+    odds = np.where(mask, odds, 0)
+    width = odds.shape[1]
+    unique_markets, inverse = np.unique(np.column_stack([odds, mask]), axis=0, return_inverse=True)
+    inverse = inverse.reshape(-1)
+    unique_odds, unique_mask = unique_markets[:, :width], unique_markets[:, width:].astype(bool)
+    counts = unique_mask.sum(axis=1)
+    unique_offsets = np.concatenate([[0], np.cumsum(counts)])
+    devigged = implied_prob_batch(
+        unique_odds[unique_mask],
+        category,
+        method,
+        offsets=unique_offsets,
+        shin_method=shin_method,
+        gross_margin=gross_margin,
+    )
+    true_prob = np.zeros(unique_odds.shape)
+    true_prob[unique_mask] = devigged["implied_prob"]
+
+    dec_odds = np.ones(unique_odds.shape)
+    if category == "dec":
+        dec_odds[unique_mask] = unique_odds[unique_mask]
+    else:
+        dec_odds[unique_mask] = convert_odds(unique_odds[unique_mask], cat_in=category, cat_out="dec")
+
+    market, outcome, legs = _pad_parlays(parlays)
+    assert np.all((market >= 0) & (market < len(odds))), "parlay markets must be indices of markets"
+    row = inverse[market]
+    assert np.all(~legs | ((outcome >= 0) & (outcome < counts[row]))), "parlay outcomes must be in their market"
+    # legs of one market exclude each other, so a parlay takes at most one of them
+    leg_markets = np.sort(np.where(legs, market, -1 - np.arange(legs.shape[1])), axis=1)
+    assert np.all(np.diff(leg_markets, axis=1) != 0), "parlay legs must be from different markets"
+
+    parlay_prob = np.prod(np.where(legs, true_prob[row, outcome], 1), axis=1)
+    parlay_dec = np.ones(len(legs))
+    for column in range(legs.shape[1]):
+        parlay_dec = np.where(legs[:, column], parlay_dec * dec_odds[row[:, column], outcome[:, column]], parlay_dec)
+    payout = np.round(parlay_dec * risk, 2) - risk
+
+    # parlays with a leg the method could not de-vig have no fair odds
+    priced = (parlay_prob > 0) & (parlay_prob < 1)
+    fair_odds = np.full(len(legs), np.nan, dtype=object if category == "frac" else float)
+    if category == "dec":
+        fair_odds[priced] = 1 / parlay_prob[priced]
+    elif np.any(priced):
+        fair_odds[priced] = convert_odds(parlay_prob[priced], cat_in="prob", cat_out=category)
+
+    return {
+        "true_prob": parlay_prob,
+        "fair_odds": fair_odds,
+        "dec_odds": parlay_dec,
+        "payout": payout,
+        "ev": parlay_prob * payout - (1 - parlay_prob) * risk,
+        "break_even": risk / (risk + payout),
+    }
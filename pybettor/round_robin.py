@@ -0,0 +1,137 @@
+import itertools
+import math
+import numpy as np
+from ._arrays import _all_numeric, _is_array, _values
+from .convert_odds import convert_odds
+
+# every 2**n outcome of the legs is enumerated up to this many legs
+_MAX_ENUMERATED_LEGS = 12
+
+
+def _decimal_legs(odds, category):
+    """Decimal odds of every leg, converted once as parlay_calc() converts them."""
+    if type(odds) is not list and not _is_array(odds):
+        odds = [odds]
+
+    assert _all_numeric(odds), "odds must be numeric"
+    assert category in [
+        "us",
+        "frac",
+        "dec",
+    ], "category must be either: ('us', 'dec', 'frac')"
+
+    values = _values(odds) if _is_array(odds) else np.array(odds)
+    if category == "dec":
+        assert np.all(values >= 1), "dec odds must be greater than 1"
+        return values.astype(float)
+    return np.asarray(convert_odds(values, cat_in=category, cat_out="dec"), dtype=float)
+
+
+def _check_sizes(sizes, n_legs):
+    sizes = sorted({sizes} if isinstance(sizes, int) else set(sizes))
+    assert len(sizes) > 0, "sizes must not be empty"
+    assert all(isinstance(k, int) and 1 <= k <= n_legs for k in sizes), "sizes must be between 1 and the number of legs"
+    return sizes
+
+
+def round_robin_parlays(
+    risk: float = 100.0, odds=[-110, -110, -110], sizes=2, category: str = "us", block_size: int = 65536
+):
+    """Round Robin Parlays
+    This generator calculates the payout of every parlay of a round robin, the k leg parlays of
+    every combination of the legs for each size k. Legs are converted to decimal odds once and the
+    payouts of a block of parlays are computed together, so only one block is held in memory.
+
+    Args:
+        risk (float): Risk of each parlay bet
+        odds (list, numpy array, pandas Series): odds of each leg
+        sizes (int, list, optional): number of legs of the parlays, one or several. Defaults to 2.
+        category (str, optional): type of odds. Defaults to "us". \n
+            'us', American Odds \n
+            'dec', Decimal Odds \n
+            'frac', Fractional Odds
+        block_size (int, optional): number of parlays per block. Defaults to 65536.
+
+    Yields:
+        dictionary: legs, the leg indices of every parlay in the block (parlays x size), and payout,
+            the parlay_calc() payout of every parlay in the block.
+    """
+
+    dec_odds = _decimal_legs(odds, category)
+    sizes = _check_sizes(sizes, len(dec_odds))
+    assert isinstance(block_size, int) and block_size > 0, "block_size must be a positive integer"
+
+    for k in sizes:
+        combinations = itertools.combinations(range(len(dec_odds)), k)
+        while True:
+            flat = itertools.chain.from_iterable(itertools.islice(combinations, block_size))
+            legs = np.fromiter(flat, dtype=np.int64).reshape(-1, k)
+            if len(legs) == 0:
+                break
+
+            total_odds = dec_odds[legs[:, 0]]
+            for column in range(1, k):
+                total_odds = total_odds * dec_odds[legs[:, column]]
+            yield {"legs": legs, "payout": np.round(total_odds * risk, 2) - risk}
+
+
+def round_robin(
+    risk: float = 100.0, odds=[-110, -110, -110], sizes=2, category: str = "us", outcomes=None
+) -> dict:
+    """Round Robin
+    This function calculates the totals of a round robin, the k leg parlays of every combination of
+    the legs for each size k, without enumerating its parlays.
+
+    The return of a scenario of outcomes is risk times the elementary symmetric polynomial of
+    degree k of the decimal odds of the winning legs, summed over the sizes, so it costs
+    n_legs * k operations however many parlays there are. Scenario payouts are not rounded to cents
+    parlay by parlay. Use round_robin_parlays() for the payout of every parlay.
+
+    Args:
+        risk (float): Risk of each parlay bet
+        odds (list, numpy array, pandas Series): odds of each leg
+        sizes (int, list, optional): number of legs of the parlays, one or several. Defaults to 2.
+        category (str, optional): type of odds. Defaults to "us". \n
+            'us', American Odds \n
+            'dec', Decimal Odds \n
+            'frac', Fractional Odds
+        outcomes (array-like, optional): scenarios of outcomes, one per row with 1 for a winning leg
+            and 0 for a losing leg. Defaults to every scenario for up to 12 legs, and None beyond.
+
+    Returns:
+        dictionary: n_parlays, total_risk, max_payout (every leg wins), outcomes and payout, the
+            profit of the whole round robin in every scenario of outcomes.
+    """
+
+    dec_odds = _decimal_legs(odds, category)
+    sizes = _check_sizes(sizes, len(dec_odds))
+    n_legs = len(dec_odds)
+
+    n_parlays = sum(math.comb(n_legs, k) for k in sizes)
+    total_risk = risk * n_parlays
+
+    def scenario_payout(wins):
+        # symmetric[:, j] is the sum over the j leg combinations of the winning legs
+        symmetric = np.zeros((len(wins), sizes[-1] + 1))
+        symmetric[:, 0] = 1
+        for leg in range(n_legs):
+            won = np.where(wins[:, leg], dec_odds[leg], 0)
+            for j in range(min(leg + 1, sizes[-1]), 0, -1):
+                symmetric[:, j] += won * symmetric[:, j - 1]
+        return risk * symmetric[:, sizes].sum(axis=1) - total_risk
+
+    if outcomes is None and n_legs <= _MAX_ENUMERATED_LEGS:
+        outcomes = np.array(list(itertools.product([0, 1], repeat=n_legs)), dtype=bool).reshape(-1, n_legs)
+    if outcomes is not None:
+        outcomes = np.asarray(outcomes)
+        assert outcomes.ndim == 2 and outcomes.shape[1] == n_legs, "outcomes must have a column for every leg"
+        assert np.all((outcomes == 0) | (outcomes == 1)), "outcomes must be 0 or 1"
+        outcomes = outcomes.astype(bool)
+
+    return {
+        "n_parlays": n_parlays,
+        "total_risk": total_risk,
+        "max_payout": float(scenario_payout(np.ones((1, n_legs), dtype=bool))[0]),
+        "outcomes": outcomes,
+        "payout": None if outcomes is None else scenario_payout(outcomes),
+    }
@@ -0,0 +1,194 @@
+import functools
+import numpy as np
+from ._arrays import _NUMERIC, _is_array, _is_numeric_array, _values
+from .implied_odds import implied_odds
+
+
+def _as_column(x):
+    return np.atleast_1d(np.asarray(_values(x) if _is_array(x) else x))
+
+
+def _poisson_pmf(mean, max_goals):
+    ratios = np.concatenate([[1.0], mean / np.arange(1, max_goals + 1)])
+    return np.exp(-mean) * np.cumprod(ratios)
+
+
+@functools.lru_cache(maxsize=4096)
+def _cached_matrix(home_xg, away_xg, rho, max_goals):
+    matrix = np.outer(_poisson_pmf(home_xg, max_goals), _poisson_pmf(away_xg, max_goals))
+
+    # Dixon-Coles adjustment of the low scores
+    matrix[0, 0] *= 1 - home_xg * away_xg * rho
+    matrix[0, 1] *= 1 + home_xg * rho
+    matrix[1, 0] *= 1 + away_xg * rho
+    matrix[1, 1] *= 1 - rho
+
+    matrix /= matrix.sum()
+    matrix.setflags(write=False)
+
+    return matrix
+
+
+def scoreline_matrix(home_xg: float, away_xg: float, rho: float = 0, max_goals: int = 15) -> np.ndarray:
+    """Scoreline Matrix
+    This function calculates the probability of every correct score of a soccer match from the
+    expected goals of both teams. Goals are independent Poisson counts, with the Dixon-Coles
+    adjustment of the 0-0, 1-0, 0-1 and 1-1 scores when rho is not 0. Scores above max_goals are
+    left out and the matrix is normalized to sum to 1.
+
+    Matrices are cached per (home_xg, away_xg, rho, max_goals), and are read only.
+
+    Reference: Dixon, M. and Coles, S. (1997) Modelling Association Football Scores and
+    Inefficiencies in the Football Betting Market.
+
+    Args:
+        home_xg (float): expected goals of the home team
+        away_xg (float): expected goals of the away team
+        rho (float, optional): Dixon-Coles dependence of the low scores. Defaults to 0.
+        max_goals (int, optional): most goals of a team in the matrix. Defaults to 15.
+
+    Returns:
+        numpy array: probability of home_goals (rows) against away_goals (columns)
+    """
+
+    assert isinstance(home_xg, _NUMERIC) and home_xg > 0, "home_xg must be greater than 0"
+    assert isinstance(away_xg, _NUMERIC) and away_xg > 0, "away_xg must be greater than 0"
+    assert isinstance(rho, _NUMERIC), "rho must be numeric"
+    assert isinstance(max_goals, int) and max_goals >= 1, "max_goals must be a positive integer"
+    assert (
+        1 - home_xg * away_xg * rho >= 0 and 1 + home_xg * rho >= 0 and 1 + away_xg * rho >= 0 and rho <= 1
+    ), "rho must keep the adjusted scores non-negative"
+
+    return _cached_matrix(float(home_xg), float(away_xg), float(rho), max_goals)
+
+
+def _fair_odds(outcomes, category, margin):
+    """Odds of every outcome of markets whose outcome probabilities sum to 1, with margin added."""
+    prob = np.stack(outcomes)
+    fair_odds = np.full(prob.shape, np.nan)
+    priced = (prob > 0) & (prob < 1)
+    if np.any(priced):
+        fair_odds[priced] = implied_odds(
+            prob[priced], category=category, method="basic", margin=margin, normalize=False
+        )
+    return tuple(fair_odds)
+
+
+def _line_probs(distribution, lines, offset):
+    """Above, below and exactly on lines of discrete distributions over offset + column."""
+    cdf = np.cumsum(distribution, axis=1)
+
+    def cdf_at(values):
+        columns = (values - offset).astype(np.int64)
+        inside = np.clip(columns, 0, cdf.shape[1] - 1)
+        return np.where(columns < 0, 0.0, cdf[:, inside])
+
+    below = cdf_at(np.ceil(lines) - 1)
+    above = 1 - cdf_at(np.floor(lines))
+    on_line = np.where(lines % 1 == 0, 1 - above - below, 0)
+
+    return above, below, on_line
+
+
+def soccer_markets(
+    home_xg,
+    away_xg,
+    rho=0,
+    total_lines=[2.5],
+    handicap_lines=[-0.5, 0, 0.5],
+    max_goals: int = 15,
+    margin: float = 0,
+    category: str = "us",
+) -> dict:
+    """Soccer Markets
+    This function prices the markets of soccer matches from the expected goals of both teams. The
+    scoreline_matrix() of every match is built once, and 1X2, totals, both teams to score, Asian
+    handicaps and correct score are all summed from it. Whole number lines push. Fair odds come
+    from implied_odds() with the margin added.
+
+    Args:
+        home_xg (float, array-like): expected goals of the home team of every match
+        away_xg (float, array-like): expected goals of the away team of every match
+        rho (float, array-like, optional): Dixon-Coles dependence of every match. Defaults to 0.
+        total_lines (list, optional): total goals lines. Defaults to [2.5].
+        handicap_lines (list, optional): Asian handicap lines of the home team, in whole or half
+            goals. Defaults to [-0.5, 0, 0.5].
+        max_goals (int, optional): most goals of a team in the matrices. Defaults to 15.
+        margin (float, optional): margin to add to the odds. Defaults to 0.
+        category (str, optional): type of odds. Defaults to "us". \n
+            'us', American Odds \n
+            'dec', Decimal Odds
+
+    Returns:
+        dictionary: with a row for every match \n
+            home_prob, draw_prob, away_prob and their odds \n
+            over_prob, under_prob, total_push_prob and over_odds, under_odds per total line \n
+            btts_yes_prob, btts_no_prob and their odds \n
+            handicap_home_prob, handicap_away_prob, handicap_push_prob and handicap_home_odds,
+            handicap_away_odds per handicap line \n
+            correct_score, the scoreline matrix
+    """
+
+    home_xg, away_xg, rho = (_as_column(x) for x in (home_xg, away_xg, rho))
+    for name, value in {"home_xg": home_xg, "away_xg": away_xg, "rho": rho}.items():
+        assert _is_numeric_array(value), f"{name} must be numeric"
+    total_lines, handicap_lines = (np.asarray(x, dtype=float).reshape(-1) for x in (total_lines, handicap_lines))
+    assert np.all(handicap_lines * 2 % 1 == 0), "handicap_lines must be whole or half goals"
+    assert category in ["us", "dec"], "category must be either: ('us', 'dec')"
+    assert isinstance(margin, (int, float)) and margin >= 0, "margin must be greater than or equal to 0"
+
+    home_xg, away_xg, rho = np.broadcast_arrays(home_xg.astype(float), away_xg.astype(float), rho.astype(float))
+    matrices = np.stack([scoreline_matrix(h, a, r, max_goals) for h, a, r in zip(home_xg, away_xg, rho)])
+
+    # goal difference and total goals distributions, as sums over masks of the scorelines
+    goals = np.arange(max_goals + 1)
+    difference = (goals[:, None] - goals).reshape(-1) + max_goals
+    total = (goals[:, None] + goals).reshape(-1)
+    flat = matrices.reshape(len(matrices), -1)
+    difference_prob = flat @ (difference[:, None] == np.arange(2 * max_goals + 1))
+    total_prob = flat @ (total[:, None] == np.arange(2 * max_goals + 1))
+
+    home_prob = difference_prob[:, max_goals + 1:].sum(axis=1)
+    draw_prob = difference_prob[:, max_goals]
+    away_prob = difference_prob[:, :max_goals].sum(axis=1)
+    btts_yes_prob = matrices[:, 1:, 1:].sum(axis=(1, 2))
+
+    over_prob, under_prob, total_push_prob = _line_probs(total_prob, total_lines, 0)
+    # the home team covers handicap h when goal difference + h > 0
+    handicap_home_prob, handicap_away_prob, handicap_push_prob = _line_probs(
+        difference_prob, -handicap_lines, -max_goals
+    )
+
+    # pushed bets are refunded, so odds price the decided bets
+    with np.errstate(invalid="ignore"):
+        over_decided = over_prob / (over_prob + under_prob)
+        handicap_decided = handicap_home_prob / (handicap_home_prob + handicap_away_prob)
+
+    home_odds, draw_odds, away_odds = _fair_odds([home_prob, draw_prob, away_prob], category, margin)
+    over_odds, under_odds = _fair_odds([over_decided, 1 - over_decided], category, margin)
+    btts_yes_odds, btts_no_odds = _fair_odds([btts_yes_prob, 1 - btts_yes_prob], category, margin)
+    handicap_home_odds, handicap_away_odds = _fair_odds([handicap_decided, 1 - handicap_decided], category, margin)
+
+    return {
+        "home_prob": home_prob,
+        "draw_prob": draw_prob,
+        "away_prob": away_prob,
+        "home_odds": home_odds,
+        "draw_odds": draw_odds,
+        "away_odds": away_odds,
+        "over_prob": over_prob,
+        "under_prob": under_prob,
+        "total_push_prob": total_push_prob,
+        "over_odds": over_odds,
+        "under_odds": under_odds,
+        "btts_yes_prob": btts_yes_prob,
+        "btts_no_prob": 1 - btts_yes_prob,
+        "btts_yes_odds": btts_yes_odds,
+        "btts_no_odds": btts_no_odds,
+        "handicap_home_prob": handicap_home_prob,
+        "handicap_away_prob": handicap_away_prob,
+        "handicap_push_prob": handicap_push_prob,
+        "handicap_home_odds": handicap_home_odds,
+        "handicap_away_odds": handicap_away_odds,
+        "correct_score": matrices,
+    }
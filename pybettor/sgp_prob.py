@@ -0,0 +1,120 @@
+import numpy as np
+from ._arrays import _is_array, _is_numeric_array, _values
+
+# indicators (samples x parlays) held per block, bounds the memory of a block
+_BLOCK_CELLS = 2**22
+# samples per block, the granularity of stopping early
+_MAX_BLOCK_SIZE = 2**16
+
+
+def _parlay_membership(parlays, n_legs):
+    """(legs x parlays) membership matrix and the number of legs of every parlay."""
+    if parlays is None:
+        parlays = [range(n_legs)]
+
+    membership = np.zeros((n_legs, len(parlays)), dtype=np.float32)
+    for column, parlay in enumerate(parlays):
+        legs = np.asarray(list(parlay))
+        assert len(legs) > 0, "every parlay must have at least one leg"
+        assert np.issubdtype(legs.dtype, np.integer), "parlay legs must be integer indices"
+        assert np.all((legs >= 0) & (legs < n_legs)), "parlay legs must be indices of win_prob"
+        assert len(np.unique(legs)) == len(legs), "parlay legs must be different legs"
+        membership[legs, column] = 1
+
+    return membership, membership.sum(axis=0)
+
+
+def sgp_prob(
+    win_prob,
+    correlation,
+    parlays=None,
+    n_samples: int = 1000000,
+    tol: float = None,
+    block_size: int = None,
+    seed: int = None,
+) -> dict:
+    """Same Game Parlay Probability
+    This function estimates the probability that every leg of a parlay hits when the legs are
+    correlated, as the legs of a same game parlay are. parlay_calc() and parlay_ev() price legs
+    as independent.
+
+    The legs are joined with a Gaussian copula: leg i hits when z_i < ndtri(win_prob_i) for
+    normal z with the given correlation matrix. Samples are drawn in blocks and every parlay is
+    scored on the same samples, so differences between parlays are estimated with common random
+    numbers. Sampling stops early once the standard error of every parlay is at most tol.
+
+    Args:
+        win_prob (array-like): Win Probability of every leg
+        correlation (float, array-like): correlation matrix of the legs' latent normals, or a
+            single correlation between every pair of legs
+        parlays (list, optional): leg indices of every parlay. Defaults to a single parlay of
+            all legs.
+        n_samples (int, optional): largest number of samples. Defaults to 1000000.
+        tol (float, optional): standard error at which sampling stops. Defaults to None, which
+            draws every sample.
+        block_size (int, optional): number of samples per block. Defaults to at most 65536
+            samples and about 4 million indicators.
+        seed (int, optional): seed of the samples. Defaults to None.
+
+    Returns:
+        dictionary: for every parlay, prob, the estimated probability that every leg hits,
+            std_error, and independent_prob, the product of its legs' win probabilities. Also
+            n_samples drawn and converged, whether every std_error reached tol.
+    """
+
+    win_prob = np.atleast_1d(np.asarray(_values(win_prob) if _is_array(win_prob) else win_prob))
+    assert win_prob.ndim == 1 and _is_numeric_array(win_prob), "win_prob must be numeric"
+    assert np.all((win_prob >= 0) & (win_prob <= 1)), "Win Prob must be between 0 and 1"
+    n_legs = len(win_prob)
+
+    correlation = np.asarray(correlation, dtype=float)
+    if correlation.ndim == 0:
+        correlation = np.full((n_legs, n_legs), float(correlation))
+        np.fill_diagonal(correlation, 1)
+    assert correlation.shape == (n_legs, n_legs), "correlation must be a matrix with a row for every leg"
+    assert np.allclose(correlation, correlation.T), "correlation must be symmetric"
+    assert np.allclose(np.diag(correlation), 1), "correlation must have a diagonal of 1"
+    assert isinstance(n_samples, int) and n_samples > 0, "n_samples must be a positive integer"
+    assert tol is None or tol > 0, "tol must be greater than 0"
+
+    # a positive semidefinite correlation factors through its eigen decomposition
+    eigenvalues, eigenvectors = np.linalg.eigh(correlation)
+    assert np.all(eigenvalues > -1e-10), "correlation must be positive semidefinite"
+    factor = eigenvectors * np.sqrt(np.clip(eigenvalues, 0, None))
+
+    membership, n_parlay_legs = _parlay_membership(parlays, n_legs)
+    if block_size is None:
+        block_size = int(np.clip(_BLOCK_CELLS // max(membership.shape), 1024, _MAX_BLOCK_SIZE))
+    assert isinstance(block_size, int) and block_size > 0, "block_size must be a positive integer"
+
+    from scipy import special
+
+    thresholds = special.ndtri(win_prob)
+    rng = np.random.default_rng(seed)
+    hits = np.zeros(membership.shape[1])
+    drawn = 0
+    converged = False
+
+    while drawn < n_samples:
+        size = min(block_size, n_samples - drawn)
+        latent = rng.standard_normal((size, n_legs)) @ factor.T
+        leg_hits = (latent < thresholds).astype(np.float32)
+        hits += np.sum(leg_hits @ membership == n_parlay_legs, axis=0)
+        drawn += size
+
+        prob = hits / drawn
+        std_error = np.sqrt(prob * (1 - prob) / drawn)
+        # a parlay that never or always hit so far has no error to stop on, so stop on its
+        # error with one more hit and one more miss
+        stop_prob = (hits + 1) / (drawn + 2)
+        if tol is not None and np.all(np.sqrt(stop_prob * (1 - stop_prob) / drawn) <= tol):
+            converged = True
+            break
+
+    return {
+        "prob": prob,
+        "std_error": std_error,
+        "independent_prob": np.prod(np.where(membership.T > 0, win_prob, 1), axis=1),
+        "n_samples": drawn,
+        "converged": converged,
+    }
@@ -0,0 +1,135 @@
+import numpy as np
+from ._arrays import _is_array, _is_numeric_array, _values
+from .kelly_batch import kelly_batch
+from .odds import _profit
+
+# random draws per block of paths, bounds the memory of a block
+_BLOCK_DRAWS = 2**22
+
+
+def _simulate_block(task):
+    """Terminal wealth, max drawdown and ruin of one block of paths."""
+    seed, n_paths, true_prob, wins_return, stake, compound, bankroll, ruin_level = task
+    rng = np.random.default_rng(seed)
+    wins = rng.random((n_paths, len(true_prob))) < true_prob
+    returns = np.where(wins, stake * wins_return, -stake)
+
+    with np.errstate(divide="ignore"):
+        if compound:
+            wealth = bankroll * np.exp(np.cumsum(np.log1p(returns), axis=1))
+        else:
+            wealth = bankroll + np.cumsum(returns, axis=1)
+
+    # a path stops betting once it is ruined, and cannot lose more than its bankroll
+    hit = wealth <= ruin_level * bankroll
+    ruined = hit.any(axis=1)
+    first = np.argmax(hit, axis=1)
+    frozen = ruined[:, None] & (np.arange(wealth.shape[1]) > first[:, None])
+    wealth = np.where(frozen, wealth[np.arange(n_paths), first][:, None], wealth)
+    wealth = np.maximum(wealth, 0)
+
+    peak = np.maximum(np.maximum.accumulate(wealth, axis=1), bankroll)
+    drawdown = np.max(1 - wealth / peak, axis=1)
+
+    return wealth[:, -1], drawdown, ruined
+
+
+def simulate_bankroll(
+    win_prob,
+    odds,
+    category: str = "us",
+    kelly_factor: int = 1,
+    stake: str = "kelly",
+    bankroll: float = 10000,
+    unit_size: float = 100,
+    true_prob=None,
+    n_paths: int = 100000,
+    ruin_level: float = 0,
+    seed: int = None,
+    processes: int = None,
+) -> dict:
+    """Bankroll Simulation
+    This function simulates bankroll paths through a sequence of bets sized with the Kelly
+    Criterion, to compare kelly factors by their terminal wealth, drawdowns and risk of ruin.
+
+    Paths are simulated in blocks, each with its own random stream spawned from seed, so results
+    are reproducible whatever the number of processes, and only one block of paths is held in
+    memory per process.
+
+    Args:
+        win_prob (array-like): Win Probability of every bet, used to size the bets
+        odds (array-like): Odds or Implied Win Probability of every bet
+        category (str, optional): type of odds. Defaults to "us". \n
+            'us', American Odds \n
+            'dec', Decimal Odds \n
+            'frac', Fractional Odds \n
+            'prob', Implied Probability
+        kelly_factor (int, optional): Kelly Factor is used to shrink the kelly bet sizes.
+            Defaults to 1.
+        stake (str, optional): how bets are staked. Defaults to "kelly". \n
+            'kelly', the kelly() percentage of the current bankroll \n
+            'kelly_bet', the fixed kelly_bet() amount for unit_size
+        bankroll (float, optional): starting bankroll. Defaults to 10000.
+        unit_size (float, optional): unit size of kelly_bet() stakes. Defaults to 100.
+        true_prob (array-like, optional): probability with which every bet is won, to simulate
+            misestimated win probabilities. Defaults to win_prob.
+        n_paths (int, optional): number of simulated paths. Defaults to 100000.
+        ruin_level (float, optional): a path is ruined, and stops betting, once its bankroll is at or
+            below ruin_level times the starting bankroll. Defaults to 0.
+        seed (int, optional): seed of the simulation. Defaults to None.
+        processes (int, optional): number of processes simulating blocks of paths.
+            Defaults to None, which simulates in this process.
+
+    Returns:
+        dictionary: terminal_wealth and max_drawdown of every path, risk_of_ruin,
+            median_terminal_wealth and median_max_drawdown
+    """
+
+    assert stake in ["kelly", "kelly_bet"], "stake must be either: ('kelly', 'kelly_bet')"
+    assert bankroll > 0, "bankroll must be greater than 0"
+    assert isinstance(n_paths, int) and n_paths > 0, "n_paths must be a positive integer"
+    assert 0 <= ruin_level < 1, "ruin_level must be between 0 and 1"
+
+    sizes = kelly_batch(win_prob, odds, category, kelly_factor, unit_size)
+    assert np.all(_values(sizes["valid"])), "every bet must have a valid win_prob and odds"
+    odds = np.atleast_1d(np.asarray(_values(odds) if _is_array(odds) else odds, dtype=float))
+
+    if true_prob is None:
+        true_prob = win_prob
+    true_prob = np.atleast_1d(np.asarray(_values(true_prob) if _is_array(true_prob) else true_prob))
+    assert _is_numeric_array(true_prob), "true_prob must be numeric"
+    assert np.all((true_prob >= 0) & (true_prob <= 1)), "true_prob must be between 0 and 1"
+    true_prob = np.broadcast_to(true_prob.astype(float), odds.shape)
+
+    # bets without an edge are passed
+    if stake == "kelly":
+        stakes = np.maximum(_values(sizes["kelly"]), 0)
+    else:
+        stakes = np.maximum(_values(sizes["bet_size"]), 0)
+    wins_return = _profit(odds, category)
+
+    block_size = max(1, _BLOCK_DRAWS // len(odds))
+    blocks = [min(block_size, n_paths - start) for start in range(0, n_paths, block_size)]
+    seeds = np.random.SeedSequence(seed).spawn(len(blocks))
+    tasks = [
+        (block_seed, block, true_prob, wins_return, stakes, stake == "kelly", bankroll, ruin_level)
+        for block_seed, block in zip(seeds, blocks)
+    ]
+
+    if processes is None or processes == 1:
+        results = [_simulate_block(task) for task in tasks]
+    else:
+        from concurrent.futures import ProcessPoolExecutor
+
+        with ProcessPoolExecutor(max_workers=processes) as executor:
+            results = list(executor.map(_simulate_block, tasks))
+
+    terminal_wealth, max_drawdown, ruined = (np.concatenate(x) for x in zip(*results))
+
+    return {
+        "terminal_wealth": terminal_wealth,
+        "max_drawdown": max_drawdown,
+        "risk_of_ruin": float(np.mean(ruined)),
+        "median_terminal_wealth": float(np.median(terminal_wealth)),
+        "median_max_drawdown": float(np.median(max_drawdown)),
+    }
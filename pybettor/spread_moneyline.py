@@ -0,0 +1,104 @@
+import numpy as np
+from ._arrays import _first_array, _is_array, _is_numeric_array, _values, _wrap
+from .bet_prob import _spread_probs
+from .bet_prob_batch import _spread_sd
+from .implied_odds import implied_odds
+from .implied_prob_batch import implied_prob_batch
+
+# implied spreads are searched for within this many points of a pick'em
+_MAX_SPREAD = 100
+_BISECTION_STEPS = 60
+
+
+def _as_column(x):
+    return np.atleast_1d(np.asarray(_values(x) if _is_array(x) else x))
+
+
+def _moneyline_prob(spread, sd):
+    """Probability that a team giving spread wins the game, ties refunded as a push."""
+    win_prob, lose_prob, _ = _spread_probs(spread, np.zeros(spread.shape), sd)
+    return win_prob / (win_prob + lose_prob)
+
+
+def spread_to_moneyline(spread, sport="NBA", sd=None) -> dict:
+    """Spread to Moneyline
+    This function converts the point spreads of a board of games to fair moneylines. The spread is
+    taken as the predicted spread of a pick'em bet, priced with bet_prob(), and a tie returns the
+    stake.
+
+    Args:
+        spread (float, array-like): point spread of the team, negative for a favorite
+        sport (str, array-like, optional): sport, for all games or for each game. Defaults to "NBA".
+            Possible values are: "NBA", "NCAAB", "NFL", "NCAAF"
+        sd (float, array-like, optional): standard deviation of the final margin, for all games or
+            for each game, used instead of the standard deviation of sport. Defaults to None.
+
+    Returns:
+        dictionary: win_prob of the team and fair_odds, its fair American moneyline.
+            pandas Series inputs give Series with the index of the first Series.
+    """
+
+    like = _first_array(spread, sport, sd)
+    spread = _as_column(spread)
+    assert _is_numeric_array(spread), "spread must be numeric"
+    sd = _spread_sd(sport, sd)
+    spread, sd = np.broadcast_arrays(spread.astype(float), sd)
+
+    win_prob = _moneyline_prob(spread, sd)
+    fair_odds = np.full(win_prob.shape, np.nan)
+    priced = (win_prob > 0) & (win_prob < 1)
+    if np.any(priced):
+        fair_odds[priced] = implied_odds(win_prob[priced], category="us")
+
+    return {"win_prob": _wrap(win_prob, like), "fair_odds": _wrap(fair_odds, like)}
+
+
+def moneyline_to_spread(
+    odds, category: str = "us", method: str = "basic", sport="NBA", sd=None
+) -> dict:
+    """Moneyline to Spread
+    This function converts the two way moneylines of a board of games to implied point spreads.
+    Every market is de-vigged with implied_prob_batch(), and the spread is found by inverting
+    spread_to_moneyline() with bisection, so the two conversions round trip.
+
+    Args:
+        odds (array-like): moneylines of every game, one row per game with the odds of the team
+            and then of its opponent
+        category (str, optional): type of odds. Defaults to "us". \n
+            'us', American Odds \n
+            'dec', Decimal Odds \n
+            'frac', Fractional Odds
+        method (str, optional): method to de-vig the markets, see implied_prob_batch().
+            Defaults to "basic".
+        sport (str, array-like, optional): sport, for all games or for each game. Defaults to "NBA".
+            Possible values are: "NBA", "NCAAB", "NFL", "NCAAF"
+        sd (float, array-like, optional): standard deviation of the final margin, for all games or
+            for each game, used instead of the standard deviation of sport. Defaults to None.
+
+    Returns:
+        dictionary: win_prob, the de-vigged probability of the team, and spread, its implied point
+            spread, for every game. Both are nan for games the method cannot de-vig.
+    """
+
+    odds = np.atleast_2d(np.asarray(_values(odds) if _is_array(odds) else odds))
+    assert _is_numeric_array(odds), "odds must be numeric"
+    assert odds.ndim == 2 and odds.shape[1] == 2, "odds must have the two sides of every game"
+    assert method != "naive", "method must de-vig the markets, naive probabilities keep the margin"
+
+    win_prob = implied_prob_batch(odds, category, method)["implied_prob"][:, 0]
+    sd = _spread_sd(sport, sd)
+    win_prob, sd = np.broadcast_arrays(win_prob, sd)
+
+    # the moneyline probability falls as the spread grows
+    low = np.full(win_prob.shape, -float(_MAX_SPREAD))
+    high = np.full(win_prob.shape, float(_MAX_SPREAD))
+    for _ in range(_BISECTION_STEPS):
+        middle = (low + high) / 2
+        above = _moneyline_prob(middle, sd) > win_prob
+        low = np.where(above, middle, low)
+        high = np.where(above, high, middle)
+
+    # markets the method could not de-vig have no spread
+    spread = np.where(np.isfinite(win_prob), (low + high) / 2, np.nan)
+
+    return {"win_prob": win_prob, "spread": spread}
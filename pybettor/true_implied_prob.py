@@ -1,3 +1,4 @@
+from ._arrays import _NUMERIC, _all_numeric
 from .implied_prob import implied_prob
 from .true_probability import true_probability
 
@@ -17,8 +18,8 @@ def true_implied_prob(line: float, odds, category: str = "us") -> dict:
         dict: true_prob, imp_prob
     """
 
-    assert isinstance(line, (int, float)), "line much be numeric"
-    assert all(isinstance(x, (int, float)) for x in odds), "odds must be numeric"
+    assert isinstance(line, _NUMERIC), "line much be numeric"
+    assert _all_numeric(odds), "odds must be numeric"
     assert category in [
         "us",
         "frac",
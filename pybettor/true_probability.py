@@ -1,3 +1,4 @@
+from ._arrays import _all_numeric
 from .implied_prob import implied_prob
 
 
@@ -7,7 +8,7 @@ def true_probability(line: float, odds, category: str = "us") -> float:
 
     Args:
         line (float): odds of bet side
-        odds (list): odds of all sides
+        odds (list, numpy array, pandas Series): odds of all sides
         category (str, optional): type of odds. Defaults to "us". \n
             'us', American Odds \n
             'dec', Decimal Odds \n
@@ -17,7 +18,7 @@ def true_probability(line: float, odds, category: str = "us") -> float:
         float: probability
     """
 
-    assert all(isinstance(x, (int, float)) for x in odds), "odds must be numeric"
+    assert _all_numeric(odds), "odds must be numeric"
     assert category in [
         "us",
         "frac",
@@ -0,0 +1,43 @@
+import unittest
+import numpy as np
+import numpy.testing as npt
+from pybettor.alt_line_ladder import alt_line_ladder
+from pybettor.bet_prob import bet_prob
+from pybettor.implied_odds import implied_odds
+
+
+class TestAltLineLadder(unittest.TestCase):
+    def test_matches_bet_prob(self):
+        result = alt_line_ladder(-6.5, [3, -10.5, -3, 7, -7], sport="NFL")
+        npt.assert_array_equal(result["lines"], [-10.5, -7, -3, 3, 7])
+
+        for i, line in enumerate(result["lines"]):
+            expected = bet_prob(-6.5, float(line), "NFL")
+            for key in ["win_prob", "lose_prob", "push_prob"]:
+                npt.assert_almost_equal(result[key][i], expected[key], 12)
+            decided_prob = expected["win_prob"] / (expected["win_prob"] + expected["lose_prob"])
+            self.assertEqual(result["fair_odds"][i], implied_odds(decided_prob, "us")[0])
+
+    def test_many_games(self):
+        pred_spread = np.array([-7.0, 3.0, 0.5])
+        result = alt_line_ladder(pred_spread, sd=[13.86, 12, 10])
+        self.assertEqual(result["win_prob"].shape, (3, 43))
+        npt.assert_almost_equal(result["win_prob"] + result["lose_prob"] + result["push_prob"], 1)
+        self.assertTrue(np.all(np.diff(result["win_prob"], axis=1) >= 0))
+
+        single = alt_line_ladder(3.0, sd=12)
+        npt.assert_array_equal(result["win_prob"][1], single["win_prob"])
+
+    def test_unpriceable_lines(self):
+        result = alt_line_ladder(0, [-200.5, 0.5], sport="NBA")
+        self.assertTrue(np.isnan(result["fair_odds"][0]))
+        self.assertEqual(result["fair_odds"][1], implied_odds(result["win_prob"][1], "us")[0])
+
+    def test_invalid_input(self):
+        self.assertRaises(AssertionError, alt_line_ladder, "-7")
+        self.assertRaises(AssertionError, alt_line_ladder, -7, ["-3"])
+        self.assertRaises(AssertionError, alt_line_ladder, -7, sport="MLB")
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,39 @@
+import unittest
+from fractions import Fraction
+import numpy as np
+import numpy.testing as npt
+from pybettor._arrays import _format_frac, _limit_denominator, _round, _round_int
+
+
+class TestArrays(unittest.TestCase):
+    def test_round_matches_builtin(self):
+        rng = np.random.default_rng(1)
+        values = np.concatenate(
+            [rng.uniform(-500, 500, 10000), np.arange(-20000, 20000) / 8, [-16000.0, 0.5, 2.675]]
+        )
+        for ndigits in (0, 2, 4):
+            expected = [round(float(x), ndigits) for x in values]
+            npt.assert_array_equal(_round(values, ndigits), expected)
+
+    def test_round_int(self):
+        npt.assert_array_equal(_round_int(np.array([-110.5, 2.5, 149.6])), [-110, 2, 150])
+        with self.assertRaises(OverflowError):
+            _round_int(np.array([1.0, np.inf]))
+
+    def test_limit_denominator_matches_fraction(self):
+        rng = np.random.default_rng(2)
+        us = np.concatenate([np.arange(-3000, -99), np.arange(100, 3001)])
+        values = np.concatenate(
+            [np.where(us <= -100, -100 / us, us / 100), rng.uniform(0, 20, 10000), np.arange(2000) / 400]
+        )
+        num, den = _limit_denominator(values)
+        fracs = [Fraction(float(x)).limit_denominator(100) for x in values]
+        npt.assert_array_equal(num, [x.numerator for x in fracs])
+        npt.assert_array_equal(den, [x.denominator for x in fracs])
+
+    def test_format_frac(self):
+        npt.assert_array_equal(_format_frac(*_limit_denominator([0.5, 2.0, 10 / 11])), ["1/2", "2/1", "10/11"])
+
+
+if __name__ == "__main__":
+    unittest.main()
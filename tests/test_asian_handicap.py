@@ -0,0 +1,51 @@
+import unittest
+import numpy as np
+import numpy.testing as npt
+from pybettor.asian_handicap import asian_handicap
+from pybettor.bet_prob_batch import bet_prob_batch
+from pybettor.expected_value_calc import expected_value_calc
+from pybettor.margin_distribution import MarginDistribution
+
+
+class TestAsianHandicap(unittest.TestCase):
+    def test_whole_and_half_lines_match_bet_prob(self):
+        result = asian_handicap(-3.0, np.array([-3, -2.5]), sport="NFL")
+        expected = bet_prob_batch(-3.0, np.array([-3, -2.5]), "NFL")
+        npt.assert_almost_equal(result["full_win_prob"], expected["win_prob"])
+        npt.assert_almost_equal(result["push_prob"], expected["push_prob"])
+        npt.assert_almost_equal(result["full_loss_prob"], expected["lose_prob"])
+        npt.assert_array_equal(result["half_win_prob"], [0, 0])
+        npt.assert_array_equal(result["half_loss_prob"], [0, 0])
+
+    def test_quarter_lines(self):
+        margins = [0, 0, 0, 1, 1, 1, 2, -1, -1, 3]
+        distribution = MarginDistribution.from_margins(margins)
+        result = asian_handicap(0.0, [-0.25, -0.75], distribution=distribution)
+        npt.assert_almost_equal(result["full_win_prob"], [0.5, 0.2])
+        npt.assert_almost_equal(result["half_win_prob"], [0, 0.3])
+        npt.assert_almost_equal(result["push_prob"], [0, 0])
+        npt.assert_almost_equal(result["half_loss_prob"], [0.3, 0])
+        npt.assert_almost_equal(result["full_loss_prob"], [0.2, 0.5])
+
+    def test_expected_value(self):
+        result = asian_handicap(-1.0, [-0.5, -0.75, -1], odds=[1.9, 2.0, 1.95], category="dec", sd=1.5, risk=50)
+        npt.assert_almost_equal(result["ev"][0], expected_value_calc(result["full_win_prob"][0], 1.9, "dec", 50))
+
+        win = result["full_win_prob"][1] + result["half_win_prob"][1] / 2
+        loss = result["full_loss_prob"][1] + result["half_loss_prob"][1] / 2
+        npt.assert_almost_equal(result["ev"][1], win * 50 - loss * 50)
+        npt.assert_almost_equal(result["ev"][2], result["full_win_prob"][2] * 47.5 - result["full_loss_prob"][2] * 50)
+
+    def test_ladder_sums_to_one(self):
+        result = asian_handicap(-0.3, np.arange(-2, 2.25, 0.25), sd=1.7)
+        total = sum(result[key] for key in result)
+        npt.assert_almost_equal(total, 1)
+
+    def test_invalid_input(self):
+        self.assertRaises(AssertionError, asian_handicap, 0.0, [-0.3])
+        self.assertRaises(AssertionError, asian_handicap, 0.0, [-0.25], odds=[50])
+        self.assertRaises(AssertionError, asian_handicap, 0.0, [-0.25], odds=[-110], category="prob")
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -1,4 +1,5 @@
 import unittest
+import numpy as np
 import numpy.testing as npt
 from pybettor.bet_calc import bet_calc
 
@@ -47,6 +48,17 @@ class TestBetCalc(unittest.TestCase):
         except AssertionError as e:
             assert str(e) == "odds must be numeric"
 
+    def test_array_bet_calc(self):
+        result = bet_calc(100, np.array([-110, 150]))
+        self.assertIsInstance(result, np.ndarray)
+        npt.assert_array_equal(result, [190.91, 250.0])
+
+        result = bet_calc(np.array([50, 200]), np.float64(1.75), category="dec")
+        npt.assert_array_equal(result, [87.5, 350.0])
+
+        with self.assertRaises(AssertionError):
+            bet_calc(100, np.array(["-110", "150"]))
+
 
 if __name__ == "__main__":
     unittest.main()
@@ -0,0 +1,46 @@
+import unittest
+import numpy as np
+import numpy.testing as npt
+from pybettor.bet_prob import bet_prob
+from pybettor.bet_prob_batch import bet_prob_batch
+
+
+class TestBetProbBatch(unittest.TestCase):
+    def test_matches_bet_prob(self):
+        pred_spread = np.array([-9, 21, -7, -3, 2.5])
+        spread = np.array([-3.5, 10.5, -3, 5, 2.5])
+        sport = np.array(["NFL", "NCAAF", "NBA", "NCAAB", "NBA"])
+        result = bet_prob_batch(pred_spread, spread, sport)
+
+        for i in range(len(spread)):
+            expected = bet_prob(float(pred_spread[i]), float(spread[i]), str(sport[i]))
+            for key in ["win_prob", "lose_prob", "push_prob"]:
+                self.assertEqual(result[key][i], expected[key])
+        npt.assert_array_equal(result["push_prob"][[0, 1, 4]], 0)
+
+    def test_standard_deviation(self):
+        result = bet_prob_batch([-7, -7], [-3, -3.5], sd=12)
+        expected = bet_prob_batch([-7, -7], [-3, -3.5], "NBA")
+        npt.assert_array_equal(result["win_prob"], expected["win_prob"])
+        npt.assert_almost_equal(result["win_prob"] + result["lose_prob"] + result["push_prob"], [1, 1])
+
+    def test_pandas_series(self):
+        try:
+            import pandas as pd
+        except ImportError:
+            self.skipTest("pandas is not installed")
+
+        pred_spread = pd.Series([-7.0, -9.0], index=["a", "b"])
+        result = bet_prob_batch(pred_spread, -3, sport=["NBA", "NFL"])
+        self.assertIsInstance(result["win_prob"], pd.Series)
+        self.assertEqual(list(result["win_prob"].index), ["a", "b"])
+        npt.assert_almost_equal(result["win_prob"]["a"], 0.61472925)
+
+    def test_invalid_input(self):
+        self.assertRaises(AssertionError, bet_prob_batch, [-7], [-3], "MLB")
+        self.assertRaises(AssertionError, bet_prob_batch, ["-7"], [-3])
+        self.assertRaises(AssertionError, bet_prob_batch, [-7], [-3], sd=0)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,54 @@
+import unittest
+from pybettor.cache import cache_info, clear_cache, disable_cache, enable_cache
+from pybettor.convert_odds import convert_odds
+from pybettor.implied_odds import implied_odds
+from pybettor.implied_prob import implied_prob
+
+
+class TestCache(unittest.TestCase):
+    def setUp(self):
+        enable_cache(maxsize=2)
+        clear_cache()
+
+    def tearDown(self):
+        disable_cache()
+
+    def test_cache_hits_and_misses(self):
+        implied_prob([-110, -110], method="odds_ratio")
+        implied_prob([-110, -110], method="odds_ratio")
+        implied_prob(odds=[-110, -110], category="us", method="odds_ratio")
+        implied_prob([-110, -110], method="power")
+        info = cache_info()
+        self.assertEqual((info["hits"], info["misses"], info["currsize"]), (2, 2, 2))
+
+    def test_cache_lru_eviction(self):
+        convert_odds(-110, cat_out="dec")
+        convert_odds(-120, cat_out="dec")
+        convert_odds(-110, cat_out="dec")
+        convert_odds(-130, cat_out="dec")
+        convert_odds(-110, cat_out="dec")
+        self.assertEqual(cache_info()["hits"], 2)
+
+        convert_odds(-120, cat_out="dec")
+        self.assertEqual(cache_info()["hits"], 2)
+
+    def test_cache_returns_copies(self):
+        odds = implied_odds(0.75, category="all")
+        odds["American"][0] = 0
+        self.assertEqual(implied_odds(0.75, category="all")["American"][0], -300)
+
+    def test_cache_keys_on_type(self):
+        implied_prob(-110)
+        with self.assertRaises(AssertionError):
+            implied_prob(-110.0)
+
+    def test_disable_cache(self):
+        disable_cache()
+        implied_prob(-110)
+        implied_prob(-110)
+        self.assertEqual(cache_info()["currsize"], 0)
+        self.assertEqual(cache_info()["hits"], 0)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -1,6 +1,7 @@
 import unittest
+import numpy as np
 import numpy.testing as npt
-from pybettor.convert_odds import convert_odds
+from pybettor.convert_odds import convert_odds, convert_odds_table
 
 
 class TestConvertOdds(unittest.TestCase):
@@ -116,6 +117,50 @@ class TestConvertOdds(unittest.TestCase):
             result["Implied Probability"], expected["Implied Probability"], 2
         )
 
+    def test_convert_array_odds(self):
+        odds = np.array([-115, -105, 120])
+        result = convert_odds(odds, "us", "dec")
+        self.assertIsInstance(result, np.ndarray)
+        npt.assert_array_equal(result, convert_odds([-115, -105, 120], "us", "dec"))
+
+        result = convert_odds(odds, "us")
+        npt.assert_array_equal(result.get("Fraction"), ["20/23", "20/21", "6/5"])
+        npt.assert_almost_equal(result.get("Implied Probability"), [0.5348837, 0.5121951, 0.4545455])
+
+    def test_convert_series_odds(self):
+        try:
+            import pandas as pd
+        except ImportError:
+            self.skipTest("pandas is not installed")
+
+        odds = pd.Series([1.87, 3.5, 1.33, 1.67], index=[10, 11, 12, 13])
+        result = convert_odds(odds, "dec", "us")
+        self.assertIsInstance(result, pd.Series)
+        self.assertEqual(list(result.index), [10, 11, 12, 13])
+        npt.assert_array_equal(result.to_numpy(), [-115, 250, -303, -149])
+
+    def test_convert_odds_table(self):
+        odds = np.array([-115, -105, 120, -115, 2500])
+        table = convert_odds_table(odds, "us")
+        self.assertEqual(
+            table.dtype.names, ("american", "decimal", "frac_num", "frac_den", "prob")
+        )
+        expected = convert_odds(odds.tolist(), "us", "all")
+        npt.assert_array_equal(table["american"], expected.get("American"))
+        npt.assert_array_equal(table["decimal"], expected.get("Decimal"))
+        npt.assert_array_equal(table["prob"], expected.get("Implied Probability"))
+        npt.assert_array_equal(
+            [f"{n}/{d}" for n, d in zip(table["frac_num"], table["frac_den"])],
+            expected.get("Fraction"),
+        )
+
+        table = convert_odds_table([0.4, 0.6], "prob")
+        npt.assert_array_equal(table["american"], [150, -150])
+        npt.assert_array_equal(table["decimal"], [2.5, 1.67])
+
+        with self.assertRaises(AssertionError):
+            convert_odds_table([-110, 50], "us")
+
 
 if __name__ == "__main__":
     unittest.main()
@@ -1,4 +1,5 @@
 import unittest
+import numpy as np
 import numpy.testing as npt
 from pybettor.implied_odds import implied_odds
 
@@ -135,6 +136,20 @@ class TestImpliedOdds(unittest.TestCase):
         )
         npt.assert_almost_equal(odds.get("z_value"), 0.01059301)
 
+    def test_array_implied_odds(self):
+        probs = np.array([0.2299380, 0.2624575, 0.5076046])
+        margin = 0.02118602
+        odds = implied_odds(probs, category="dec", margin=margin, method="balanced_book")
+        self.assertIsInstance(odds.get("implied_odds"), np.ndarray)
+        npt.assert_almost_equal(
+            odds.get("implied_odds"),
+            [4.19999975, 3.70000001, 1.95000005],
+        )
+
+        odds = implied_odds(np.array([0.4, 0.6]), category="all")
+        npt.assert_array_equal(odds.get("Fraction"), ["3/2", "67/100"])
+        self.assertEqual(implied_odds(np.float64(0.4)), [150])
+
 
 if __name__ == "__main__":
     unittest.main()
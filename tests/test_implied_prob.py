@@ -1,4 +1,5 @@
 import unittest
+import numpy as np
 import numpy.testing as npt
 from pybettor.implied_prob import implied_prob
 
@@ -139,6 +140,37 @@ class TestImpliedProb(unittest.TestCase):
         )
         npt.assert_almost_equal(probs.get("distance"), 0.00548306)
 
+    def test_array_implied_prob(self):
+        odds = np.array([4.2, 3.7, 1.95])
+        probs = implied_prob(odds, "dec", method="shin")
+        self.assertIsInstance(probs.get("implied_prob"), np.ndarray)
+        npt.assert_almost_equal(
+            probs.get("implied_prob"),
+            implied_prob([4.2, 3.7, 1.95], "dec", method="shin").get("implied_prob"),
+        )
+
+        odds = np.array([-110, -110], dtype=np.int64)
+        npt.assert_almost_equal(implied_prob(odds), [0.5238095, 0.5238095])
+        npt.assert_almost_equal(implied_prob(list(odds)), [0.5238095, 0.5238095])
+
+        with self.assertRaises(AssertionError):
+            implied_prob(np.array([-110, 50]))
+
+    def test_series_implied_prob(self):
+        try:
+            import pandas as pd
+        except ImportError:
+            self.skipTest("pandas is not installed")
+
+        odds = pd.Series([-110, 120, 300], index=["a", "b", "c"])
+        probs = implied_prob(odds, method="power")
+        self.assertIsInstance(probs.get("implied_prob"), pd.Series)
+        self.assertEqual(list(probs.get("implied_prob").index), ["a", "b", "c"])
+        npt.assert_almost_equal(
+            probs.get("implied_prob").to_numpy(),
+            implied_prob([-110, 120, 300], method="power").get("implied_prob"),
+        )
+
 
 if __name__ == "__main__":
     unittest.main()
@@ -0,0 +1,106 @@
+import unittest
+import warnings
+import numpy as np
+import numpy.testing as npt
+from scipy import optimize
+from pybettor.implied_prob import implied_prob, jsd_func, jsd_solvefor
+from pybettor.implied_prob_batch import implied_prob_batch
+
+
+class TestImpliedProbBatch(unittest.TestCase):
+    markets = [[4.2, 3.7, 1.95], [2.1, 3.4, 3.6], [1.5, 4.5, 7.0]]
+    methods = [
+        "basic",
+        "wpo",
+        "odds_ratio",
+        "power",
+        "additive",
+        "shin",
+        "balanced_book",
+        "jsd",
+    ]
+    params = ["specific_margins", "odds_ratio", "exponent", "z_value", "distance"]
+
+    def test_naive_batch(self):
+        odds = [[-110, -110], [150, -180]]
+        probs = implied_prob_batch(odds, category="us")
+        npt.assert_almost_equal(
+            probs, [implied_prob(x, category="us") for x in odds]
+        )
+
+    def test_batch_matches_scalar(self):
+        for method in self.methods:
+            probs = implied_prob_batch(self.markets, category="dec", method=method)
+            for ii, market in enumerate(self.markets):
+                expected = implied_prob(market, category="dec", method=method)
+                npt.assert_almost_equal(probs["implied_prob"][ii], expected["implied_prob"])
+                npt.assert_almost_equal(probs["margin"][ii], expected["margin"])
+                for key in self.params:
+                    if key in expected:
+                        npt.assert_almost_equal(probs[key][ii], expected[key])
+
+    def test_ragged_batch_matches_scalar(self):
+        markets = [[-120, 240, 260], [285, -122, 258], [-250, 400, 700, 1200]]
+        odds = np.concatenate(markets)
+        offsets = np.cumsum([0] + [len(x) for x in markets])
+        for method in ["basic", "additive", "shin", "balanced_book", "power"]:
+            probs = implied_prob_batch(odds, category="us", method=method, offsets=offsets)
+            self.assertEqual(probs["implied_prob"].shape, odds.shape)
+            for ii, market in enumerate(markets):
+                expected = implied_prob(market, category="us", method=method)
+                npt.assert_almost_equal(
+                    probs["implied_prob"][offsets[ii]:offsets[ii + 1]],
+                    expected["implied_prob"],
+                )
+
+    def test_shin_convergence_report(self):
+        probs = implied_prob_batch(self.markets, category="dec", method="shin")
+        npt.assert_array_equal(probs["converged"], [True, True, True])
+        self.assertTrue(np.all(probs["iterations"] > 1))
+
+        probs = implied_prob_batch(self.markets, category="dec", method="shin", shin_method="uniroot")
+        for ii, market in enumerate(self.markets):
+            expected = implied_prob(market, category="dec", method="shin", shin_method="uniroot")
+            npt.assert_almost_equal(probs["implied_prob"][ii], expected["implied_prob"])
+            npt.assert_almost_equal(probs["z_value"][ii], expected["z_value"])
+
+        with self.assertWarns(UserWarning):
+            implied_prob_batch([[4.2, 3.7, 1.95]], category="dec", method="shin", gross_margin=0.01,
+                               shin_method="uniroot")
+
+    def test_shin_two_way_markets(self):
+        # two way markets are solved in closed form, next to markets that iterate
+        odds = [-300, 250, -110, -110, 285, -122, 258]
+        offsets = np.array([0, 2, 4, 7])
+        with warnings.catch_warnings():
+            warnings.simplefilter("error")
+            probs = implied_prob_batch(odds, category="us", method="shin", offsets=offsets)
+        npt.assert_array_equal(probs["converged"], [True, True, True])
+        npt.assert_array_equal(probs["iterations"][:2], [0, 0])
+        for ii, market in enumerate([[-300, 250], [-110, -110]]):
+            expected = implied_prob(market, category="us", method="shin", shin_method="uniroot")
+            npt.assert_almost_equal(probs["implied_prob"][offsets[ii]:offsets[ii + 1]], expected["implied_prob"])
+            npt.assert_almost_equal(probs["z_value"][ii], expected["z_value"])
+        npt.assert_almost_equal(probs["implied_prob"][4:], implied_prob([285, -122, 258], method="shin")["implied_prob"])
+
+    def test_jsd_matches_nested_root_finding(self):
+        naive_prob = np.array([0.3, 0.25, 0.2, 0.12, 0.08, 0.05, 0.03])
+        res = optimize.root_scalar(
+            f=jsd_solvefor, bracket=[0.0000001, 0.1], method="brentq", args=(naive_prob,)
+        )
+        expected = jsd_func(res.root, naive_prob)
+
+        probs = implied_prob_batch([1 / naive_prob], category="dec", method="jsd", normalize=False)
+        npt.assert_almost_equal(probs["distance"][0], res.root, 9)
+        npt.assert_almost_equal(probs["implied_prob"][0], expected, 9)
+
+    def test_batch_assertion_error(self):
+        with self.assertRaises(AssertionError):
+            implied_prob_batch([[-110, 50]], category="us")
+
+        with self.assertRaises(AssertionError):
+            implied_prob_batch([-110, -110, 150], offsets=[0, 2, 2, 3])
+
+
+if __name__ == "__main__":
+    unittest.main()
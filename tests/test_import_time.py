@@ -0,0 +1,55 @@
+import subprocess
+import sys
+import unittest
+
+HEAVY_MODULES = ("numpy", "scipy", "matplotlib")
+
+
+def _run(code):
+    return subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", code],
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+
+
+class TestImportTime(unittest.TestCase):
+    def test_import_loads_no_heavy_modules(self):
+        result = _run(
+            "import sys, pybettor\n"
+            f"print(','.join(m for m in {HEAVY_MODULES!r} if m in sys.modules))"
+        )
+        self.assertEqual(result.stdout.strip(), "")
+
+    def test_import_time(self):
+        result = _run("import pybettor")
+        # -X importtime lines: "import time: self [us] | cumulative | imported package"
+        cumulative = [
+            int(line.split("|")[1])
+            for line in result.stderr.splitlines()
+            if line.split("|")[-1].strip() == "pybettor"
+        ]
+        self.assertEqual(len(cumulative), 1)
+        self.assertLess(cumulative[0], 100000)
+
+    def test_functions_load_only_their_dependencies(self):
+        result = _run(
+            "import sys, pybettor\n"
+            "pybettor.kelly(0.6, 100)\n"
+            f"print(','.join(m for m in {HEAVY_MODULES!r} if m in sys.modules))"
+        )
+        self.assertEqual(result.stdout.strip(), "numpy")
+
+    def test_lazy_attributes(self):
+        import pybettor
+
+        self.assertIn("implied_prob", dir(pybettor))
+        self.assertTrue(callable(pybettor.convert_odds))
+        self.assertTrue(callable(pybettor.implied_prob))
+        with self.assertRaises(AttributeError):
+            pybettor.not_a_function
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -1,4 +1,5 @@
 import unittest
+import numpy as np
 import numpy.testing as npt
 from pybettor.kelly import kelly
 
@@ -14,6 +15,15 @@ class TestKelly(unittest.TestCase):
         category = "dec"
         npt.assert_almost_equal(kelly(win_prob, odds, category), 0.2)
 
+    def test_array_kelly(self):
+        win_prob = np.array([0.6, 0.55, 0.3])
+        odds = np.array([100, -110, 250])
+        result = kelly(win_prob, odds)
+        self.assertIsInstance(result, np.ndarray)
+        npt.assert_array_equal(result, [kelly(0.6, 100), kelly(0.55, -110), kelly(0.3, 250)])
+
+        npt.assert_array_equal(kelly(0.6, np.array([2.0, 2.5]), "dec"), [0.2, 0.33])
+
 
 if __name__ == "__main__":
     unittest.main()
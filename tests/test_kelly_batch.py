@@ -0,0 +1,40 @@
+import unittest
+import numpy as np
+import numpy.testing as npt
+from pybettor.kelly import kelly
+from pybettor.kelly_bet import kelly_bet
+from pybettor.kelly_batch import kelly_batch
+
+
+class TestKellyBatch(unittest.TestCase):
+    def test_kelly_batch_matches_scalar(self):
+        win_prob = np.array([0.6, 0.55, 0.3, 0.45, 0.6])
+        odds = np.array([100, -110, 250, 2.5, 0.5])
+        category = np.array(["us", "us", "us", "dec", "prob"])
+        kelly_factor = np.array([1, 2, 1, 4, 1])
+        result = kelly_batch(win_prob, odds, category, kelly_factor, unit_size=50)
+
+        for ii in range(len(odds)):
+            args = (float(win_prob[ii]), odds[ii].item(), str(category[ii]), int(kelly_factor[ii]))
+            self.assertEqual(result["kelly"][ii], kelly(*args))
+            self.assertEqual(result["bet_size"][ii], kelly_bet(50, *args))
+        self.assertTrue(result["valid"].all())
+
+    def test_kelly_batch_invalid_rows(self):
+        result = kelly_batch(
+            [0.6, 1.2, 0.6, 0.6, 0.6, 0.6],
+            [-110, -110, 50, 1.0, -110, -110],
+            ["us", "us", "us", "dec", "other", "us"],
+            [1, 1, 1, 1, 1, 0],
+        )
+        npt.assert_array_equal(result["valid"], [True, False, False, False, False, False])
+        self.assertFalse(np.isnan(result["kelly"][0]))
+        self.assertTrue(np.isnan(result["kelly"][1:]).all())
+        self.assertTrue(np.isnan(result["bet_size"][1:]).all())
+
+        with self.assertRaises(AssertionError):
+            kelly_batch(["0.6"], [-110])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,54 @@
+import unittest
+import numpy as np
+import numpy.testing as npt
+from scipy import optimize
+from pybettor.kelly import kelly
+from pybettor.kelly_exclusive import kelly_exclusive
+
+
+class TestKellyExclusive(unittest.TestCase):
+    def test_single_outcome_matches_kelly(self):
+        result = kelly_exclusive([0.6], [100])
+        npt.assert_almost_equal(result["kelly"], [kelly(0.6, 100)])
+        npt.assert_almost_equal(result["reserve_rate"], 0.8)
+
+    def test_three_way_market(self):
+        win_prob = np.array([0.45, 0.3, 0.15])
+        dec_odds = np.array([2.4, 3.2, 6.5])
+        result = kelly_exclusive(win_prob, dec_odds, category="dec")
+
+        def neg_growth(fractions):
+            kept = 1 - np.sum(fractions)
+            return -(np.dot(win_prob, np.log(kept + fractions * dec_odds)) + 0.1 * np.log(kept))
+
+        expected = optimize.minimize(
+            neg_growth, np.full(3, 0.01), bounds=[(0, 1)] * 3, method="SLSQP", options={"ftol": 1e-15}
+        )
+        npt.assert_almost_equal(result["kelly"], expected.x, 6)
+        npt.assert_almost_equal(result["growth"], -expected.fun, 10)
+
+    def test_outcomes_without_edge(self):
+        result = kelly_exclusive([0.5, 0.3, 0.2], [2.1, 3.2, 4.2], category="dec")
+        self.assertEqual(result["kelly"][2], 0)
+        self.assertTrue(np.all(result["kelly"][:2] > 0))
+
+        result = kelly_exclusive([0.4, 0.3, 0.3], [-110, 200, 200], kelly_factor=2)
+        npt.assert_array_equal(result["kelly"], [0, 0, 0])
+        self.assertEqual(result["growth"], 0)
+
+    def test_futures_market(self):
+        rng = np.random.default_rng(0)
+        win_prob = rng.dirichlet(np.ones(500))
+        dec_odds = 1 / (win_prob * rng.uniform(0.85, 1.2, 500))
+        result = kelly_exclusive(win_prob, dec_odds, category="dec")
+        bet = result["kelly"] > 0
+        # every bet outcome beats the reserve rate, and no other outcome does
+        self.assertTrue(np.all(win_prob[bet] * dec_odds[bet] > result["reserve_rate"]))
+        self.assertTrue(np.all(win_prob[~bet] * dec_odds[~bet] <= result["reserve_rate"]))
+
+        with self.assertRaises(AssertionError):
+            kelly_exclusive([0.6, 0.6], [100, 100])
+
+
+if __name__ == "__main__":
+    unittest.main()
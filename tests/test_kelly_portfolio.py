@@ -0,0 +1,95 @@
+import itertools
+import time
+import unittest
+import numpy as np
+import numpy.testing as npt
+from scipy import optimize, stats
+from pybettor.kelly import kelly
+from pybettor.kelly_portfolio import kelly_portfolio
+
+
+class TestKellyPortfolio(unittest.TestCase):
+    def test_single_bet_matches_kelly(self):
+        result = kelly_portfolio([0.6], [100])
+        npt.assert_almost_equal(result["kelly"], [kelly(0.6, 100)], 6)
+
+        result = kelly_portfolio([0.6], [100], kelly_factor=2)
+        npt.assert_almost_equal(result["kelly"], [kelly(0.6, 100, kelly_factor=2)], 6)
+
+    def test_independent_bets(self):
+        win_prob = np.array([0.6, 0.55, 0.35])
+        dec_odds = np.array([2.0, 1.9090909, 3.5])
+        result = kelly_portfolio(win_prob, dec_odds, category="dec")
+
+        def neg_growth(fractions):
+            growth = 0
+            for wins in np.ndindex(2, 2, 2):
+                wins = np.array(wins)
+                prob = np.prod(np.where(wins, win_prob, 1 - win_prob))
+                growth += prob * np.log(1 + np.sum(fractions * (wins * dec_odds - 1)))
+            return -growth
+
+        expected = optimize.minimize(neg_growth, np.full(3, 0.05), bounds=[(0, 1)] * 3)
+        npt.assert_almost_equal(result["kelly"], expected.x, 4)
+        npt.assert_almost_equal(result["growth"], -expected.fun, 8)
+        # sized together, every bet is smaller than when sized alone
+        self.assertTrue(np.all(result["kelly"] < (win_prob * dec_odds - 1) / (dec_odds - 1)))
+
+    def test_caps_and_joint_outcomes(self):
+        result = kelly_portfolio([0.6, 0.6], [100, 100], max_bet=0.1, max_total=0.15)
+        npt.assert_almost_equal(result["kelly"], [0.075, 0.075], 6)
+
+        # two bets that always win or lose together act as one bet
+        result = kelly_portfolio(None, [100, 100], outcomes=[[1, 1], [0, 0]], weights=[0.6, 0.4])
+        npt.assert_almost_equal(np.sum(result["kelly"]), 0.2, 6)
+
+    def test_many_bets(self):
+        # identical bets get identical stakes, the optimum over the binomial count of wins
+        result = kelly_portfolio(np.full(13, 0.51), np.full(13, 100))
+        wins = np.arange(14)
+        prob = stats.binom.pmf(wins, 13, 0.51)
+        expected = optimize.minimize_scalar(
+            lambda f: -np.dot(prob, np.log(1 - 13 * f + 2 * f * wins)), bounds=(0, 1 / 13), method="bounded",
+            options={"xatol": 1e-12},
+        )
+        npt.assert_almost_equal(result["kelly"], np.full(13, expected.x), 6)
+        npt.assert_almost_equal(result["growth"], -expected.fun, 10)
+        self.assertEqual(len(np.unique(result["kelly"])), 1)
+
+        # different bets, against every one of their outcomes
+        rng = np.random.default_rng(0)
+        win_prob = rng.uniform(0.45, 0.6, 14)
+        dec_odds = rng.uniform(1.8, 2.6, 14)
+        result = kelly_portfolio(win_prob, dec_odds, category="dec")
+        outcomes = np.array(list(itertools.product([0, 1], repeat=14)))
+        weights = np.prod(np.where(outcomes, win_prob, 1 - win_prob), axis=1)
+        exact = kelly_portfolio(None, dec_odds, category="dec", outcomes=outcomes, weights=weights)
+        npt.assert_almost_equal(result["kelly"], exact["kelly"], 5)
+        npt.assert_almost_equal(result["growth"], exact["growth"], 10)
+
+        # the bankroll survives every bet losing
+        result = kelly_portfolio(np.full(100, 0.55), np.full(100, 100))
+        self.assertLess(np.sum(result["kelly"]), 1)
+        self.assertTrue(np.isfinite(result["growth"]))
+        self.assertEqual(len(np.unique(result["kelly"])), 1)
+
+        result = kelly_portfolio(rng.uniform(0.5, 0.58, 100), np.full(100, -105), max_total=0.5)
+        self.assertTrue(result["converged"])
+        self.assertLessEqual(np.sum(result["kelly"]), 0.5 + 1e-9)
+        self.assertTrue(np.all(result["kelly"] >= 0))
+
+    def test_many_bets_time(self):
+        rng = np.random.default_rng(1)
+        win_prob = rng.uniform(0.45, 0.6, 200)
+        dec_odds = rng.uniform(1.7, 2.3, 200)
+        start = time.perf_counter()
+        result = kelly_portfolio(win_prob, dec_odds, category="dec")
+        self.assertLess(time.perf_counter() - start, 2)
+        self.assertTrue(result["converged"])
+        self.assertLess(np.sum(result["kelly"]), 1)
+        # bets without an edge are left out
+        self.assertTrue(np.all(result["kelly"][win_prob * dec_odds < 1] == 0))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,74 @@
+import unittest
+import numpy.testing as npt
+from pybettor.implied_prob import implied_prob
+from pybettor.live_market import LiveMarket
+
+
+class TestLiveMarket(unittest.TestCase):
+    odds = [4.2, 3.7, 1.95]
+
+    def test_live_market_matches_implied_prob(self):
+        for method, key in [
+            ("odds_ratio", "odds_ratio"),
+            ("power", "exponent"),
+            ("jsd", "distance"),
+            ("basic", None),
+        ]:
+            market = LiveMarket(self.odds, category="dec", method=method)
+            for odds in [self.odds, [4.3, 3.7, 1.95], [4.3, 3.6, 1.97]]:
+                result = market.update(odds)
+                expected = implied_prob(odds, category="dec", method=method)
+                npt.assert_almost_equal(result["implied_prob"], expected["implied_prob"])
+                if key is not None:
+                    npt.assert_almost_equal(result[key], expected[key])
+
+    def test_live_market_shin(self):
+        market = LiveMarket(self.odds, category="dec", method="shin")
+        npt.assert_almost_equal(market.result["z_value"], 0.01060806)
+
+        # the js z value is the root of its fixed point equation, which uniroot solves too
+        for price in [4.25, 4.3]:
+            result = market.update_price(0, price)
+            odds = [price, 3.7, 1.95]
+            expected = implied_prob(odds, category="dec", method="shin", shin_method="uniroot")
+            npt.assert_almost_equal(result["implied_prob"], expected["implied_prob"])
+            npt.assert_almost_equal(result["z_value"], expected["z_value"])
+            cold = LiveMarket(odds, category="dec", method="shin").result
+            npt.assert_almost_equal(result["implied_prob"], cold["implied_prob"])
+            npt.assert_almost_equal(
+                result["implied_prob"], implied_prob(odds, category="dec", method="shin")["implied_prob"], 4
+            )
+
+        market = LiveMarket(self.odds, category="dec", method="shin", shin_method="uniroot")
+        result = market.update_price(2, 2.0)
+        expected = implied_prob([4.2, 3.7, 2.0], category="dec", method="shin", shin_method="uniroot")
+        npt.assert_almost_equal(result["z_value"], expected["z_value"])
+
+    def test_live_market_skips_unchanged_prices(self):
+        market = LiveMarket([-110, -110], method="power")
+        market.update([-110, -110])
+        market.update_price(1, -110)
+        self.assertEqual(market.solves, 1)
+        self.assertEqual(market.skips, 2)
+
+        result = market.result
+        result["implied_prob"][0] = 0
+        self.assertNotEqual(market.result["implied_prob"][0], 0)
+
+    def test_live_market_warm_start(self):
+        market = LiveMarket([-150, 130], method="odds_ratio")
+        cold = market.iterations
+        market.update_price(0, -152)
+        self.assertLessEqual(market.iterations, cold)
+
+    def test_live_market_assertion_error(self):
+        with self.assertRaises(AssertionError):
+            LiveMarket([-110, -110], method="naive")
+
+        market = LiveMarket([-110, -110], method="power")
+        with self.assertRaises(AssertionError):
+            market.update([-110, -110, 200])
+
+
+if __name__ == "__main__":
+    unittest.main()
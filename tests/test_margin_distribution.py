@@ -0,0 +1,67 @@
+import unittest
+import numpy as np
+import numpy.testing as npt
+from pybettor.bet_prob import bet_prob
+from pybettor.bet_prob_batch import bet_prob_batch
+from pybettor.margin_distribution import MarginDistribution
+
+
+class TestMarginDistribution(unittest.TestCase):
+    def test_normal_matches_bet_prob(self):
+        distribution = MarginDistribution.from_normal(sport="NFL")
+        for pred_spread, spread in [(-9, -3.5), (-7, -3), (3.5, 7), (0, 0), (-14, 3)]:
+            result = distribution.bet_prob(pred_spread, spread)
+            expected = bet_prob(pred_spread, spread, "NFL")
+            for key in ["win_prob", "lose_prob", "push_prob"]:
+                self.assertEqual(result[key], expected[key])
+
+        # between the tables, the two nearest ones are interpolated
+        for pred_spread in [-6.8, 2.1, -0.25]:
+            result = distribution.bet_prob(pred_spread, -3)
+            expected = bet_prob(pred_spread, -3, "NFL")
+            for key in ["win_prob", "lose_prob", "push_prob"]:
+                npt.assert_almost_equal(result[key], expected[key], 4)
+
+    def test_empirical_margins(self):
+        margins = np.array([3, 3, 7, -3, 1, 10, 3, -7, 0, 14])
+        distribution = MarginDistribution.from_margins(margins)
+
+        result = distribution.bet_prob(-3.0, -3)
+        npt.assert_almost_equal(result["win_prob"], np.mean(margins > 3))
+        npt.assert_almost_equal(result["push_prob"], np.mean(margins == 3))
+        npt.assert_almost_equal(result["lose_prob"], np.mean(margins < 3))
+
+        result = distribution.bet_prob(-3.0, np.array([-2.5, 20, -20]))
+        npt.assert_almost_equal(result["win_prob"], [np.mean(margins > 2.5), 1, 0])
+        npt.assert_almost_equal(result["push_prob"], [0, 0, 0])
+
+    def test_spread_buckets(self):
+        margins = [7, 10, 3, -3, 1]
+        spreads = [-7, -6.5, -3, 3, 2.5]
+        distribution = MarginDistribution.from_margins(margins, spreads, edges=[-5, 0])
+        result = distribution.bet_prob(np.array([-6, -2, 2]), np.array([-7, -3, 2.5]))
+        npt.assert_almost_equal(result["win_prob"], [0.5, 0, 0.5])
+        npt.assert_almost_equal(result["push_prob"], [0.5, 1, 0])
+
+    def test_bet_prob_distribution(self):
+        distribution = MarginDistribution.from_margins([3, 3, 7, -3])
+        self.assertEqual(bet_prob(-3, -3, distribution=distribution), distribution.bet_prob(-3, -3))
+        # the distribution takes the place of sport
+        self.assertEqual(bet_prob(-3, -3, "NHL", distribution=distribution), distribution.bet_prob(-3, -3))
+        result = bet_prob_batch([-3, -3], [-3, -2.5], distribution=distribution)
+        npt.assert_almost_equal(result["push_prob"], [0.5, 0])
+        npt.assert_almost_equal(result["win_prob"], [0.25, 0.75])
+
+    def test_invalid_input(self):
+        self.assertRaises(AssertionError, MarginDistribution.from_margins, [3.5, 7])
+        self.assertRaises(AssertionError, MarginDistribution.from_margins, [3, 7], [-3, 3], [-5, 0])
+        self.assertRaises(AssertionError, MarginDistribution, [[0.5, 0.2]], 0)
+        self.assertRaises(AssertionError, MarginDistribution.from_normal, sport="MLB")
+        distribution = MarginDistribution.from_normal(sport="NFL")
+        self.assertRaises(AssertionError, distribution.bet_prob, -3.0, np.nan)
+        self.assertRaises(AssertionError, distribution.bet_prob, np.array([-3.0, np.nan]), -3)
+        self.assertRaises(AssertionError, bet_prob, -3.0, np.nan, distribution=distribution)
+
+
+if __name__ == "__main__":
+    unittest.main()
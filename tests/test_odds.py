@@ -0,0 +1,47 @@
+import unittest
+from fractions import Fraction
+import numpy as np
+import numpy.testing as npt
+from pybettor.odds import Odds, _profit
+
+
+class TestOdds(unittest.TestCase):
+    def test_odds_from_value(self):
+        odds = Odds.from_value(-115)
+        self.assertEqual(odds.exact, Fraction(43, 23))
+        npt.assert_almost_equal(odds.profit, 20 / 23)
+        self.assertEqual(odds.american, -115)
+        self.assertEqual(odds.fraction(), "20/23")
+
+        # exact odds keep denominators above 100
+        odds = Odds.from_value(-333)
+        self.assertEqual(odds.exact - 1, Fraction(100, 333))
+        self.assertEqual(odds.fraction(), "3/10")
+
+        odds = Odds.from_value(1.87, "dec")
+        self.assertIsNone(odds.exact)
+        npt.assert_almost_equal(odds.prob, 1 / 1.87)
+        self.assertEqual(odds, Odds(1.87))
+
+        self.assertEqual(Odds.from_value(5, "frac").decimal, 6.0)
+        self.assertEqual(Odds.from_value(0.5, "prob").american, 100)
+
+        with self.assertRaises(AttributeError):
+            odds.other = 1
+
+    def test_odds_assertions(self):
+        with self.assertRaises(AssertionError):
+            Odds.from_value("-110")
+        with self.assertRaises(AssertionError):
+            Odds.from_value(50)
+        with self.assertRaises(AssertionError):
+            Odds.from_value(1.5, "prob")
+
+    def test_profit_matches_odds(self):
+        odds = np.array([-333, -115, 100, 150, 2500])
+        npt.assert_array_equal(_profit(odds, "us"), [Odds.from_value(int(x)).profit for x in odds])
+        npt.assert_array_equal(_profit(np.array([1.5, 2.75]), "dec"), [0.5, 1.75])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,43 @@
+import unittest
+import numpy as np
+import numpy.testing as npt
+from pybettor.convert_odds import convert_odds
+from pybettor.implied_prob import implied_prob
+from pybettor.implied_prob_batch import implied_prob_batch
+from pybettor.odds_table import disable_odds_table, enable_odds_table
+
+
+class TestOddsTable(unittest.TestCase):
+    def tearDown(self):
+        disable_odds_table()
+
+    def test_odds_table_matches_computed(self):
+        # the last two prices fall outside of the table and are computed
+        odds = np.array([-115, -105, 100, 120, -100, 2500, -1000, -3500, 4200])
+        expected = {
+            category: convert_odds(odds, "us", category) for category in ("dec", "frac", "prob")
+        }
+
+        enable_odds_table(max_odds=3000)
+        for category in ("dec", "frac", "prob"):
+            npt.assert_array_equal(convert_odds(odds, "us", category), expected[category])
+
+    def test_odds_table_implied_prob(self):
+        odds = [-115, -105, 120]
+        expected = implied_prob(odds, method="shin")
+        batch_expected = implied_prob_batch(np.array([odds]), method="power")
+
+        enable_odds_table()
+        self.assertEqual(implied_prob(odds, method="shin"), expected)
+        result = implied_prob_batch(np.array([odds]), method="power")
+        npt.assert_array_equal(result["implied_prob"], batch_expected["implied_prob"])
+
+    def test_odds_table_assertions(self):
+        with self.assertRaises(AssertionError):
+            enable_odds_table(max_odds=50)
+        with self.assertRaises(AssertionError):
+            enable_odds_table(max_odds=1000.0)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,41 @@
+import unittest
+import numpy as np
+import numpy.testing as npt
+from scipy import stats
+from pybettor.implied_odds import implied_odds
+from pybettor.over_under import over_under_prob
+
+
+class TestOverUnder(unittest.TestCase):
+    def test_poisson(self):
+        result = over_under_prob(2.7, [2.5, 3])
+        npt.assert_almost_equal(result["over_prob"], 1 - stats.poisson.cdf([2, 3], 2.7))
+        npt.assert_almost_equal(result["under_prob"], stats.poisson.cdf([2, 2], 2.7))
+        npt.assert_almost_equal(result["push_prob"], [0, stats.poisson.pmf(3, 2.7)])
+        self.assertEqual(result["over_fair_odds"][0], implied_odds(result["over_prob"][0], "us")[0])
+
+    def test_negative_binomial(self):
+        result = over_under_prob([6.1, 6.1], [6, 6.5], dispersion=[8, np.inf])
+        p = 8 / (8 + 6.1)
+        npt.assert_almost_equal(result["under_prob"][0], stats.nbinom.cdf(5, 8, p))
+        npt.assert_almost_equal(result["push_prob"][0], stats.nbinom.pmf(6, 8, p))
+        npt.assert_almost_equal(result["over_prob"][1], 1 - stats.poisson.cdf(6, 6.1))
+
+    def test_fair_odds(self):
+        result = over_under_prob(np.array([1.5, 4.0]), 0.5, category="dec")
+        npt.assert_almost_equal(result["over_fair_odds"], 1 / result["over_prob"], 2)
+        npt.assert_almost_equal(result["under_prob"], stats.poisson.pmf(0, [1.5, 4.0]))
+
+        result = over_under_prob(2.0, -0.5)
+        npt.assert_almost_equal(result["over_prob"], [1])
+        self.assertTrue(np.isnan(result["over_fair_odds"][0]))
+
+    def test_invalid_input(self):
+        self.assertRaises(AssertionError, over_under_prob, 0, 2.5)
+        self.assertRaises(AssertionError, over_under_prob, 2, "2.5")
+        self.assertRaises(AssertionError, over_under_prob, 2, 2.5, dispersion=0)
+        self.assertRaises(AssertionError, over_under_prob, 2, 2.5, category="frac")
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,63 @@
+import unittest
+import numpy as np
+import numpy.testing as npt
+from pybettor.break_even import break_even
+from pybettor.convert_odds import convert_odds
+from pybettor.expected_value_calc import expected_value_calc
+from pybettor.implied_odds import implied_odds
+from pybettor.implied_prob import implied_prob
+from pybettor.parlay_calc import parlay_calc
+from pybettor.parlay_ev import parlay_ev
+
+
+class TestParlayEV(unittest.TestCase):
+    def test_parlays_match_single_calculations(self):
+        markets = np.array([[-110, -110], [-150, 130], [200, -240]])
+        parlays = [[(0, 0), (1, 1)], [(1, 0), (2, 0), (0, 1)], [(2, 1)]]
+        result = parlay_ev(markets, parlays)
+
+        true_prob = [implied_prob(list(market), method="basic")["implied_prob"] for market in markets]
+        for i, parlay in enumerate(parlays):
+            prob = np.prod([true_prob[market][outcome] for market, outcome in parlay])
+            odds = [markets[market][outcome] for market, outcome in parlay]
+            payout = parlay_calc(100, odds)
+            npt.assert_almost_equal(result["true_prob"][i], prob)
+            npt.assert_almost_equal(result["payout"][i], payout)
+            npt.assert_almost_equal(result["ev"][i], expected_value_calc(prob, (payout + 100) / 100, "dec"))
+            npt.assert_almost_equal(result["break_even"][i], break_even(100, payout + 100))
+
+        self.assertEqual(result["fair_odds"][2], implied_odds(true_prob[2][1], "us")[0])
+
+    def test_offsets_and_array_parlays(self):
+        markets = np.array([-110, -110, 120, 180, 240, -110, -110])
+        offsets = np.array([0, 2, 5, 7])
+        parlays = np.array([[[0, 0], [1, 2]], [[2, 1], [1, 0]]])
+        result = parlay_ev(markets, parlays, method="power", offsets=offsets)
+
+        power = implied_prob([120, 180, 240], method="power")["implied_prob"]
+        npt.assert_almost_equal(result["true_prob"], [0.5 * power[2], 0.5 * power[0]])
+
+    def test_decimal_odds(self):
+        result = parlay_ev([[1.9, 1.9], [1.9, 1.9]], [[(0, 0), (1, 0)]], category="dec")
+        npt.assert_almost_equal(result["fair_odds"], [4])
+        npt.assert_almost_equal(result["dec_odds"], [3.61])
+
+    def test_fractional_odds(self):
+        result = parlay_ev([[10 / 11, 10 / 11], [6 / 5, 5 / 6]], [[(0, 0), (1, 1)], [(0, 1)]], category="frac")
+        self.assertEqual(result["fair_odds"][1], "1/1")
+        self.assertEqual(result["fair_odds"].tolist(), list(convert_odds(result["true_prob"], "prob", "frac")))
+
+    def test_invalid_input(self):
+        self.assertRaises(AssertionError, parlay_ev, [[-110, -110]], [[(1, 0)]])
+        self.assertRaises(AssertionError, parlay_ev, [[-110, -110]], [[(0, 2)]])
+        self.assertRaises(AssertionError, parlay_ev, [[-110, -110]], [[(0, 0)]], method="naive")
+        self.assertRaises(AssertionError, parlay_ev, [[-110, -110]], [[]])
+        self.assertRaises(AssertionError, parlay_ev, [[-110, -110]], [[(0, 0), (0, 1)]])
+        self.assertRaises(AssertionError, parlay_ev, np.array([[-110, -110]]), np.array([[[0, 0], [0, 1]]]))
+        # a real 0 is not taken for padding
+        self.assertRaises(AssertionError, parlay_ev, [[0, -110]], [[(0, 0)]])
+        self.assertRaises(AssertionError, parlay_ev, [0, -110, -110, -110], [[(0, 0)]], offsets=[0, 2, 4])
+
+
+if __name__ == "__main__":
+    unittest.main()
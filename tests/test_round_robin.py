@@ -0,0 +1,57 @@
+import itertools
+import unittest
+import numpy as np
+import numpy.testing as npt
+from pybettor.parlay_calc import parlay_calc
+from pybettor.round_robin import round_robin, round_robin_parlays
+
+
+class TestRoundRobin(unittest.TestCase):
+    def test_parlays_match_parlay_calc(self):
+        odds = [-110, 150, -250, 320, -105]
+        blocks = list(round_robin_parlays(75, odds, sizes=[2, 3], block_size=4))
+        legs = np.concatenate([block["legs"][:, :2] for block in blocks if block["legs"].shape[1] == 2])
+        npt.assert_array_equal(legs, list(itertools.combinations(range(5), 2)))
+
+        n_parlays = 0
+        for block in blocks:
+            self.assertLessEqual(len(block["payout"]), 4)
+            for parlay_legs, payout in zip(block["legs"], block["payout"]):
+                self.assertEqual(payout, parlay_calc(75, [odds[i] for i in parlay_legs]))
+            n_parlays += len(block["payout"])
+        self.assertEqual(n_parlays, 20)
+
+    def test_totals(self):
+        odds = np.array([2.1, 1.9, 3.5, 1.5])
+        result = round_robin(10, odds, sizes=[2, 3], category="dec")
+        self.assertEqual(result["n_parlays"], 10)
+        self.assertEqual(result["total_risk"], 100)
+        self.assertEqual(result["outcomes"].shape, (16, 4))
+
+        for wins, payout in zip(result["outcomes"], result["payout"]):
+            returns = sum(
+                10 * np.prod(odds[list(legs)])
+                for k in [2, 3]
+                for legs in itertools.combinations(range(4), k)
+                if np.all(wins[list(legs)])
+            )
+            npt.assert_almost_equal(payout, returns - 100)
+        npt.assert_almost_equal(result["max_payout"], result["payout"][-1])
+
+    def test_given_outcomes(self):
+        result = round_robin(100, [-110] * 20, sizes=3, outcomes=[[1] * 20, [1] * 3 + [0] * 17])
+        self.assertEqual(result["n_parlays"], 1140)
+        npt.assert_almost_equal(result["payout"][1], 100 * 1.9091**3 - 114000)
+
+        result = round_robin(100, [-110] * 20, sizes=3)
+        self.assertIsNone(result["payout"])
+
+    def test_invalid_input(self):
+        self.assertRaises(AssertionError, round_robin, 100, [-110, 120], sizes=3)
+        self.assertRaises(AssertionError, round_robin, 100, [-110, "120"])
+        self.assertRaises(AssertionError, round_robin, 100, [-110, 120], outcomes=[[1, 0, 1]])
+        self.assertRaises(AssertionError, next, round_robin_parlays(100, [-110, 120], sizes=0))
+
+
+if __name__ == "__main__":
+    unittest.main()
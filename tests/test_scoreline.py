@@ -0,0 +1,54 @@
+import unittest
+import numpy as np
+import numpy.testing as npt
+from scipy import stats
+from pybettor.implied_odds import implied_odds
+from pybettor.scoreline import scoreline_matrix, soccer_markets
+
+
+class TestScoreline(unittest.TestCase):
+    def test_poisson_matrix(self):
+        matrix = scoreline_matrix(1.6, 1.1, max_goals=20)
+        expected = np.outer(stats.poisson.pmf(np.arange(21), 1.6), stats.poisson.pmf(np.arange(21), 1.1))
+        npt.assert_almost_equal(matrix, expected)
+        npt.assert_almost_equal(matrix.sum(), 1)
+        self.assertIs(scoreline_matrix(1.6, 1.1, max_goals=20), matrix)
+        self.assertFalse(matrix.flags.writeable)
+
+    def test_dixon_coles(self):
+        poisson = scoreline_matrix(1.4, 1.2)
+        matrix = scoreline_matrix(1.4, 1.2, rho=-0.1)
+        npt.assert_almost_equal(matrix.sum(), 1)
+        self.assertGreater(matrix[0, 0], poisson[0, 0])
+        self.assertGreater(matrix[1, 1], poisson[1, 1])
+        self.assertLess(matrix[1, 0], poisson[1, 0])
+
+    def test_markets(self):
+        result = soccer_markets([1.6, 1.1], [1.1, 1.3], rho=-0.05, total_lines=[2, 2.5], handicap_lines=[-1, 0.5])
+        matrix = result["correct_score"][0]
+        home_goals, away_goals = np.indices(matrix.shape)
+
+        npt.assert_almost_equal(result["home_prob"][0], matrix[home_goals > away_goals].sum())
+        npt.assert_almost_equal(result["home_prob"] + result["draw_prob"] + result["away_prob"], [1, 1])
+        npt.assert_almost_equal(result["over_prob"][0], [(matrix[home_goals + away_goals > 2]).sum()] * 2)
+        npt.assert_almost_equal(result["total_push_prob"][0], [matrix[home_goals + away_goals == 2].sum(), 0])
+        npt.assert_almost_equal(result["btts_yes_prob"][0], matrix[1:, 1:].sum())
+        npt.assert_almost_equal(result["handicap_home_prob"][0, 0], matrix[home_goals - away_goals > 1].sum())
+        npt.assert_almost_equal(result["handicap_push_prob"][0, 0], matrix[home_goals - away_goals == 1].sum())
+        npt.assert_almost_equal(result["handicap_away_prob"][0, 1], result["away_prob"][0])
+
+    def test_odds(self):
+        result = soccer_markets(1.6, 1.1, margin=0.05, category="dec")
+        probs = [result[key][0] for key in ["home_prob", "draw_prob", "away_prob"]]
+        odds = implied_odds(probs, category="dec", method="basic", margin=0.05)
+        npt.assert_almost_equal([result[key][0] for key in ["home_odds", "draw_odds", "away_odds"]], odds)
+
+    def test_invalid_input(self):
+        self.assertRaises(AssertionError, scoreline_matrix, 0, 1.2)
+        self.assertRaises(AssertionError, scoreline_matrix, 1.4, 1.2, rho=2)
+        self.assertRaises(AssertionError, soccer_markets, 1.4, 1.2, handicap_lines=[-0.25])
+        self.assertRaises(AssertionError, soccer_markets, 1.4, 1.2, category="frac")
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,42 @@
+import unittest
+import numpy as np
+import numpy.testing as npt
+from scipy import stats
+from pybettor.sgp_prob import sgp_prob
+
+
+class TestSGPProb(unittest.TestCase):
+    def test_two_correlated_legs(self):
+        win_prob = [0.6, 0.55]
+        result = sgp_prob(win_prob, 0.4, n_samples=400000, seed=0)
+        expected = stats.multivariate_normal([0, 0], [[1, 0.4], [0.4, 1]]).cdf(stats.norm.ppf(win_prob))
+        self.assertLess(abs(result["prob"][0] - expected), 4 * result["std_error"][0])
+        npt.assert_almost_equal(result["independent_prob"], [0.33])
+        self.assertEqual(result["n_samples"], 400000)
+
+    def test_independent_legs(self):
+        result = sgp_prob([0.5, 0.5, 0.5], np.eye(3), parlays=[[0, 1], [0, 1, 2], [2]], n_samples=200000, seed=1)
+        npt.assert_allclose(result["prob"], [0.25, 0.125, 0.5], atol=4 * result["std_error"].max())
+        npt.assert_almost_equal(result["independent_prob"], [0.25, 0.125, 0.5])
+
+    def test_common_random_numbers(self):
+        result = sgp_prob([0.6, 0.5, 0.4], 0.3, parlays=[[0, 1], [0, 1, 2]], n_samples=10000, seed=2)
+        self.assertGreaterEqual(result["prob"][0], result["prob"][1])
+        again = sgp_prob([0.6, 0.5, 0.4], 0.3, parlays=[[0, 1], [0, 1, 2]], n_samples=10000, seed=2)
+        npt.assert_array_equal(result["prob"], again["prob"])
+
+    def test_early_stopping(self):
+        result = sgp_prob([0.6, 0.55], 0.4, tol=0.002, block_size=10000, seed=0)
+        self.assertTrue(result["converged"])
+        self.assertLess(result["n_samples"], 1000000)
+        self.assertLessEqual(result["std_error"][0], 0.002)
+
+    def test_invalid_input(self):
+        self.assertRaises(AssertionError, sgp_prob, [0.6, 1.2], 0.3)
+        self.assertRaises(AssertionError, sgp_prob, [0.6, 0.5], [[1, 0.3], [0.2, 1]])
+        self.assertRaises(AssertionError, sgp_prob, [0.6, 0.5, 0.4], -0.9)
+        self.assertRaises(AssertionError, sgp_prob, [0.6, 0.5], 0.3, parlays=[[0, 2]])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,55 @@
+import unittest
+import numpy as np
+import numpy.testing as npt
+from pybettor.kelly import kelly
+from pybettor.simulate_bankroll import simulate_bankroll
+
+
+class TestSimulateBankroll(unittest.TestCase):
+    def test_single_bet(self):
+        result = simulate_bankroll([0.6], [100], n_paths=20000, seed=0)
+        fraction = kelly(0.6, 100)
+        npt.assert_allclose(np.unique(result["terminal_wealth"]), [10000 * (1 - fraction), 10000 * (1 + fraction)])
+        npt.assert_almost_equal(np.mean(result["terminal_wealth"] > 10000), 0.6, 2)
+        npt.assert_allclose(np.unique(result["max_drawdown"]), [0, fraction])
+
+    def test_seeded_reproducibility(self):
+        rng = np.random.default_rng(1)
+        win_prob = rng.uniform(0.5, 0.6, 50)
+        first = simulate_bankroll(win_prob, np.full(50, -110), n_paths=5000, seed=3)
+        second = simulate_bankroll(win_prob, np.full(50, -110), n_paths=5000, seed=3, processes=2)
+        npt.assert_array_equal(first["terminal_wealth"], second["terminal_wealth"])
+        npt.assert_array_equal(first["max_drawdown"], second["max_drawdown"])
+        self.assertEqual(len(first["terminal_wealth"]), 5000)
+
+    def test_kelly_factor_reduces_risk(self):
+        win_prob = np.full(200, 0.56)
+        full = simulate_bankroll(win_prob, np.full(200, -110), n_paths=5000, ruin_level=0.5, seed=0)
+        half = simulate_bankroll(win_prob, np.full(200, -110), kelly_factor=2, n_paths=5000, ruin_level=0.5, seed=0)
+        self.assertGreater(full["risk_of_ruin"], half["risk_of_ruin"])
+        self.assertGreater(full["median_max_drawdown"], half["median_max_drawdown"])
+
+    def test_ruined_paths_stop_betting(self):
+        result = simulate_bankroll(
+            np.full(100, 0.55), np.full(100, 100), stake="kelly_bet", bankroll=500, unit_size=100, n_paths=2000, seed=0
+        )
+        ruined = result["terminal_wealth"] == 0
+        self.assertGreater(result["risk_of_ruin"], 0)
+        npt.assert_almost_equal(result["risk_of_ruin"], np.mean(ruined))
+        npt.assert_array_equal(result["max_drawdown"][ruined], 1)
+
+    def test_true_prob_without_edge(self):
+        result = simulate_bankroll(
+            np.full(100, 0.6), np.full(100, 100), true_prob=0.5, n_paths=5000, seed=0
+        )
+        self.assertLess(result["median_terminal_wealth"], 10000)
+
+    def test_invalid_input(self):
+        self.assertRaises(AssertionError, simulate_bankroll, [0.6], [50])
+        self.assertRaises(AssertionError, simulate_bankroll, [0.6], [100], stake="flat")
+        self.assertRaises(AssertionError, simulate_bankroll, [0.6], [100], ruin_level=1)
+        self.assertRaises(AssertionError, simulate_bankroll, [0.6], [100], true_prob=[1.5])
+
+
+if __name__ == "__main__":
+    unittest.main()
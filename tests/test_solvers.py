@@ -0,0 +1,33 @@
+import unittest
+import numpy as np
+import numpy.testing as npt
+from pybettor._solvers import _check_bracketed, _newton_bracketed
+
+
+class TestSolvers(unittest.TestCase):
+    def test_newton_bracketed(self):
+        targets = np.array([2.0, 9.0, 0.25])
+
+        def func(xx, rows):
+            return xx**2 - targets[rows], 2 * xx, np.full(len(xx), 2.0)
+
+        root, iterations, converged = _newton_bracketed(func, np.zeros(3), 10.0)
+        npt.assert_almost_equal(root, np.sqrt(targets), 12)
+        npt.assert_array_equal(converged, [True, True, True])
+        self.assertTrue(np.all(iterations < 20))
+
+    def test_newton_bracketed_no_sign_change(self):
+        def func(xx, rows):
+            return xx**2 + 1, 2 * xx, None
+
+        root, _, converged = _newton_bracketed(func, np.array([-1.0, 0.5]), 2.0)
+        self.assertTrue(np.all(np.isnan(root)))
+        self.assertFalse(np.any(converged))
+        self.assertRaises(ValueError, _check_bracketed, root)
+        self.assertRaises(ValueError, _check_bracketed, float(root[0]))
+        _check_bracketed(np.array([1.5]))
+        _check_bracketed(1.5)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,47 @@
+import unittest
+import numpy as np
+import numpy.testing as npt
+from pybettor.bet_prob import bet_prob
+from pybettor.implied_odds import implied_odds
+from pybettor.implied_prob import implied_prob
+from pybettor.spread_moneyline import moneyline_to_spread, spread_to_moneyline
+
+
+class TestSpreadMoneyline(unittest.TestCase):
+    def test_spread_to_moneyline(self):
+        result = spread_to_moneyline(np.array([-7, 3.5, 0]), sport="NFL")
+        for i, spread in enumerate([-7, 3.5]):
+            probs = bet_prob(spread, 0, "NFL")
+            win_prob = probs["win_prob"] / (probs["win_prob"] + probs["lose_prob"])
+            npt.assert_almost_equal(result["win_prob"][i], win_prob)
+            self.assertEqual(result["fair_odds"][i], implied_odds(win_prob, "us")[0])
+        self.assertEqual(result["win_prob"][2], 0.5)
+
+    def test_moneyline_to_spread(self):
+        result = moneyline_to_spread([[-300, 250], [-110, -110]], sport="NFL")
+        npt.assert_almost_equal(result["win_prob"][0], implied_prob([-300, 250], method="basic")["implied_prob"][0])
+        npt.assert_almost_equal(result["spread"][1], 0)
+        self.assertLess(result["spread"][0], -7)
+
+    def test_undevigged_markets(self):
+        # the power method has no solution for a market without a margin
+        with self.assertWarns(UserWarning):
+            result = moneyline_to_spread([[150, 150], [-110, -110]], method="power", sport="NFL")
+        npt.assert_almost_equal(result["win_prob"], [np.nan, 0.5])
+        npt.assert_almost_equal(result["spread"], [np.nan, 0])
+
+    def test_round_trip(self):
+        spread = np.arange(-20, 20.5, 0.5)
+        win_prob = spread_to_moneyline(spread, sd=13)["win_prob"]
+        result = moneyline_to_spread(np.column_stack([1 / win_prob, 1 / (1 - win_prob)]), category="dec", sd=13)
+        npt.assert_almost_equal(result["spread"], spread, 10)
+
+    def test_invalid_input(self):
+        self.assertRaises(AssertionError, spread_to_moneyline, ["-7"])
+        self.assertRaises(AssertionError, spread_to_moneyline, -7, sport="MLB")
+        self.assertRaises(AssertionError, moneyline_to_spread, [-150, 130, 300])
+        self.assertRaises(AssertionError, moneyline_to_spread, [[-150, 130]], method="naive")
+
+
+if __name__ == "__main__":
+    unittest.main()